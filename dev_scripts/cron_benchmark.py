@@ -0,0 +1,60 @@
+import datetime
+import logging
+import os
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(pathlib.Path(__file__).parent.parent))
+
+from jarvis.modules.crontab.expression import CronExpression  # noqa: E402
+
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+handler.setFormatter(
+    fmt=logging.Formatter(
+        datefmt="%b-%d-%Y %I:%M:%S %p",
+        fmt="%(asctime)s - %(levelname)s - [%(module)s:%(lineno)d] - %(funcName)s - %(message)s",
+    )
+)
+logger.addHandler(handler)
+logger.setLevel(logging.DEBUG)
+
+FIELDS = ("*/15 * * * *", "0 9 * * 1-5", "30 2 1 * *", "0 0 L * *", "5 4 * * 0#2", "45 23 15W * *")
+
+
+def benchmark(jobs: int = 1_000, days: int = 1) -> None:
+    """Compares polling every job each minute with ``check_trigger``, against jumping to ``next_fire_time``.
+
+    Args:
+        jobs: Number of crontab entries to evaluate.
+        days: Number of days to simulate.
+    """
+    table = [CronExpression(f"{random.choice(FIELDS)} echo {index}") for index in range(jobs)]
+    start = datetime.datetime(2024, 1, 1)
+    minutes = [start + datetime.timedelta(minutes=minute) for minute in range(days * 1_440)]
+
+    timer = time.perf_counter()
+    polled = sum(
+        job.check_trigger((now.year, now.month, now.day, now.hour, now.minute)) for now in minutes for job in table
+    )
+    polling = time.perf_counter() - timer
+
+    timer = time.perf_counter()
+    scheduled, end = 0, minutes[-1]
+    for job in table:
+        fire_time = job.next_fire_time(start - datetime.timedelta(minutes=1))
+        while fire_time and fire_time <= end:
+            scheduled += 1
+            fire_time = job.next_fire_time(fire_time)
+    jumping = time.perf_counter() - timer
+
+    if polled != scheduled:
+        logger.error("check_trigger fired %d times, but next_fire_time scheduled %d", polled, scheduled)
+    logger.info("check_trigger: %.2fs for %s checks", polling, f"{len(minutes) * jobs:,}")
+    logger.info("next_fire_time: %.2fs for %s fire times (%.1fx)", jumping, f"{scheduled:,}", polling / jumping)
+
+
+if __name__ == "__main__":
+    benchmark()
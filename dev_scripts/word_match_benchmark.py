@@ -0,0 +1,64 @@
+import logging
+import os
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(pathlib.Path(__file__).parent.parent))
+
+from jarvis.executors import word_match  # noqa: E402
+
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+handler.setFormatter(
+    fmt=logging.Formatter(
+        datefmt="%b-%d-%Y %I:%M:%S %p",
+        fmt="%(asctime)s - %(levelname)s - [%(module)s:%(lineno)d] - %(funcName)s - %(message)s",
+    )
+)
+logger.addHandler(handler)
+logger.setLevel(logging.DEBUG)
+
+PHRASES = ("what is the weather like in new york", "turn on the kitchen lights", "set an alarm for 7 am tomorrow")
+
+
+def uncached(phrase: str, match_list: list) -> str | None:
+    """Keyword classifier that pre-processes the match list on every call, like the version without the cache.
+
+    Args:
+        phrase: Takes the phrase spoken as an argument.
+        match_list: List of words against which the phrase has to be checked.
+
+    Returns:
+        str:
+        Returns the word that was matched.
+    """
+    lookup = phrase.lower()
+    words = {split for word in match_list for split in word.lower().split()}
+    if any(word in words for word in lookup.split()):
+        for word in match_list:
+            if word.lower() in lookup:
+                return word
+    return None
+
+
+def benchmark(size: int = 200, number: int = 10_000) -> None:
+    """Compares the memoized keyword classifier against pre-processing the match list on every call.
+
+    Args:
+        size: Number of keywords in the match list.
+        number: Number of phrases to classify with each of them.
+    """
+    match_list = [f"keyword {index}" for index in range(size - 2)] + ["weather", "kitchen lights"]
+    for phrase in PHRASES:
+        if word_match.word_match(phrase, match_list) != uncached(phrase, match_list):
+            logger.error("Results differ for the phrase: %s", phrase)
+    cached = timeit.timeit(lambda: [word_match.word_match(phrase, match_list) for phrase in PHRASES], number=number)
+    baseline = timeit.timeit(lambda: [uncached(phrase, match_list) for phrase in PHRASES], number=number)
+    calls = f"{number * len(PHRASES):,}"
+    logger.info("uncached: %.3fs for %s calls against %d keywords", baseline, calls, size)
+    logger.info("word_match: %.3fs for %s calls against %d keywords (%.1fx)", cached, calls, size, baseline / cached)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -46,6 +46,7 @@ def commandline() -> None:
         "install": "Installs the main dependencies.",
         "dev-install": "Installs the dev dependencies.",
         "start | run": "Initiates Jarvis.",
+        "export-training-data": "Exports the unrecognized phrases to the training data YAML file.",
         "uninstall": "Uninstall the main dependencies",
         "dev-uninstall": "Uninstall the dev dependencies",
         "--version | -v": "Prints the version.",
@@ -77,6 +78,10 @@ def commandline() -> None:
             os.environ["debug"] = str(os.environ.get("JARVIS_VERBOSITY", "-1") == "1")
             init = __preflight_check__()
             init()
+        case "export-training-data":
+            from jarvis.modules.utils import journal
+
+            journal.export()
         case "version" | "-v" | "--version":
             print(f"Jarvis {version}")
         case "help" | "-h" | "--help":
@@ -1,17 +1,16 @@
-import time
 import traceback
 from datetime import datetime
 from multiprocessing import Process
 from threading import Thread
-from typing import Dict, List
 
 import requests
 
+from jarvis.api.background_task import cron, offload
 from jarvis.executors import (
     alarm,
+    alerts,
     background_task,
     crontab,
-    files,
     offline,
     remind,
     resource_tracker,
@@ -27,7 +26,8 @@ async def init_meetings() -> None:
     """Initializes the meetings sync interval based on the availability of the ICS URL."""
     if models.env.ics_url:
         try:
-            if requests.get(url=models.env.ics_url).status_code == 503:
+            response = await offload.pools["network"].run(requests.get, url=models.env.ics_url)
+            if response.status_code == 503:
                 # Set to 6 hours if unable to connect to the meetings URL
                 models.env.sync_meetings = 21_600
         except EgressErrors as error:
@@ -36,50 +36,36 @@ async def init_meetings() -> None:
             models.env.sync_meetings = None
 
 
-async def background_executor(tasks: List[classes.BackgroundTask], task_dict: Dict[int, float], now: datetime) -> None:
-    """Checks and triggers background tasks based on their defined intervals and ignore hours.
+async def background_executor(task: classes.BackgroundTask, now: datetime) -> None:
+    """Triggers a background task that is due based on its interval, honoring its ignore hours.
 
     Args:
-        tasks: List of BackgroundTask objects to be monitored.
-        task_dict: Dictionary to keep track of the last execution time of each task.
+        task: BackgroundTask object that is due.
         now: Datetime object representing the current time.
     """
-    for i, task in enumerate(tasks):
-        # Checks a particular tasks' elapsed time
-        if task_dict[i] + task.seconds <= time.time():
-            # Updates that particular tasks' start time
-            task_dict[i] = time.time()
-            if now.hour in task.ignore_hours:
-                logger.debug("'%s' skipped honoring ignore hours", task)
-            else:
-                logger.debug("Executing: '%s'", task.task)
-                try:
-                    response = offline.communicator(task.task, True) or "No response for background task"
-                    logger.debug("Response: '%s'", response)
-                except Exception as error:
-                    logger.error(error)
-                    logger.warning("Removing %s from background tasks.", task)
-                    background_task.remove_corrupted(task=task)
-
-
-async def crontab_executor(cron_jobs: List[crontab.expression.CronExpression]) -> None:
-    """Checks and triggers cron jobs based on their defined schedules.
+    if now.hour in task.ignore_hours:
+        logger.debug("'%s' skipped honoring ignore hours", task)
+        return
+    logger.debug("Executing: '%s'", task.task)
+    try:
+        response = await offload.pools["commands"].run(offline.communicator, task.task, True)
+        logger.debug("Response: '%s'", response or "No response for background task")
+    except TimeoutError as error:
+        # A slow task is not corrupted, so it is retained for the next run
+        logger.error(error)
+    except Exception as error:
+        logger.error(error)
+        logger.warning("Removing %s from background tasks.", task)
+        background_task.remove_corrupted(task=task)
+
+
+async def crontab_executor(job: crontab.expression.CronExpression) -> None:
+    """Triggers a cron job that is due, based on its defined schedule.
 
     Args:
-        cron_jobs: List of CronExpression objects representing the cron jobs to be monitored.
+        job: CronExpression object representing the cron job to be executed.
     """
-    for job in cron_jobs:
-        if job.check_trigger():
-            logger.debug("Executing cron job: '%s'", job.comment)
-            cron_process = Process(target=crontab.executor, args=(job.comment,))
-            cron_process.start()
-            with models.db.connection as connection:
-                cursor = connection.cursor()
-                cursor.execute(
-                    "INSERT or REPLACE INTO children (crontab) VALUES (?);",
-                    (cron_process.pid,),
-                )
-                connection.commit()
+    await cron.runner.run(job)
 
 
 async def automation_executor(exec_task: str) -> None:
@@ -90,14 +76,14 @@ async def automation_executor(exec_task: str) -> None:
     """
     # Check and trigger weather alert monitoring system
     if "weather" in exec_task.lower():
-        # run as daemon and not store in children table as this won't take long
+        # run as daemon and not store in child processes' registry as this won't take long
         logger.debug("Initiating weather alert monitor")
         resource_tracker.semaphores(weather_monitor.monitor)
     else:
         logger.debug("Executing: '%s'", exec_task)
         try:
-            response = offline.communicator(command=exec_task) or "No response for automated task"
-            logger.debug("Response: '%s'", response)
+            response = await offload.pools["commands"].run(offline.communicator, command=exec_task)
+            logger.debug("Response: '%s'", response or "No response for automated task")
         except Exception as error:
             logger.error(error)
             logger.error(traceback.format_exc())
@@ -115,56 +101,34 @@ async def db_writer(picker: str) -> None:
         process_target = ics_meetings.meetings_writer
     process = Process(target=process_target)
     process.start()
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute(f"UPDATE children SET {picker}=null")
-        cursor.execute(
-            f"INSERT or REPLACE INTO children ({picker}) VALUES (?);",
-            (process.pid,),
-        )
-        connection.commit()
+    resource_tracker.register(pid=process.pid, category=picker, replace=True)
 
 
 async def alarm_executor(now: datetime) -> None:
-    """Checks and triggers alarms based on the current time and their defined repeat settings.
+    """Checks and triggers alarms that are due since the previous tick, based on their time and day.
 
     Args:
         now: Datetime object representing the current time.
     """
-    if alarms := files.get_alarms():
-        copied_alarms = alarms.copy()
-        for alarmer in alarms:
-            # alarms match 'time' and 'day' of alarm
-            if alarmer["alarm_time"] == now.strftime("%I:%M %p") and alarmer.get(
-                "day", now.strftime("%A")
-            ) == now.strftime("%A"):
-                logger.info("Executing alarm: %s", alarmer)
-                resource_tracker.semaphores(alarm.executor)
-                if not alarmer["repeat"]:
-                    copied_alarms.remove(alarmer)
-        if copied_alarms != alarms:
-            files.put_alarms(data=copied_alarms)
+    # alarms that are not repeated are removed by the lookup
+    for alarmer in await offload.pools["database"].run(alerts.due_alarms, now=now):
+        logger.info("Executing alarm: %s", alarmer)
+        resource_tracker.semaphores(alarm.executor)
 
 
 async def reminder_executor(now: datetime) -> None:
-    """Checks and triggers reminders based on the current time and their defined date.
+    """Checks and triggers reminders that are due since the previous tick, based on their time and date.
 
     Args:
         now: Datetime object representing the current time.
     """
-    if reminders := files.get_reminders():
-        copied_reminders = reminders.copy()
-        for reminder in reminders:
-            # reminders match the 'time' and 'date' of reminder
-            if reminder["reminder_time"] == now.strftime("%I:%M %p") and reminder["date"] == datetime.now().date():
-                logger.info("Executing reminder: %s", reminder)
-                Thread(
-                    target=remind.executor,
-                    kwargs={
-                        "message": reminder["message"],
-                        "contact": reminder["name"],
-                    },
-                ).start()
-                copied_reminders.remove(reminder)
-        if copied_reminders != reminders:
-            files.put_reminders(data=copied_reminders)
+    # reminders are removed by the lookup
+    for reminder in await offload.pools["database"].run(alerts.due_reminders, now=now):
+        logger.info("Executing reminder: %s", reminder)
+        Thread(
+            target=remind.executor,
+            kwargs={
+                "message": reminder["message"],
+                "contact": reminder["name"],
+            },
+        ).start()
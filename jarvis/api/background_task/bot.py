@@ -3,6 +3,7 @@ from dataclasses import dataclass
 
 import requests
 
+from jarvis.api.background_task import metrics, offload
 from jarvis.executors import communicator, telegram
 from jarvis.modules.exceptions import (
     BotInUse,
@@ -15,6 +16,7 @@ from jarvis.modules.telegram import bot, webhook
 
 MAX_FAILED_CONNECTIONS = 10
 EXPONENTIAL_BACKOFF_FACTOR = 3
+POLL_INTERVAL = 3
 
 
 @dataclass
@@ -58,7 +60,7 @@ async def restart_loop(after: int) -> None:
     telegram_beat.poll_for_messages = False
     # Sleep for the # of seconds after which the loop should be restarted
     await asyncio.sleep(after)
-    # Set restart loop to True, which will re-trigger init with 3s trials
+    # Set restart loop to True, which will re-trigger init in the poller
     telegram_beat.restart_loop = True
 
 
@@ -73,20 +75,36 @@ async def terminate(reason: str) -> None:
     telegram_beat.restart_loop = False
 
 
+def poll() -> None:
+    """Polls for new messages from the latest offset, and stores the offset for the next poll.
+
+    See Also:
+        - | Offset is read when the poll starts, so a poll that is queued behind a timed out poll does not
+          | re-process the same messages.
+    """
+    # ReadTimeout is just saying that there were no messages to read within the time specified
+    with metrics.collector.measure(name="telegram", ignore=(requests.exceptions.ReadTimeout,)):
+        offset = bot.poll_for_messages(telegram_beat.offset)
+    if offset is not None:
+        telegram_beat.offset = offset
+
+
 async def telegram_executor() -> None:
-    """Poll for new Telegram messages.
+    """Poll for new Telegram messages in the telegram pool, so that the event loop is not blocked.
 
     Handles:
         - BotWebhookConflict: Handles dead webhook connection and restarts loop.
         - BotInUse: Conflicting bot usage on webhook vs long polling.
         - BotTokenInvalid: Handles invalid auth token by terminating session.
+        - TimeoutError: Logs a warning, when the messages took longer than the timeout to process.
         - EgressErrors: Dynamically handles failed connections.
         - Exception: Broad exception handler to terminate loop for unknown errors.
     """
     try:
-        offset = bot.poll_for_messages(telegram_beat.offset)
-        if offset is not None:
-            telegram_beat.offset = offset
+        await offload.pools["telegram"].run(poll)
+    except TimeoutError as error:
+        # Poll is still running in the background, and the next poll waits for it to complete
+        logger.warning(error)
     except BotWebhookConflict as error:
         # At this point, its be safe to remove the dead webhook
         logger.error(error)
@@ -115,3 +133,20 @@ async def telegram_executor() -> None:
         logger.critical("ATTENTION: %s", error)
         communicator.notify(subject="JARVIS: Telegram", body=f"Telegram task failed due to {type(error).__name__}")
         await terminate(reason=type(error).__name__)
+
+
+async def poller() -> None:
+    """Initializes the telegram API, and polls for new messages until polling is terminated.
+
+    See Also:
+        - Returns when the bot is hosted via webhook, or when polling is terminated.
+    """
+    await init()
+    while telegram_beat.poll_for_messages or telegram_beat.restart_loop:
+        if telegram_beat.restart_loop:
+            # Avoid being called again when init is in progress
+            telegram_beat.restart_loop = False
+            await init()
+            continue
+        await telegram_executor()
+        await asyncio.sleep(POLL_INTERVAL)
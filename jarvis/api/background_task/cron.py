@@ -0,0 +1,145 @@
+# noinspection PyUnresolvedReferences
+"""Runner for the cron jobs, that supervises their subprocesses from the event loop.
+
+>>> Cron
+
+See Also:
+    - | Each cron job is executed as a shell subprocess directly from the event loop, without an intermediate
+      | python process, and its output is appended to the cron log file.
+    - Number of cron jobs running at the same time is limited, and the rest wait for a slot.
+    - A cron job that is still running (or waiting for a slot) is skipped when it is due again, instead of stacking.
+    - Start time, end time, exit code and the size of the output of each run are stored in the ``cron_runs`` table.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from jarvis.api.background_task import offload
+from jarvis.executors import crontab, resource_tracker
+from jarvis.modules.database import writer
+from jarvis.modules.logger import logger
+from jarvis.modules.models import enums, models
+
+MAX_CONCURRENCY = 4
+# Number of runs to retain in the history, across all the cron jobs
+HISTORY_SIZE = 1_000
+CHUNK_SIZE = 65_536
+
+
+def record(job: str, started_at: float, ended_at: float, exit_code: int | None, output_bytes: int) -> None:
+    """Stores a run in the history, and prunes the runs beyond the history size.
+
+    Args:
+        job: Cron job as a string.
+        started_at: Start time as epoch.
+        ended_at: End time as epoch.
+        exit_code: Exit code of the subprocess, ``None`` if it could not be started.
+        output_bytes: Number of bytes written to stdout and stderr.
+    """
+    writer.write(
+        (
+            "INSERT INTO cron_runs (job, started_at, ended_at, exit_code, output_bytes) VALUES (?,?,?,?,?);",
+            (job, started_at, ended_at, exit_code, output_bytes),
+        ),
+        ("DELETE FROM cron_runs WHERE rowid <= (SELECT MAX(rowid) FROM cron_runs) - ?;", (HISTORY_SIZE,)),
+    )
+
+
+def history(job: str = None, limit: int = 100) -> List[Tuple[str, float, float, int | None, int]]:
+    """Get the latest runs from the history.
+
+    Args:
+        job: Cron job as a string, defaults to all the cron jobs.
+        limit: Maximum number of runs to return.
+
+    Returns:
+        List[Tuple[str, float, float, int | None, int]]:
+        Returns a list of tuples with the job, start time, end time, exit code and output bytes, latest first.
+    """
+    query = "SELECT job, started_at, ended_at, exit_code, output_bytes FROM cron_runs"
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        if job:
+            return cursor.execute(f"{query} WHERE job=? ORDER BY started_at DESC LIMIT ?;", (job, limit)).fetchall()
+        return cursor.execute(f"{query} ORDER BY started_at DESC LIMIT ?;", (limit,)).fetchall()
+
+
+class CronRunner:
+    """Runs the cron jobs with a concurrency limit, and without overlapping runs of the same job.
+
+    >>> CronRunner
+
+    """
+
+    def __init__(self, max_concurrency: int):
+        """Instantiates the semaphore and the registry of running jobs.
+
+        Args:
+            max_concurrency: Maximum number of cron jobs to run at the same time.
+        """
+        self.semaphore = asyncio.Semaphore(value=max_concurrency)
+        # Process ID of each running job, or 0 if it is waiting for a slot
+        self.running: Dict[str, int] = {}
+
+    async def run(self, job: crontab.expression.CronExpression) -> None:
+        """Runs a cron job that is due, unless its previous run is still in progress.
+
+        Args:
+            job: CronExpression object of the cron job.
+        """
+        key = str(job)
+        if key in self.running:
+            logger.warning(
+                "Skipping cron job '%s', since the previous run is still in progress [%d]",
+                job.comment,
+                self.running[key],
+            )
+            return
+        self.running[key] = 0
+        try:
+            async with self.semaphore:
+                await self.execute(key, job.comment)
+        finally:
+            del self.running[key]
+
+    async def execute(self, key: str, statement: str) -> None:
+        """Executes the statement in a shell subprocess, and records the run.
+
+        Args:
+            key: Cron job as a string.
+            statement: Cron statement to be executed.
+        """
+        log_file = datetime.now().strftime(crontab.LOG_FILE)
+        env = {**os.environ, "PROCESS_NAME": enums.ProcessNames.crontab_executor.value}
+        started_at, exit_code, output_bytes = time.time(), None, 0
+        logger.debug("Executing cron job: '%s'", statement)
+        try:
+            process = await asyncio.create_subprocess_shell(
+                statement, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT, env=env
+            )
+        except OSError as error:
+            logger.error("Failed to execute cron job '%s': %s", statement, error)
+        else:
+            self.running[key] = process.pid
+            try:
+                await offload.pools["database"].run(resource_tracker.register, pid=process.pid, category="crontab")
+            except Exception as error:
+                logger.error(error)
+            with open(log_file, "ab") as file:
+                file.write(b"\n")
+                while chunk := await process.stdout.read(CHUNK_SIZE):
+                    output_bytes += len(chunk)
+                    file.write(chunk)
+            exit_code = await process.wait()
+        ended_at = time.time()
+        if exit_code:
+            logger.warning("Cron job '%s' exited with %s in %.2fs", statement, exit_code, ended_at - started_at)
+        else:
+            logger.debug("Cron job '%s' exited with %s in %.2fs", statement, exit_code, ended_at - started_at)
+        await offload.pools["database"].run(record, key, started_at, ended_at, exit_code, output_bytes)
+
+
+runner = CronRunner(max_concurrency=MAX_CONCURRENCY)
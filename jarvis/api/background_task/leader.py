@@ -0,0 +1,120 @@
+# noinspection PyUnresolvedReferences
+"""Lease based leader election, so that only one of the API workers runs the background tasks.
+
+>>> Leader
+
+See Also:
+    - | The lease is a row in the ``leader`` table with the holder and the expiry, which is acquired or renewed with a
+      | single conditional upsert through the base DB writer, so that only one worker can hold it at a time.
+    - The leader renews the lease with a heartbeat, and steps down as soon as a renewal fails.
+    - Lease is acquired and renewed in a dedicated pool, so that the heartbeat never waits behind the DB writes.
+    - | The lease is released when the leader is stopped, and expires when the leader dies, after which one of the
+      | other workers takes over within a heartbeat.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from typing import Any, Callable, Coroutine
+
+from jarvis.api.background_task import offload
+from jarvis.modules.database import writer
+from jarvis.modules.logger import logger
+
+LEASE_DURATION = 10
+HEARTBEAT_INTERVAL = 3
+
+
+class LeaderElection:
+    """Elects a single leader among the processes, to run a coroutine.
+
+    >>> LeaderElection
+
+    """
+
+    def __init__(self, name: str, lease_duration: int | float, heartbeat_interval: int | float):
+        """Instantiates the election with a unique token, that is combined with the process ID to identify the holder.
+
+        Args:
+            name: Name of the lease.
+            lease_duration: Duration in seconds for which the lease is valid, after it is acquired or renewed.
+            heartbeat_interval: Interval in seconds to acquire or renew the lease.
+        """
+        assert heartbeat_interval < lease_duration, "heartbeat interval should be shorter than the lease duration"
+        self.name = name
+        self.lease_duration = lease_duration
+        self.heartbeat_interval = heartbeat_interval
+        self.token = uuid.uuid4().hex
+        self.leading = False
+
+    @property
+    def holder(self) -> str:
+        """Identifier of the current process as the holder, which remains unique when the process is forked.
+
+        Returns:
+            str:
+            Returns the process ID along with the token.
+        """
+        return f"{os.getpid()}:{self.token}"
+
+    def acquire(self) -> bool:
+        """Acquires the lease if it is free or expired, or renews it if it is held by the current process.
+
+        Returns:
+            bool:
+            Returns a boolean flag to indicate whether the current process holds the lease.
+        """
+        now = time.time()
+        result = writer.write(
+            (
+                "INSERT INTO leader (name, holder, expires_at) VALUES (?,?,?) ON CONFLICT(name) DO UPDATE SET "
+                "holder=excluded.holder, expires_at=excluded.expires_at "
+                "WHERE leader.holder=excluded.holder OR leader.expires_at < ?;",
+                (self.name, self.holder, now + self.lease_duration, now),
+            )
+        )
+        return result.rowcount == 1
+
+    def release(self) -> None:
+        """Releases the lease if it is held by the current process."""
+        writer.write(("DELETE FROM leader WHERE name=? AND holder=?;", (self.name, self.holder)))
+
+    async def run(self, func: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        """Runs the coroutine while the current process holds the lease, in a forever loop.
+
+        Args:
+            func: Coroutine function to run as the leader.
+        """
+        task: asyncio.Task | None = None
+        try:
+            while True:
+                try:
+                    leading = await offload.pools["lease"].run(self.acquire)
+                except Exception as error:
+                    logger.error("Failed to renew the lease for %s: %s", self.name, error)
+                    leading = False
+                if leading and (task is None or task.done()):
+                    if self.leading:
+                        # Coroutine has exited on its own, so it is restarted while the lease is held
+                        logger.error("%s exited while holding the lease, restarting", self.name)
+                    else:
+                        logger.info("Acquired the lease for %s [%s]", self.name, self.holder)
+                    task = asyncio.create_task(func(), name=self.name)
+                elif not leading and task and not task.done():
+                    logger.warning("Lost the lease for %s [%s]", self.name, self.holder)
+                    task.cancel()
+                self.leading = leading
+                await asyncio.sleep(self.heartbeat_interval)
+        finally:
+            if task:
+                task.cancel()
+            if self.leading:
+                self.leading = False
+                try:
+                    await offload.pools["lease"].run(self.release)
+                except Exception as error:
+                    logger.error("Failed to release the lease for %s: %s", self.name, error)
+
+
+election = LeaderElection(name="background_tasks", lease_duration=LEASE_DURATION, heartbeat_interval=HEARTBEAT_INTERVAL)
@@ -0,0 +1,143 @@
+# noinspection PyUnresolvedReferences
+"""Run metrics for the background tasks, that are collected in memory and persisted periodically.
+
+>>> Metrics
+
+See Also:
+    - | Each run is recorded under a label, which is the name of the scheduled job that triggered it, so that the
+      | metrics can be paired with the next scheduled run.
+    - Durations are kept in a bounded window for each label, to compute the percentiles.
+    - | Snapshots are persisted in the ``background_metrics`` table, so that the API can serve them even when the
+      | background tasks run in a separate process.
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, List, Tuple, Type
+
+from jarvis.modules.database import writer
+from jarvis.modules.models import models
+from jarvis.modules.utils import util
+
+PERSIST_INTERVAL = 30
+WINDOW = 256
+COLUMNS = ("name", "runs", "failures", "last_duration_ms", "p50_ms", "p95_ms", "next_run", "updated_at")
+
+
+@dataclass
+class TaskMetrics:
+    """Counters and durations of the runs for a single label.
+
+    >>> TaskMetrics
+
+    """
+
+    runs: int = 0
+    failures: int = 0
+    last_duration: float | None = None
+    durations: Deque[float] = field(default_factory=lambda: deque(maxlen=WINDOW))
+
+
+class Collector:
+    """In-memory collector for the run metrics of all the labels.
+
+    >>> Collector
+
+    """
+
+    def __init__(self):
+        """Instantiates the registry of metrics."""
+        self.tasks: Dict[str, TaskMetrics] = {}
+
+    def record(self, name: str, duration: float, failed: bool = False) -> None:
+        """Records a run.
+
+        Args:
+            name: Label of the run.
+            duration: Duration of the run in seconds.
+            failed: Boolean flag to indicate whether the run has failed.
+        """
+        metrics = self.tasks.setdefault(name, TaskMetrics())
+        metrics.runs += 1
+        metrics.failures += failed
+        metrics.last_duration = duration
+        metrics.durations.append(duration)
+
+    @contextmanager
+    def measure(self, name: str, ignore: Tuple[Type[BaseException], ...] = ()) -> Iterator[None]:
+        """Records the duration of the block, and a failure if the block raises an exception.
+
+        Args:
+            name: Label of the run.
+            ignore: Exceptions that are expected, and are not counted as failures.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as error:
+            self.record(name, time.perf_counter() - start, failed=not isinstance(error, ignore))
+            raise
+        self.record(name, time.perf_counter() - start)
+
+    def snapshot(self, next_runs: Dict[str, float]) -> List[Dict[str, str | int | float | None]]:
+        """Get the metrics of each label, along with its next scheduled run.
+
+        Args:
+            next_runs: Next scheduled run as epoch, for each scheduled job.
+
+        Returns:
+            List[Dict[str, str | int | float | None]]:
+            Returns a list of dictionaries with the counters, and the durations in milliseconds.
+        """
+        now = time.time()
+        snapshot = []
+        for name in sorted({*self.tasks, *next_runs}):
+            metrics = self.tasks.get(name, TaskMetrics())
+            durations = list(metrics.durations)
+            snapshot.append(
+                dict(
+                    name=name,
+                    runs=metrics.runs,
+                    failures=metrics.failures,
+                    last_duration_ms=None if metrics.last_duration is None else round(metrics.last_duration * 1000, 2),
+                    p50_ms=round(util.percentile(durations, 50) * 1000, 2),
+                    p95_ms=round(util.percentile(durations, 95) * 1000, 2),
+                    next_run=next_runs.get(name),
+                    updated_at=now,
+                )
+            )
+        return snapshot
+
+
+collector = Collector()
+
+
+def persist(snapshot: List[Dict[str, str | int | float | None]]) -> None:
+    """Replaces the metrics in the base DB with the given snapshot.
+
+    Args:
+        snapshot: Metrics of each label.
+    """
+    writer.write(
+        "DELETE FROM background_metrics;",
+        writer.Statement(
+            query=f"INSERT INTO background_metrics ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))});",
+            params=[tuple(metrics[column] for column in COLUMNS) for metrics in snapshot],
+            many=True,
+        ),
+    )
+
+
+def read() -> List[Dict[str, str | int | float | None]]:
+    """Reads the latest snapshot from the base DB.
+
+    Returns:
+        List[Dict[str, str | int | float | None]]:
+        Returns a list of dictionaries with the counters, and the durations in milliseconds.
+    """
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        rows = cursor.execute(f"SELECT {', '.join(COLUMNS)} FROM background_metrics ORDER BY name;").fetchall()
+    return [dict(zip(COLUMNS, row)) for row in rows]
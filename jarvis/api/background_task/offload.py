@@ -0,0 +1,89 @@
+# noinspection PyUnresolvedReferences
+"""Named thread pools to run the blocking work of background coroutines, without blocking the event loop.
+
+>>> Offload
+
+See Also:
+    - | Each kind of blocking work has a dedicated pool, so that a slow telegram poll or offline command does not
+      | starve the meetings sync, and none of them can freeze alarms, reminders and cron jobs in the event loop.
+    - | Calls that exceed the timeout of the pool raise a ``TimeoutError`` to the coroutine. Calls that are yet to
+      | start are cancelled, and running calls keep their worker until they actually finish.
+    - Blocking calls that slip into the event loop are caught by the lag check in the scheduler.
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from jarvis.modules.logger import logger
+
+
+class Pool:
+    """Thread pool with a name and a timeout for each call.
+
+    >>> Pool
+
+    """
+
+    def __init__(self, name: str, workers: int, timeout: int | float):
+        """Instantiates the executor.
+
+        Args:
+            name: Name of the pool, used as the prefix for the thread names.
+            workers: Number of worker threads.
+            timeout: Time in seconds to wait for each call to complete.
+        """
+        self.name = name
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Runs the function in a worker thread and awaits its result.
+
+        Args:
+            func: Blocking function to execute.
+
+        Raises:
+            TimeoutError:
+            If the function did not complete within the timeout.
+
+        Returns:
+            Any:
+            Returns the value returned by the function.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        future = loop.run_in_executor(self.executor, functools.partial(context.run, func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            name = getattr(func, "__name__", repr(func))
+            logger.error("%s did not complete within %ss in the %s pool", name, self.timeout, self.name)
+            raise TimeoutError(f"{name} timed out after {self.timeout}s")
+
+    def shutdown(self) -> None:
+        """Cancels the calls that are yet to start, without waiting for the running calls."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+pools: Dict[str, Pool] = {
+    # Offline commands triggered by background tasks and automation
+    "commands": Pool(name="background_commands", workers=4, timeout=300),
+    # Outbound requests made by the background tasks
+    "network": Pool(name="background_network", workers=2, timeout=30),
+    # Long polling for telegram messages, which also processes the commands received
+    "telegram": Pool(name="telegram_poller", workers=1, timeout=300),
+    # Writes to the base DB, which are serialized by the writer anyway
+    "database": Pool(name="background_database", workers=1, timeout=30),
+    # Lease of the leader election, so that a renewal never waits behind a slow write of the background tasks
+    # Timeout is shorter than the lease duration, so that a stuck renewal steps down before another worker takes over
+    "lease": Pool(name="leader_lease", workers=1, timeout=5),
+}
+
+
+def shutdown() -> None:
+    """Shuts down all the pools."""
+    for pool in pools.values():
+        pool.shutdown()
@@ -0,0 +1,195 @@
+# noinspection PyUnresolvedReferences
+"""Timer scheduler for the background tasks, which sleeps until the earliest deadline or a wake-up call.
+
+>>> Scheduler
+
+See Also:
+    - Jobs are stored in a heap ordered by their due time, so each wake-up only looks at the jobs that are due.
+    - The next due time of a job is computed by its trigger, after the job is executed.
+    - Jobs that were missed while the host was suspended are executed once, and rescheduled from the current time.
+    - | Lag of the event loop is measured when the scheduler wakes up for a deadline, and logged when it exceeds a
+      | threshold, so that blocking calls are caught without waking up the idle loop any more often.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+from jarvis.modules.logger import logger
+
+# Lag in seconds beyond which a wake-up is logged, as the event loop was blocked
+LAG_THRESHOLD = 0.25
+
+# Trigger takes the previous due time as epoch, and returns the next due time or None to stop the job
+Trigger = Callable[[float], float | None]
+
+
+def every(seconds: int | float) -> Trigger:
+    """Trigger for jobs that run at a fixed interval.
+
+    Args:
+        seconds: Interval in seconds.
+
+    Returns:
+        Trigger:
+        Returns a function that computes the next due time.
+    """
+    return lambda previous: previous + seconds
+
+
+def minutely(previous: float) -> float:
+    """Trigger for jobs that run at the start of every minute.
+
+    Args:
+        previous: Previous due time as epoch.
+
+    Returns:
+        float:
+        Returns the start of the next minute as epoch.
+    """
+    return (previous // 60 + 1) * 60
+
+
+@dataclass
+class Job:
+    """Job to be executed by the scheduler.
+
+    >>> Job
+
+    """
+
+    name: str
+    action: Callable[[], None]
+    trigger: Trigger
+    due: float | None = None
+
+
+class Scheduler:
+    """Heap based scheduler that runs in the event loop.
+
+    >>> Scheduler
+
+    """
+
+    def __init__(self):
+        """Instantiates the heap and the job registry."""
+        self.heap: List[Tuple[float, int, Job]] = []
+        self.jobs: Dict[str, Job] = {}
+        self.counter = itertools.count()
+        self.event: asyncio.Event | None = None
+
+    def add(self, job: Job, due: float = None) -> None:
+        """Adds or replaces a job, and wakes up the scheduler to re-evaluate the earliest deadline.
+
+        Args:
+            job: Job to be scheduled.
+            due: Epoch time of the first execution, defaults to one trigger from now.
+        """
+        job.due = due if due is not None else job.trigger(time.time())
+        # A replaced job is left in the heap, and skipped when it is popped
+        self.jobs[job.name] = job
+        if job.due is not None:
+            heapq.heappush(self.heap, (job.due, next(self.counter), job))
+        self.wake()
+
+    def remove(self, prefix: str) -> None:
+        """Removes all the jobs whose names start with the given prefix.
+
+        Args:
+            prefix: Prefix of the job names.
+        """
+        for name in [name for name in self.jobs if name.startswith(prefix)]:
+            del self.jobs[name]
+
+    def sync(self, prefix: str, jobs: List[Job]) -> None:
+        """Replaces the jobs whose names start with the given prefix, retaining the due times of the existing jobs.
+
+        Args:
+            prefix: Prefix of the job names.
+            jobs: Jobs to be scheduled, each of which is identified by its name.
+
+        See Also:
+            - Jobs with a name that is already scheduled keep their due time, but take the new action and trigger.
+            - Jobs that are no longer present are removed, and the new ones are due after one trigger from now.
+        """
+        names = {job.name for job in jobs}
+        for name in [name for name in self.jobs if name.startswith(prefix) and name not in names]:
+            del self.jobs[name]
+        for job in jobs:
+            if existing := self.jobs.get(job.name):
+                existing.action, existing.trigger = job.action, job.trigger
+            else:
+                self.add(job)
+
+    def wake(self) -> None:
+        """Wakes up the scheduler, if it is sleeping."""
+        if self.event:
+            self.event.set()
+
+    def stale(self, entry: Tuple[float, int, Job]) -> bool:
+        """Checks if a heap entry belongs to a job that was removed, replaced or rescheduled.
+
+        Args:
+            entry: Tuple of the due time, insertion order and the job.
+
+        Returns:
+            bool:
+            Returns a boolean flag to indicate whether the entry has to be skipped.
+        """
+        due, _, job = entry
+        return self.jobs.get(job.name) is not job or job.due != due
+
+    def timeout(self) -> float | None:
+        """Get the number of seconds until the earliest deadline.
+
+        Returns:
+            float:
+            Returns the seconds to sleep, or ``None`` if there are no jobs.
+        """
+        while self.heap and self.stale(self.heap[0]):
+            heapq.heappop(self.heap)
+        if self.heap:
+            return max(self.heap[0][0] - time.time(), 0)
+
+    def run_pending(self) -> None:
+        """Executes the jobs that are due, and reschedules them based on their triggers."""
+        now = time.time()
+        while self.heap and self.heap[0][0] <= now:
+            entry = heapq.heappop(self.heap)
+            if self.stale(entry):
+                continue
+            due, _, job = entry
+            try:
+                job.action()
+            except Exception as error:
+                logger.error("Failed to execute the job %s: %s", job.name, error)
+            if self.jobs.get(job.name) is not job:
+                # Job was removed or replaced by its own action
+                continue
+            next_due = job.trigger(due)
+            if next_due is not None and next_due <= now:
+                # Skip the executions that were missed, instead of running them back to back
+                next_due = job.trigger(now)
+            job.due = next_due
+            if next_due is None:
+                del self.jobs[job.name]
+            else:
+                heapq.heappush(self.heap, (next_due, next(self.counter), job))
+
+    async def run(self) -> None:
+        """Executes the jobs that are due, and sleeps until the earliest deadline or a wake-up call."""
+        loop = asyncio.get_running_loop()
+        self.event = asyncio.Event()
+        while True:
+            self.run_pending()
+            timeout, slept = self.timeout(), loop.time()
+            try:
+                await asyncio.wait_for(self.event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # Time since the sleep started, beyond the timeout, is the time the event loop was blocked
+                if (lag := loop.time() - slept - timeout) > LAG_THRESHOLD:
+                    logger.warning("Event loop was blocked for %.3fs", lag)
+            self.event.clear()
@@ -1,4 +1,6 @@
 import asyncio
+import collections
+import functools
 import os
 import time
 from dataclasses import dataclass
@@ -7,7 +9,15 @@ from typing import Callable, List
 
 from deepdiff import DeepDiff
 
-from jarvis.api.background_task import agent, bot
+from jarvis.api.background_task import agent, bot, metrics, offload
+from jarvis.api.background_task.scheduler import (
+    Job,
+    Scheduler,
+    Trigger,
+    every,
+    minutely,
+)
+from jarvis.api.background_task.watcher import Watcher
 from jarvis.executors import (
     automation,
     background_task,
@@ -34,6 +44,9 @@ def error_handler(task: asyncio.Task) -> None:
         - Logs a warning for any failures with less than 3 occurrences.
     """
     task_name = task.get_name()
+    if task.cancelled():
+        logger.debug("Task %s was cancelled", task_name)
+        return
     try:
         task.result()
         logger.debug("Execution completed for the task: %s", task_name)
@@ -60,11 +73,28 @@ def error_handler(task: asyncio.Task) -> None:
             logger.warning("Background task %s crashed (%d)", task_name, attempt)
 
 
-def create_task(func: Callable, *args, **kwargs) -> None:
+def record_run(task: asyncio.Task, label: str, started: float) -> None:
+    """Callback function to record the duration and the outcome of a task in the metrics.
+
+    Args:
+        task: Takes the task as an argument.
+        label: Label to record the metrics under.
+        started: Time when the task was created, from the performance counter.
+    """
+    if not task.cancelled():
+        metrics.collector.record(label, time.perf_counter() - started, failed=task.exception() is not None)
+
+
+def create_task(func: Callable, *args, label: str = None, **kwargs) -> asyncio.Task | None:
     """Creates an asynchronous task with a done callback attached to handle errors, restarts and notifications.
 
     Args:
         func: Callable object to create a task for.
+        label: Label to record the run metrics under, metrics are not recorded if not specified.
+
+    Returns:
+        asyncio.Task:
+        Returns the task, or ``None`` if the task has crashed too many times to be created again.
     """
     if hasattr(func, "__module__") and hasattr(func, "__qualname__"):
         task_name = f"{func.__module__}.{func.__qualname__}".replace("jarvis.", "")
@@ -76,24 +106,179 @@ def create_task(func: Callable, *args, **kwargs) -> None:
     logger.debug("Creating a task for the coroutine: %s", task_name)
     task = asyncio.create_task(func(*args, **kwargs), name=task_name)
     task.add_done_callback(error_handler)
+    if label:
+        task.add_done_callback(functools.partial(record_run, label=label, started=time.perf_counter()))
+    return task
+
+
+# Interval in seconds to check the tasks and crontab files for any changes, which is a stat call per file
+# Native file events are platform specific (inotify, FSEvents, ReadDirectoryChangesW) and need a dependency
+WATCH_INTERVAL = 10
+
+scheduler = Scheduler()
+watcher = Watcher()
 
 
 @dataclass
-class StartTimes:
-    """Dataclass to store each agent's start time.
+class Loaded:
+    """Dataclass to store the background tasks and cron jobs that are currently scheduled.
+
+    >>> Loaded
+
+    """
+
+    tasks: List[classes.BackgroundTask]
+    cron_jobs: List[crontab.expression.CronExpression]
+
+
+def job_names(prefix: str, keys: List[str]) -> List[str]:
+    """Get a unique job name for each key, so that identical entries are scheduled as separate jobs.
+
+    Args:
+        prefix: Prefix of the job names.
+        keys: Keys that identify each entry.
+
+    Returns:
+        List[str]:
+        Returns the list of job names in the same order as the keys.
+    """
+    occurrences = collections.Counter()
+    names = []
+    for key in keys:
+        names.append(f"{prefix}{key}:{occurrences[key]}")
+        occurrences[key] += 1
+    return names
+
+
+def run_task(task: classes.BackgroundTask, label: str) -> None:
+    """Creates an asynchronous task for a background task that is due.
+
+    Args:
+        task: BackgroundTask object that is due.
+        label: Name of the scheduled job.
+    """
+    create_task(agent.background_executor, task=task, now=datetime.now(), label=label)
+
+
+def schedule_tasks(tasks: List[classes.BackgroundTask]) -> None:
+    """Schedules the background tasks, each of which is due after its interval.
+
+    Args:
+        tasks: List of BackgroundTask objects to be scheduled.
+
+    See Also:
+        - Tasks are identified by their interval and command, so an unchanged task keeps its last run time on reload.
+    """
+    names = job_names(prefix="task:", keys=[f"{task.seconds}:{task.task}" for task in tasks])
+    scheduler.sync(
+        prefix="task:",
+        jobs=[
+            Job(name=name, action=functools.partial(run_task, task, name), trigger=every(task.seconds))
+            for name, task in zip(names, tasks)
+        ],
+    )
+
+
+def cron_trigger(job: crontab.expression.CronExpression) -> Trigger:
+    """Trigger for cron jobs, that jumps to the next fire time instead of checking the expression every minute.
 
-    >>> StartTimes
+    Args:
+        job: CronExpression object of the cron job.
+
+    Returns:
+        Trigger:
+        Returns a function that computes the next due time.
+    """
+
+    def trigger(previous: float) -> float | None:
+        """Computes the next fire time of the cron job, after the previous due time."""
+        if fire_time := job.next_fire_time(after=datetime.fromtimestamp(previous)):
+            return fire_time.timestamp()
+
+    return trigger
+
+
+def schedule_cron_jobs(cron_jobs: List[crontab.expression.CronExpression]) -> None:
+    """Schedules the cron jobs, each of which is due at its next fire time.
+
+    Args:
+        cron_jobs: List of CronExpression objects to be scheduled.
+    """
+    names = job_names(prefix="cron:", keys=list(map(str, cron_jobs)))
+    scheduler.sync(
+        prefix="cron:",
+        jobs=[
+            Job(
+                name=name,
+                action=functools.partial(create_task, agent.crontab_executor, job=job, label=name),
+                trigger=cron_trigger(job),
+            )
+            for name, job in zip(names, cron_jobs)
+        ],
+    )
+
+
+def minute_tick() -> None:
+    """Triggers automation, alarms and reminders at the start of every minute."""
+    now = datetime.now()
+
+    # MARK: Trigger automation
+    for exec_task in automation.auto_helper():
+        create_task(agent.automation_executor, exec_task=exec_task, label="automation")
+
+    # MARK: Trigger alarms
+    create_task(agent.alarm_executor, now, label="alarms")
+
+    # MARK: Trigger reminders
+    create_task(agent.reminder_executor, now, label="reminders")
+
+
+def reload_tasks(loaded: Loaded) -> None:
+    """Re-validates the background tasks with logger disabled, and reschedules them if they have changed.
 
+    Args:
+        loaded: Background tasks and cron jobs that are currently scheduled.
     """
+    new_tasks: List[classes.BackgroundTask] = list(background_task.validate_tasks(log=False))
+    if new_tasks != loaded.tasks:
+        logger.warning("Tasks list has been updated.")
+        logger.info(DeepDiff(loaded.tasks, new_tasks, ignore_order=True))
+        loaded.tasks = new_tasks
+        schedule_tasks(tasks=new_tasks)
+
+
+def reload_cron_jobs(loaded: Loaded) -> None:
+    """Re-validates the cron jobs with logger disabled, and reschedules them if they have changed.
 
-    events: float
-    meetings: float
-    pulse: float
-    telegram: float
+    Args:
+        loaded: Background tasks and cron jobs that are currently scheduled.
+    """
+    new_cron_jobs: List[crontab.expression.CronExpression] = list(crontab.validate_jobs(log=False))
+    # CronExpression objects are compared by their string representation, since they don't implement equality
+    if list(map(str, new_cron_jobs)) != list(map(str, loaded.cron_jobs)):
+        # Don't log updated jobs since there will always be a difference when run on author mode
+        loaded.cron_jobs = new_cron_jobs
+        schedule_cron_jobs(cron_jobs=new_cron_jobs)
+
+
+async def persist_metrics() -> None:
+    """Persists a snapshot of the run metrics, along with the next scheduled run of each job."""
+    snapshot = metrics.collector.snapshot(next_runs={name: job.due for name, job in scheduler.jobs.items()})
+    await offload.pools["database"].run(metrics.persist, snapshot)
 
 
 async def background_tasks() -> None:
-    """Trigger for background tasks, cron jobs, automation, alarms, reminders, events and meetings sync."""
+    """Trigger for background tasks, cron jobs, automation, alarms, reminders, events and meetings sync.
+
+    See Also:
+        - | Each job is scheduled with its next due time, and the scheduler sleeps until the earliest one,
+          | instead of waking up every few seconds to check all the jobs.
+        - Each cron job is due at its next fire time, computed from the expression instead of polling every minute.
+        - Automation, alarms and reminders share a single job, that runs at the start of every minute.
+        - | Tasks and cron jobs are re-validated only when their files are modified, and the ones that are unchanged
+          | keep their due times.
+        - Blocking work is offloaded to the thread pools in ``offload``, so that the event loop is never blocked.
+    """
     multiprocessing_logger(filename=os.path.join("logs", "background_tasks_%d-%m-%Y.log"))
 
     # Env vars are loaded only during startup, so run validations beforehand
@@ -101,85 +286,68 @@ async def background_tasks() -> None:
     await agent.init_meetings()
     if not all((models.env.wifi_ssid, models.env.wifi_password)):
         classes.wifi_connection = None
-    tasks: List[classes.BackgroundTask] = list(background_task.validate_tasks())
-    cron_jobs: List[crontab.expression.CronExpression] = list(crontab.validate_jobs())
-
-    # Load start up times
-    t_now = time.time()
-    start_times = StartTimes(t_now, t_now, t_now, t_now)
-
-    # Creates a start time for each task
-    task_dict = {i: time.time() for i in range(len(tasks))}
-
-    # Instantiate telegram bot - webhook vs long polling
-    create_task(bot.init)
-    while True:
-        now = datetime.now()
-
-        # PULSE: Once during start up (regardless of schedule) and 1m after that
-        if start_times.pulse + 60 <= time.time():
-            start_times.pulse = time.time()
-
-            # MARK: Trigger background tasks
-            create_task(agent.background_executor, tasks=tasks, task_dict=task_dict, now=now)
-
-            # MARK: Trigger cron jobs
-            create_task(agent.crontab_executor, cron_jobs=cron_jobs)
-
-            # MARK: Trigger automation
-            for exec_task in automation.auto_helper():
-                create_task(agent.automation_executor, exec_task=exec_task)
-
-            # MARK: Trigger Wi-Fi checker
-            if classes.wifi_connection:
-                create_task(connectivity.wifi)
-
-            # MARK: Sync events from the event app specified (calendar/outlook)
-            if (
-                models.env.event_app
-                and models.env.sync_events
-                and start_times.events + models.env.sync_events <= time.time()
-            ):
-                start_times.events = time.time()
-                create_task(agent.db_writer, picker="events")
-
-            # MARK: Sync meetings from the ICS url provided
-            if (
-                models.env.ics_url
-                and models.env.sync_meetings
-                and start_times.meetings + models.env.sync_meetings <= time.time()
-            ):
-                start_times.meetings = time.time()
-                create_task(agent.db_writer, picker="meetings")
-
-            # MARK: Trigger alarms
-            create_task(agent.alarm_executor, now)
-
-            # MARK: Trigger reminders
-            create_task(agent.reminder_executor, now)
-
-        # MARK: Poll for telegram messages
-        if bot.telegram_beat.poll_for_messages:
-            create_task(bot.telegram_executor)
-        if bot.telegram_beat.restart_loop:
-            # Avoid being called again when init is in progress
-            bot.telegram_beat.restart_loop = False
-            create_task(bot.init)
-
-        # MARK: Re-check for any newly added tasks with logger disabled
-        new_tasks: List[classes.BackgroundTask] = list(background_task.validate_tasks(log=False))
-        if new_tasks != tasks:
-            logger.warning("Tasks list has been updated.")
-            logger.info(DeepDiff(tasks, new_tasks, ignore_order=True))
-            tasks = new_tasks
-            # Re-create start time for each task
-            task_dict = {i: time.time() for i in range(len(tasks))}
-
-        # MARK: Re-check for any newly added cron_jobs with logger disabled
-        new_cron_jobs: List[crontab.expression.CronExpression] = list(crontab.validate_jobs(log=False))
-        if new_cron_jobs != cron_jobs:
-            # Don't log updated jobs since there will always be a difference when run on author mode
-            cron_jobs = new_cron_jobs
-
-        # MARK: Pause and yield control back to the event loop
-        await asyncio.sleep(3)
+
+    # Files are watched before they are loaded, so that the changes made in the meantime are not missed
+    loaded = Loaded(tasks=[], cron_jobs=[])
+    watcher.watch(filepath=models.fileio.background_tasks, callback=functools.partial(reload_tasks, loaded))
+    watcher.watch(filepath=models.fileio.crontab, callback=functools.partial(reload_cron_jobs, loaded))
+    loaded.tasks = list(background_task.validate_tasks())
+    loaded.cron_jobs = list(crontab.validate_jobs())
+
+    # MARK: Trigger background tasks
+    schedule_tasks(tasks=loaded.tasks)
+
+    # MARK: Trigger cron jobs
+    schedule_cron_jobs(cron_jobs=loaded.cron_jobs)
+
+    # MARK: Trigger automation, alarms and reminders
+    scheduler.add(Job(name="minute", action=minute_tick, trigger=minutely))
+
+    # MARK: Trigger Wi-Fi checker
+    if classes.wifi_connection:
+        scheduler.add(
+            Job(name="wifi", action=functools.partial(create_task, connectivity.wifi, label="wifi"), trigger=every(60))
+        )
+
+    # MARK: Sync events from the event app specified (calendar/outlook)
+    if models.env.event_app and models.env.sync_events:
+        scheduler.add(
+            Job(
+                name="events",
+                action=functools.partial(create_task, agent.db_writer, picker="events", label="events"),
+                trigger=every(models.env.sync_events),
+            )
+        )
+
+    # MARK: Sync meetings from the ICS url provided
+    if models.env.ics_url and models.env.sync_meetings:
+        scheduler.add(
+            Job(
+                name="meetings",
+                action=functools.partial(create_task, agent.db_writer, picker="meetings", label="meetings"),
+                trigger=every(models.env.sync_meetings),
+            )
+        )
+
+    # MARK: Reload the tasks and cron jobs when their files are modified
+    scheduler.add(Job(name="watcher", action=watcher.poll, trigger=every(WATCH_INTERVAL)))
+
+    # MARK: Instantiate telegram bot - webhook vs long polling, and poll for messages
+    poller = create_task(bot.poller)
+
+    # MARK: Persist the run metrics for the status API
+    scheduler.add(
+        Job(
+            name="metrics",
+            action=functools.partial(create_task, persist_metrics),
+            trigger=every(metrics.PERSIST_INTERVAL),
+        )
+    )
+
+    try:
+        await scheduler.run()
+    finally:
+        # Background tasks are stopped at shutdown, or when another API worker has taken over as the leader
+        if poller:
+            poller.cancel()
+        scheduler.remove(prefix="")
@@ -0,0 +1,79 @@
+# noinspection PyUnresolvedReferences
+"""Watcher for the files that are re-loaded at runtime, which only re-parses a file after it has changed.
+
+>>> Watcher
+
+See Also:
+    - Each file is identified by its modified time, size and inode, which are read with a single stat call.
+    - A file that is created, removed, renamed or replaced is reported as changed as well.
+"""
+
+import os
+from typing import Callable, Dict, List, Tuple
+
+from pydantic.v1 import FilePath
+
+from jarvis.modules.logger import logger
+
+
+class Watcher:
+    """Polls the stat of each watched file, and invokes its callback when the file has changed.
+
+    >>> Watcher
+
+    """
+
+    def __init__(self):
+        """Instantiates the registry of watched files."""
+        self.stamps: Dict[str, Tuple[int, int, int] | None] = {}
+        self.callbacks: Dict[str, Callable[[], None]] = {}
+
+    @staticmethod
+    def stamp(filepath: FilePath | str) -> Tuple[int, int, int] | None:
+        """Get the modified time, size and inode of a file.
+
+        Args:
+            filepath: Path of the file.
+
+        Returns:
+            Tuple[int, int, int]:
+            Returns the signature of the file, or ``None`` if the file does not exist.
+        """
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def watch(self, filepath: FilePath | str, callback: Callable[[], None]) -> None:
+        """Starts watching a file.
+
+        Args:
+            filepath: Path of the file.
+            callback: Function to invoke when the file has changed.
+
+        See Also:
+            - The current signature is taken as the baseline, so the file should be loaded after it is watched.
+        """
+        self.stamps[str(filepath)] = self.stamp(filepath)
+        self.callbacks[str(filepath)] = callback
+
+    def poll(self) -> List[str]:
+        """Invokes the callbacks of the files that have changed since the last poll.
+
+        Returns:
+            List[str]:
+            Returns the list of files that have changed.
+        """
+        changed = []
+        for filepath, callback in self.callbacks.items():
+            if (stamp := self.stamp(filepath)) == self.stamps[filepath]:
+                continue
+            self.stamps[filepath] = stamp
+            changed.append(filepath)
+            logger.debug("Reloading %s", filepath)
+            try:
+                callback()
+            except Exception as error:
+                logger.error("Failed to reload %s: %s", filepath, error)
+        return changed
@@ -1,16 +1,17 @@
 import asyncio
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from threading import Thread
 
 from fastapi import FastAPI
 
 from jarvis import version
 from jarvis.api import entrypoint
-from jarvis.api.background_task import task
+from jarvis.api.background_task import leader, offload, task
 from jarvis.api.logger import logger
 from jarvis.api.routers import routes
-from jarvis.api.squire import stockanalysis_squire
+from jarvis.api.squire import offline_squire, stockanalysis_squire
 from jarvis.modules.models import enums, models
+from jarvis.modules.utils import usage
 
 
 @asynccontextmanager
@@ -23,10 +24,18 @@ async def lifespan(_: FastAPI):
     entrypoint.startup()
     if models.env.async_background_task:
         logger.info("Initiating background tasks...")
-        bg_task = asyncio.create_task(task.background_tasks())
+        # Each API worker runs the lifespan, so the background tasks are run only by the elected leader
+        bg_task = asyncio.create_task(leader.election.run(task.background_tasks))
     yield
     if models.env.async_background_task:
         bg_task.cancel()
+        # Awaited before the pools are shut down, so that the leader releases the lease on its way out
+        with suppress(asyncio.CancelledError):
+            await bg_task
+        offload.shutdown()
+    offline_squire.pool.shutdown()
+    # Usage counts of the offline commands are flushed explicitly, since the API worker is a child process
+    usage.counter.flush()
     logger.info("Shutting down API server.")
 
 
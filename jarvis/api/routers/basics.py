@@ -3,9 +3,12 @@ from http import HTTPStatus
 
 from fastapi.responses import FileResponse
 
+from jarvis.api.background_task import leader, metrics, task
 from jarvis.api.logger import logger
 from jarvis.modules.conditions import keywords as keywords_mod
 from jarvis.modules.exceptions import APIResponse
+from jarvis.modules.models import models
+from jarvis.modules.utils import latency
 
 
 async def redirect_index():
@@ -58,3 +61,33 @@ async def keywords():
         Key-value pairs of the keywords file.
     """
     return {k: v for k, v in keywords_mod.keywords.items() if isinstance(v, list)}
+
+
+async def voice_latency():
+    """Get the latency histograms for each stage of the voice pipeline.
+
+    Raises:
+
+        APIResponse:
+        - 200: Percentiles in milliseconds for each stage, and for the end-to-end latency of each category.
+    """
+    raise APIResponse(status_code=HTTPStatus.OK.real, detail=latency.summary())
+
+
+async def background_tasks_status():
+    """Get the run metrics of the background tasks, along with the next scheduled run of each job.
+
+    See Also:
+        - | Metrics are live when the background tasks run within the API worker serving the request, and persisted
+          | every 30 seconds otherwise.
+
+    Raises:
+
+        APIResponse:
+        - 200: Runs, failures, last duration and percentiles in milliseconds, and the next run as epoch.
+    """
+    if models.env.async_background_task and leader.election.leading:
+        snapshot = metrics.collector.snapshot(next_runs={name: job.due for name, job in task.scheduler.jobs.items()})
+    else:
+        snapshot = metrics.read()
+    raise APIResponse(status_code=HTTPStatus.OK.real, detail=snapshot)
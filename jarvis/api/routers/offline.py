@@ -10,23 +10,27 @@ from fastapi.responses import FileResponse
 from jarvis.api.logger import logger
 from jarvis.api.models import modals
 from jarvis.api.routers import speech_synthesis
-from jarvis.executors import commander, offline, restrictions, secure_send, word_match
+from jarvis.api.squire import offline_squire
+from jarvis.executors import (
+    commander,
+    delayed_tasks,
+    offline,
+    restrictions,
+    secure_send,
+    word_match,
+)
 from jarvis.modules.audio import tts_stt
 from jarvis.modules.conditions import keywords
+from jarvis.modules.database import writer
 from jarvis.modules.exceptions import APIResponse, InvalidArgument
 from jarvis.modules.models import models
-from jarvis.modules.utils import support
+from jarvis.modules.utils import control_plane, shared, support, util
 
 
 def kill_power() -> None:
     """Inserts a flag into stopper table in base database."""
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute(
-            "INSERT or REPLACE INTO stopper (flag, caller) VALUES (?,?);",
-            (True, "FastAPI"),
-        )
-        cursor.connection.commit()
+    writer.write(("INSERT or REPLACE INTO stopper (flag, caller) VALUES (?,?);", (True, "FastAPI")))
+    control_plane.notify()
 
 
 async def process_ok_response(response: str, input_data: modals.OfflineCommunicatorModal) -> bytes | FileResponse:
@@ -72,50 +76,25 @@ async def process_ok_response(response: str, input_data: modals.OfflineCommunica
     raise APIResponse(status_code=HTTPStatus.OK.real, detail=response)
 
 
-async def offline_communicator_api(request: Request, input_data: modals.OfflineCommunicatorModal):
-    """Offline Communicator API endpoint for Jarvis.
+def execute(command: str) -> str:
+    """Executes the command in a worker thread, as most of the executors are blocking.
 
     Args:
-
-        - request: Takes the Request class as an argument.
-        - input_data: Takes the following arguments as an ``OfflineCommunicatorModal`` object.
-
-            - command: The task which Jarvis has to do.
-            - native_audio: Whether the response should be as an audio file with the server's built-in voice.
-            - speech_timeout: Timeout to process speech-synthesis.
+        command: The task which Jarvis has to do.
 
     Raises:
-
         APIResponse:
-        - 200: A dictionary with the command requested and the response for it from Jarvis.
-        - 204: If empty command was received.
+        - 200: For responses that are returned as text regardless of the input data.
+        - 400: If the restrictions' request is invalid.
 
     Returns:
-
-        FileResponse:
-        Returns the audio file as a response if the output is requested as audio.
+        str:
+        Response from Jarvis as text or a filepath.
     """
-    logger.debug(
-        "Connection received from %s via %s using %s",
-        request.client.host,
-        request.headers.get("host"),
-        request.headers.get("user-agent"),
-    )
-    if not (command := input_data.command.strip()):
-        raise APIResponse(status_code=HTTPStatus.NO_CONTENT.real, detail=HTTPStatus.NO_CONTENT.phrase)
-
-    logger.info("Request: %s", command)
-    if command.lower() == "test":
-        logger.info("Test message received.")
-        raise APIResponse(status_code=HTTPStatus.OK.real, detail="Test message received.")
-
     if word_match.word_match(phrase=command, match_list=keywords.keywords["kill"]) and "override" in command.lower():
         logger.info("STOP override has been requested.")
         Thread(target=kill_power).start()
-        return await process_ok_response(
-            response=f"Shutting down now {models.env.title}!\n{support.exit_message()}",
-            input_data=input_data,
-        )
+        return f"Shutting down now {models.env.title}!\n{support.exit_message()}"
 
     if word_match.word_match(phrase=command, match_list=keywords.keywords["restrictions"]):
         try:
@@ -144,17 +123,9 @@ async def offline_communicator_api(request: Request, input_data: modals.OfflineC
         command = command.lower()
     if " and " in command and not word_match.word_match(phrase=command, match_list=keywords.ignore_and):
         and_phrases = command.split(" and ")
-        logger.info("Looping through %s in iterations.", and_phrases)
-        and_response = ""
-        for each in and_phrases:
-            try:
-                and_response += f"{offline.communicator(command=each)}\n"
-            except Exception as error:
-                logger.error(error)
-                logger.error(traceback.format_exc())
-                and_response += error.__str__()
+        and_response = "".join(f"{response}\n" for response in offline.compound_communicator(phrases=and_phrases))
         logger.info("Response: %s", and_response.strip())
-        return await process_ok_response(response=and_response, input_data=input_data)
+        return and_response
 
     if " after " in command.lower() and not word_match.word_match(phrase=command, match_list=keywords.ignore_after):
         if delay_info := commander.timed_delay(phrase=command):
@@ -163,23 +134,62 @@ async def offline_communicator_api(request: Request, input_data: modals.OfflineC
                 delay_info[0],
                 support.time_converter(second=delay_info[1]),
             )
-            return await process_ok_response(
-                response="I will execute it after "
-                f"{support.time_converter(second=delay_info[1])} "
-                f"{models.env.title}!",
-                input_data=input_data,
-            )
-    ollama_timeout_backed = models.env.ollama_timeout
-    # Set to a max timeout of 1 minute to allow longer text conversations
-    models.env.ollama_timeout = 60
+            return f"I will execute it after {support.time_converter(second=delay_info[1])} {models.env.title}!"
     try:
-        response = offline.communicator(command=command)
+        # Set to a max timeout of 1 minute to allow longer text conversations
+        response = offline.communicator(command=command, ollama_timeout=60)
     except Exception as error:
         logger.error(error)
         logger.error(traceback.format_exc())
         response = error.__str__()
     logger.info("Response: %s", response)
-    models.env.ollama_timeout = ollama_timeout_backed
+    return response
+
+
+async def offline_communicator_api(request: Request, input_data: modals.OfflineCommunicatorModal):
+    """Offline Communicator API endpoint for Jarvis.
+
+    Args:
+
+        - request: Takes the Request class as an argument.
+        - input_data: Takes the following arguments as an ``OfflineCommunicatorModal`` object.
+
+            - command: The task which Jarvis has to do.
+            - native_audio: Whether the response should be as an audio file with the server's built-in voice.
+            - speech_timeout: Timeout to process speech-synthesis.
+
+    Raises:
+
+        APIResponse:
+        - 200: A dictionary with the command requested and the response for it from Jarvis.
+        - 204: If empty command was received.
+        - 429: If the offline communicator's queue is full.
+        - 503: If the offline communicator is shutting down.
+        - 504: If the command did not complete within the timeout.
+
+    Returns:
+
+        FileResponse:
+        Returns the audio file as a response if the output is requested as audio.
+    """
+    logger.debug(
+        "Connection received from %s via %s using %s",
+        request.client.host,
+        request.headers.get("host"),
+        request.headers.get("user-agent"),
+    )
+    if not (command := input_data.command.strip()):
+        raise APIResponse(status_code=HTTPStatus.NO_CONTENT.real, detail=HTTPStatus.NO_CONTENT.phrase)
+    # Scope the shared flags to this request's task, so concurrent requests don't overwrite each other
+    shared.request_context.set(shared.RequestContext())
+
+    logger.info("Request: %s", command)
+    if command.lower() == "test":
+        logger.info("Test message received.")
+        raise APIResponse(status_code=HTTPStatus.OK.real, detail="Test message received.")
+
+    # Commands are dispatched to a bounded pool, so that the event loop is available for other routes
+    response = await offline_squire.pool.run(execute, command)
     if os.path.isfile(response) and response.endswith(".jpg"):
         logger.info("Response received as a file.")
         Thread(
@@ -194,3 +204,49 @@ async def offline_communicator_api(request: Request, input_data: modals.OfflineC
             status_code=HTTPStatus.OK.real,
         )
     return await process_ok_response(response=response, input_data=input_data)
+
+
+async def offline_communicator_status():
+    """Get the status of the offline communicator's worker pool.
+
+    Raises:
+
+        APIResponse:
+        - 200: Queue depth, counters and percentiles for wait and run times in milliseconds.
+    """
+    raise APIResponse(status_code=HTTPStatus.OK.real, detail=offline_squire.pool.status())
+
+
+async def delayed_tasks_api():
+    """Get the delayed tasks that are yet to be executed.
+
+    Raises:
+
+        APIResponse:
+        - 200: List of delayed tasks with the ID, command and the due time.
+    """
+    raise APIResponse(
+        status_code=HTTPStatus.OK.real,
+        detail=[
+            dict(id=task_id, command=command, due=util.epoch_to_datetime(seconds=due, format_="%Y-%m-%d %H:%M:%S"))
+            for task_id, command, due in delayed_tasks.pending()
+        ],
+    )
+
+
+async def cancel_delayed_task(task_id: int):
+    """Cancel a delayed task.
+
+    Args:
+
+        - task_id: ID of the delayed task.
+
+    Raises:
+
+        APIResponse:
+        - 200: If the delayed task was cancelled.
+        - 404: If the delayed task was not found.
+    """
+    if delayed_tasks.cancel(task_id=task_id):
+        raise APIResponse(status_code=HTTPStatus.OK.real, detail=f"Delayed task {task_id} has been cancelled.")
+    raise APIResponse(status_code=HTTPStatus.NOT_FOUND.real, detail=f"Delayed task {task_id} was not found.")
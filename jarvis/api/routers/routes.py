@@ -19,12 +19,16 @@ class APIPath(StrEnum):
     file_count = "/file-count"
     list_files = "/list-files"
     secure_send = "/secure-send"
+    delayed_tasks = "/delayed-tasks"
+    voice_latency = "/voice-latency"
+    background_tasks_status = "/background-tasks/status"
     get_signals = "/get-signals"
     favicon_ico = "/favicon.ico"
     surveillance = "/surveillance"
     stock_monitor = "/stock-monitor"
     speech_synthesis = "/speech-synthesis"
     offline_communicator = "/offline-communicator"
+    offline_communicator_status = "/offline-communicator/status"
     surveillance_ws = "/ws/surveillance/{client_id}"
     robinhood_authenticate = "/robinhood-authenticate"
     speech_synthesis_voices = "/speech-synthesis-voices"
@@ -118,6 +122,36 @@ def get_all_routes() -> List[APIRoute | APIWebSocketRoute]:
             path=APIPath.offline_communicator,
             dependencies=authenticator.OFFLINE_PROTECTOR,
         ),
+        APIRoute(
+            endpoint=offline.offline_communicator_status,
+            methods=["GET"],
+            path=APIPath.offline_communicator_status,
+            dependencies=authenticator.OFFLINE_PROTECTOR,
+        ),
+        APIRoute(
+            endpoint=offline.delayed_tasks_api,
+            methods=["GET"],
+            path=APIPath.delayed_tasks,
+            dependencies=authenticator.OFFLINE_PROTECTOR,
+        ),
+        APIRoute(
+            endpoint=offline.cancel_delayed_task,
+            methods=["DELETE"],
+            path=APIPath.delayed_tasks,
+            dependencies=authenticator.OFFLINE_PROTECTOR,
+        ),
+        APIRoute(
+            endpoint=basics.voice_latency,
+            methods=["GET"],
+            path=APIPath.voice_latency,
+            dependencies=authenticator.OFFLINE_PROTECTOR,
+        ),
+        APIRoute(
+            endpoint=basics.background_tasks_status,
+            methods=["GET"],
+            path=APIPath.background_tasks_status,
+            dependencies=authenticator.OFFLINE_PROTECTOR,
+        ),
         APIRoute(
             endpoint=secure_send.secure_send_api,
             methods=["POST"],
@@ -15,6 +15,7 @@ from fastapi.responses import HTMLResponse, StreamingResponse
 from jarvis.api.logger import logger
 from jarvis.api.models import modals, settings
 from jarvis.api.squire import surveillance_squire, timeout_otp
+from jarvis.executors import resource_tracker
 from jarvis.modules.exceptions import (
     CONDITIONAL_ENDPOINT_RESTRICTION,
     APIResponse,
@@ -196,11 +197,8 @@ async def video_feed(request: Request, token: str = None):
         },
     )
     process.start()
-    # Insert process IDs into the children table to kill it in case, Jarvis is stopped during an active session
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute("INSERT INTO children (surveillance) VALUES (?);", (process.pid,))
-        connection.commit()
+    # Register process IDs to kill it in case, Jarvis is stopped during an active session
+    resource_tracker.register(pid=process.pid, category="surveillance")
     settings.surveillance.processes[settings.surveillance.client_id] = process
     return StreamingResponse(
         content=surveillance_squire.streamer(),
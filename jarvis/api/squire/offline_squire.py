@@ -0,0 +1,165 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Callable, Dict
+
+from jarvis.api.logger import logger
+from jarvis.modules.exceptions import APIResponse
+from jarvis.modules.models import models
+from jarvis.modules.utils import util
+
+
+class CommandPool:
+    """Bounded pool of worker threads to execute offline commands without blocking the event loop.
+
+    >>> CommandPool
+
+    See Also:
+        - Commands are executed in a thread pool since they share the in-process state (drivers, caches, DB handles).
+        - Requests are rejected with ``429`` when all workers are busy, and the queue is full.
+        - Requests are rejected with ``503`` when the pool is shutting down.
+        - | Requests that exceed the timeout get a ``504``, commands that are yet to start are cancelled, and running
+          | commands keep their slot until they actually finish.
+    """
+
+    def __init__(self, workers: int, queue_size: int, timeout: int):
+        """Instantiates the executor and the counters.
+
+        Args:
+            workers: Number of worker threads.
+            queue_size: Number of commands that can wait for a worker.
+            timeout: Time in seconds to wait for a command to complete.
+        """
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="offline_communicator")
+        self.slots = threading.BoundedSemaphore(value=workers + queue_size)
+        self.lock = threading.Lock()
+        self.closed = False
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_times = deque(maxlen=512)
+        self.run_times = deque(maxlen=512)
+
+    def _execute(self, func: Callable, submitted: float, *args, **kwargs) -> Any:
+        """Runs the function in a worker thread and records the wait and run times.
+
+        Args:
+            func: Function to execute.
+            submitted: Monotonic time when the command was submitted.
+        """
+        started = time.monotonic()
+        with self.lock:
+            self.queued -= 1
+            self.running += 1
+            self.wait_times.append(started - submitted)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.running -= 1
+                self.completed += 1
+                self.run_times.append(time.monotonic() - started)
+            self.slots.release()
+
+    def _release_cancelled(self, future: Future) -> None:
+        """Releases the slot for commands that were cancelled before they started.
+
+        Args:
+            future: Future object of the submitted command.
+        """
+        if future.cancelled():
+            with self.lock:
+                self.queued -= 1
+            self.slots.release()
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Submits the function to the pool and awaits its result.
+
+        Args:
+            func: Function to execute.
+
+        Raises:
+            APIResponse:
+            - 429: If the queue is full.
+            - 503: If the pool has been shut down.
+            - 504: If the command did not complete within the timeout.
+
+        Returns:
+            Any:
+            Returns the value returned by the function.
+        """
+        if self.closed:
+            raise APIResponse(status_code=HTTPStatus.SERVICE_UNAVAILABLE.real, detail="Shutting down.")
+        if not self.slots.acquire(blocking=False):
+            with self.lock:
+                self.rejected += 1
+            logger.warning("Offline communicator is saturated: %s", self.status())
+            raise APIResponse(
+                status_code=HTTPStatus.TOO_MANY_REQUESTS.real,
+                detail="Too many commands in progress, please try again later.",
+                headers={"Retry-After": str(self.timeout // 10 or 1)},
+            )
+        with self.lock:
+            self.queued += 1
+        # Copy the request's context, so that the flags and responses are scoped to this request
+        context = contextvars.copy_context()
+        try:
+            future = self.executor.submit(context.run, self._execute, func, time.monotonic(), *args, **kwargs)
+        except RuntimeError as error:
+            with self.lock:
+                self.queued -= 1
+            self.slots.release()
+            logger.error(error)
+            raise APIResponse(status_code=HTTPStatus.SERVICE_UNAVAILABLE.real, detail="Shutting down.")
+        future.add_done_callback(self._release_cancelled)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            with self.lock:
+                self.timed_out += 1
+            logger.error("Command exceeded %d seconds: %s", self.timeout, args or kwargs)
+            # Cancellation only succeeds for commands that are yet to start, running commands cannot be interrupted
+            if future.cancel():
+                detail = f"Request timed out after {self.timeout} seconds, before it could be started."
+            else:
+                detail = f"Request timed out after {self.timeout} seconds, it will continue in the background."
+            raise APIResponse(status_code=HTTPStatus.GATEWAY_TIMEOUT.real, detail=detail)
+
+    def status(self) -> Dict[str, int | float]:
+        """Returns the queue depth, counters and the wait/run time percentiles in milliseconds."""
+        with self.lock:
+            wait_times, run_times = list(self.wait_times), list(self.run_times)
+            status = dict(
+                workers=self.workers,
+                queue_size=self.queue_size,
+                queued=self.queued,
+                running=self.running,
+                completed=self.completed,
+                rejected=self.rejected,
+                timed_out=self.timed_out,
+            )
+        for name, values in (("wait", wait_times), ("run", run_times)):
+            for pct in (50, 95, 99):
+                status[f"{name}_p{pct}_ms"] = round(util.percentile(values, pct) * 1000, 2)
+        return status
+
+    def shutdown(self) -> None:
+        """Stops accepting new commands and cancels the ones that haven't started yet."""
+        self.closed = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+pool = CommandPool(
+    workers=models.env.offline_workers,
+    queue_size=models.env.offline_queue_size,
+    timeout=models.env.offline_timeout,
+)
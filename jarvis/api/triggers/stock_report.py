@@ -198,11 +198,7 @@ class Investment:
         with open(models.fileio.robinhood, "w") as static_file:
             static_file.write(rendered)
         self.logger.info("Static file '%s' has been generated.", models.fileio.robinhood)
-        with models.db.connection as connection:
-            cursor = connection.cursor()
-            cursor.execute("DELETE FROM robinhood;")
-            cursor.execute("INSERT or REPLACE INTO robinhood (summary) VALUES (?);", (summary,))
-            connection.commit()
+        writer.write("DELETE FROM robinhood;", ("INSERT or REPLACE INTO robinhood (summary) VALUES (?);", (summary,)))
         self.logger.info("Stored summary in database.")
 
     def report_gatherer(self) -> None:
@@ -221,6 +217,7 @@ if __name__ == "__main__":
 
     current_process().name = "StockReport"
     from jarvis.executors import crontab
+    from jarvis.modules.database import writer
     from jarvis.modules.logger import logger as main_logger
     from jarvis.modules.logger import multiprocessing_logger
     from jarvis.modules.models import models
@@ -8,7 +8,7 @@ from typing import Dict, List
 
 import pyvolume
 
-from jarvis.executors import files, word_match
+from jarvis.executors import alerts, word_match
 from jarvis.modules.audio import listener, speaker
 from jarvis.modules.conditions import conversation
 from jarvis.modules.logger import logger
@@ -16,42 +16,29 @@ from jarvis.modules.models import enums, models
 from jarvis.modules.utils import shared, support, util
 
 
-def check_overlap(new_alarm: Dict[str, str | bool], old_alarms: List[Dict[str, str | bool]]) -> bool:
+def check_overlap(alarm_time: datetime, day: str | None, repeat: bool) -> bool:
     """Checks to see if there is a possibility of an overlap.
 
     Args:
-        new_alarm: Current alarm formatted as a dict.
-        old_alarms: List of existing alarms.
+        alarm_time: Time of alarm as a datetime object.
+        day: Day of week when the alarm should be repeated.
+        repeat: Boolean flag if the alarm should be repeated every day.
 
     Returns:
         bool:
         Returns a True flag if it is an overlap.
     """
-    if new_alarm in old_alarms:
+    if alerts.alarm_exists(alarm_time=alarm_time, day=day, repeat=repeat):
         speaker.speak(text=f"You have a duplicate alarm {models.env.title}!")
         return True
-    for old_alarm in old_alarms:
-        # old alarm is set for the same time and the old alarm is set for everyday
-        difference = abs(
-            (
-                datetime.strptime(old_alarm["alarm_time"], "%I:%M %p")
-                - datetime.strptime(new_alarm["alarm_time"], "%I:%M %p")
-            ).total_seconds()
+    # check if there is a daily alarm within the number of minutes an alarm will play
+    if old_alarm := alerts.overlapping_alarm(alarm_time=alarm_time):
+        logger.info("Alarm overlaps with an existing daily alarm: %s", old_alarm)
+        speaker.speak(
+            text=f"You have an existing alarm, at {old_alarm['alarm_time']} "
+            f"that overlaps with this one {models.env.title}!"
         )
-        # check if alarm time are the same or overlaps within 230 seconds (number of seconds an alarm will play)
-        # check if the alarm is set daily ('repeat' is 'True' but 'day' is null)
-        if (
-            (new_alarm["alarm_time"] == old_alarm["alarm_time"] or difference <= 203)
-            and old_alarm["repeat"]
-            and not old_alarm.get("day")
-        ):
-            if difference <= 203:  # within 203 seconds of an existing alarm
-                logger.info("Difference between both the alarms in seconds: %.2f", difference)
-            speaker.speak(
-                text=f"You have an existing alarm, at {old_alarm['alarm_time']} "
-                f"that overlaps with this one {models.env.title}!"
-            )
-            return True
+        return True
     return False
 
 
@@ -62,7 +49,7 @@ def create_alarm(
     repeat: bool = False,
     day: str = None,
 ) -> None:
-    """Creates an entry in the alarms' mapping file.
+    """Creates an entry in the alarms' table.
 
     Args:
         alarm_time: Time of alarm as a datetime object.
@@ -71,18 +58,9 @@ def create_alarm(
         repeat: Boolean flag if the alarm should be repeated every day.
         day: Day of week when the alarm should be repeated.
     """
-    existing_alarms = files.get_alarms()
-    formatted = dict(
-        alarm_time=alarm_time.strftime("%I:%M %p"),
-        day=day,
-        repeat=repeat,
-    )
-    if not day:
-        formatted.pop("day")
-    if check_overlap(new_alarm=formatted, old_alarms=existing_alarms):
+    if check_overlap(alarm_time=alarm_time, day=day, repeat=repeat):
         return
-    existing_alarms.append(formatted)
-    files.put_alarms(data=existing_alarms)
+    alerts.add_alarm(alarm_time=alarm_time, day=day, repeat=repeat)
     logger.info("Alarm/timer set at {%s}", alarm_time.strftime("%I:%M %p"))
     if "wake" in phrase:
         speaker.speak(
@@ -203,7 +181,7 @@ def set_alarm(phrase: str) -> None:
                 speaker.speak(text=f"You don't have any alarms set {models.env.title}!")
             return
         speaker.speak(text=f"Please tell me a time {models.env.title}!")
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             return
         speaker.speak(run=True)
         if converted := listener.listen():
@@ -220,9 +198,7 @@ def get_alarm_state(alarm_time: str = None) -> List[str]:
         List[str]:
         Returns a list of alarms framed as a response.
     """
-    _alarms = files.get_alarms()
-    if alarm_time:
-        _alarms = [_alarm for _alarm in _alarms if _alarm["alarm_time"] == alarm_time]
+    _alarms = alerts.get_alarms(alarm_time=alarm_time)
     response = []
     for _alarm in _alarms:
         if _alarm["repeat"]:
@@ -272,8 +248,7 @@ def more_than_one_alarm_to_kill(alarms: List[Dict[str, str | bool]], phrase: str
                 )
             else:
                 speaker.speak(text=f"Your alarm at {del_alarm['alarm_time']} " f"has been silenced {models.env.title}!")
-            alarms.remove(del_alarm)
-            files.put_alarms(alarms)
+            alerts.delete_alarms(ids=[del_alarm["id"]])
         else:
             speaker.speak(text=f"There are no such alarms setup {models.env.title}!")
     else:
@@ -284,13 +259,13 @@ def more_than_one_alarm_to_kill(alarms: List[Dict[str, str | bool]], phrase: str
 
 
 def kill_alarm(phrase: str) -> None:
-    """Removes the entry from the alarms' mapping file.
+    """Removes the entry from the alarms' table.
 
     Args:
         phrase: Takes the phrase spoken as an argument.
     """
     word = "timer" if "timer" in phrase else "alarm"
-    alarms = files.get_alarms()
+    alarms = alerts.get_alarms()
     if not alarms:
         speaker.speak(text=f"You have no {word}s set {models.env.title}!")
         return
@@ -301,13 +276,11 @@ def kill_alarm(phrase: str) -> None:
             response += f"on every {_alarm.get('day', 'day')} "
         response += f"has been silenced {models.env.title}!"
         speaker.speak(text=response)
-        alarms.clear()
-        files.put_alarms(data=alarms)
+        alerts.delete_alarms()
         return
     if "all" in phrase.split():
         speaker.speak(text=f"I have silenced {len(alarms)} of your alarms {models.env.title}!")
-        alarms.clear()
-        files.put_alarms(data=alarms)
+        alerts.delete_alarms()
         return
     if extracted_time := util.extract_time(input_=phrase) or word_match.word_match(
         phrase=phrase, match_list=("noon", "midnight", "mid night")
@@ -327,7 +300,7 @@ def kill_alarm(phrase: str) -> None:
                     more_than_one_alarm_to_kill(alarms, phrase, alarm_states)
                     return
                 response = f"Your alarm at {alarm_states[0]} has been silenced {models.env.title}!"
-                files.put_alarms(data=[_alarm for _alarm in alarms if _alarm["alarm_time"] != chosen_alarm])
+                alerts.delete_alarms(ids=[_alarm["id"] for _alarm in alarms if _alarm["alarm_time"] == chosen_alarm])
                 speaker.speak(text=response)
             else:
                 speaker.speak(text=f"There are no such alarms setup {models.env.title}!")
@@ -0,0 +1,447 @@
+# noinspection PyUnresolvedReferences
+"""Module for storing alarms and reminders in the base DB.
+
+>>> Alerts
+
+See Also:
+    - | Alarms and reminders are stored with the minute of the day they are due, along with the weekday for alarms
+      | and the date for reminders, which are indexed so that each tick is a single lookup.
+    - | Each tick looks up the entries that are due in the window since the previous tick, so a delayed tick is not
+      | missed.
+    - | Previous tick is persisted in the ``ticks`` table, so the entries that were due while Jarvis was stopped or the
+      | host was suspended are caught up after a restart, within a day.
+    - | Reminders that were missed by more than a day are beyond the catch-up window, so they are looked up separately
+      | and handled as misfires, instead of being left in the ``reminders`` table forever.
+    - | Entries that are late by more than ``MISFIRE_GRACE`` seconds are logged, and either fired late or skipped as
+      | per the ``MISFIRE_POLICY``.
+    - | Alarms and reminders from the YAML files are imported once during start up, in a single transaction that skips
+      | the entries which were already imported.
+"""
+
+import os
+import sqlite3
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Tuple
+
+from jarvis.executors import files
+from jarvis.modules.database import writer
+from jarvis.modules.logger import logger
+from jarvis.modules.models import enums, models
+
+# Number of minutes within which an alarm overlaps with an existing daily alarm (an alarm plays for 200 seconds)
+OVERLAP_MINUTES = 3
+# Duration within which the entries that were due since the previous tick are caught up
+CATCH_UP = timedelta(days=1)
+
+
+def minute_of_day(time_: datetime) -> int:
+    """Get the minute of the day for a datetime object.
+
+    Args:
+        time_: Datetime object.
+
+    Returns:
+        int:
+        Returns the number of minutes since midnight.
+    """
+    return time_.hour * 60 + time_.minute
+
+
+def previous_tick(cursor: sqlite3.Cursor, name: str, now: datetime) -> datetime:
+    """Get the previous tick from the base DB, which is the start of the window to look up.
+
+    Args:
+        cursor: Cursor object to read the previous tick.
+        name: Name of the tick, to track the previous tick for alarms and reminders separately.
+        now: Datetime object representing the current tick.
+
+    See Also:
+        - | Previous tick is always read from the base DB, since it could have been advanced by another process that
+          | was running the background tasks in the meantime.
+
+    Returns:
+        datetime:
+        Returns the previous tick, or the previous minute for the first tick.
+    """
+    if row := cursor.execute("SELECT stamp FROM ticks WHERE name=?;", (name,)).fetchone():
+        # A gap is capped to a day, so that a tick looks up at most two dates
+        return max(datetime.fromtimestamp(row[0]), now - CATCH_UP)
+    return now - timedelta(minutes=1)
+
+
+def windows(since: datetime, now: datetime) -> List[Tuple[date, int, int]]:
+    """Get the windows of minutes that have elapsed since the previous tick, split by date.
+
+    Args:
+        since: Datetime object representing the previous tick.
+        now: Datetime object representing the current tick.
+
+    Returns:
+        List[Tuple[date, int, int]]:
+        Returns a list of tuples with the date, and the start (exclusive) and end (inclusive) minute of the day.
+    """
+    segments = []
+    day = since.date()
+    while since < now and day <= now.date():
+        start = minute_of_day(since) if day == since.date() else -1
+        end = minute_of_day(now) if day == now.date() else 1439
+        segments.append((day, start, end))
+        day += timedelta(days=1)
+    return segments
+
+
+def advance_tick(name: str, tick: datetime, statement: writer.Statement) -> None:
+    """Stores the current tick along with the deletes of the entries that are due, within the same transaction.
+
+    Args:
+        name: Name of the tick.
+        tick: Datetime object representing the current tick.
+        statement: Statement to delete the entries that are due.
+
+    See Also:
+        - Tick is not advanced if the transaction fails, so that the same window is looked up again in the next tick.
+    """
+    writer.write(("INSERT OR REPLACE INTO ticks (name, stamp) VALUES (?,?);", (name, tick.timestamp())), statement)
+
+
+def misfired(kind: str, entry: str, due: datetime, now: datetime) -> bool:
+    """Logs an entry that is late by more than the grace period, and checks whether it has to be skipped.
+
+    Args:
+        kind: Kind of the entry, alarm or reminder.
+        entry: Description of the entry.
+        due: Datetime object representing the time when the entry was due.
+        now: Datetime object representing the current time.
+
+    Returns:
+        bool:
+        Returns a boolean flag to indicate whether the entry has to be skipped.
+    """
+    late = now - due
+    if late.total_seconds() <= models.env.misfire_grace:
+        return False
+    if models.env.misfire_policy == enums.MisfirePolicy.skip:
+        logger.warning("Skipping %s %s, which was due at %s", kind, entry, due)
+        return True
+    logger.warning("Firing %s %s late by %s, which was due at %s", kind, entry, late, due)
+    return False
+
+
+def due_at(day: date, minute: int) -> datetime:
+    """Get the datetime for the minute of the day on a given date.
+
+    Args:
+        day: Date object.
+        minute: Number of minutes since midnight.
+
+    Returns:
+        datetime:
+        Returns the datetime object.
+    """
+    return datetime.combine(day, time(hour=minute // 60, minute=minute % 60))
+
+
+def _alarm_dict(rowid: int, alarm_time: str, day: str | None, repeat: int) -> Dict[str, int | str | bool]:
+    """Frames the alarm as a dictionary, in the same format as it was stored in the YAML file.
+
+    Args:
+        rowid: ID of the alarm.
+        alarm_time: Alarm time in the format ``%I:%M %p``.
+        day: Day of the week, if the alarm is repeated on a particular day.
+        repeat: Flag to indicate whether the alarm is repeated.
+
+    Returns:
+        Dict[str, int | str | bool]:
+        Returns the alarm as a dictionary.
+    """
+    alarm = dict(id=rowid, alarm_time=alarm_time, day=day, repeat=bool(repeat))
+    if not day:
+        alarm.pop("day")
+    return alarm
+
+
+def get_alarms(alarm_time: str = None) -> List[Dict[str, int | str | bool]]:
+    """Get all the alarms, or the alarms set for a particular time.
+
+    Args:
+        alarm_time: Alarm time in the format ``%I:%M %p``.
+
+    Returns:
+        List[Dict[str, int | str | bool]]:
+        Returns a list of alarms ordered by the time of the day.
+    """
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        if alarm_time:
+            rows = cursor.execute(
+                "SELECT rowid, alarm_time, day, repeat FROM alarms WHERE alarm_time=? ORDER BY minute;", (alarm_time,)
+            ).fetchall()
+        else:
+            rows = cursor.execute("SELECT rowid, alarm_time, day, repeat FROM alarms ORDER BY minute;").fetchall()
+    return [_alarm_dict(*row) for row in rows]
+
+
+def alarm_exists(alarm_time: datetime, day: str | None, repeat: bool) -> bool:
+    """Checks if an identical alarm exists.
+
+    Args:
+        alarm_time: Time of alarm as a datetime object.
+        day: Day of the week, if the alarm is repeated on a particular day.
+        repeat: Flag to indicate whether the alarm is repeated.
+
+    Returns:
+        bool:
+        Returns a boolean flag to indicate whether the alarm exists.
+    """
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        return bool(
+            cursor.execute(
+                "SELECT 1 FROM alarms WHERE minute=? AND day IS ? AND repeat=? LIMIT 1;",
+                (minute_of_day(alarm_time), day, int(repeat)),
+            ).fetchone()
+        )
+
+
+def overlapping_alarm(alarm_time: datetime) -> Dict[str, int | str | bool] | None:
+    """Get an existing daily alarm that overlaps with the given alarm time.
+
+    Args:
+        alarm_time: Time of alarm as a datetime object.
+
+    Returns:
+        Dict[str, int | str | bool]:
+        Returns the overlapping alarm, if any.
+    """
+    minute = minute_of_day(alarm_time)
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        row = cursor.execute(
+            "SELECT rowid, alarm_time, day, repeat FROM alarms "
+            "WHERE minute BETWEEN ? AND ? AND day IS NULL AND repeat=1 LIMIT 1;",
+            (minute - OVERLAP_MINUTES, minute + OVERLAP_MINUTES),
+        ).fetchone()
+    if row:
+        return _alarm_dict(*row)
+
+
+def add_alarm(alarm_time: datetime, day: str | None, repeat: bool) -> None:
+    """Stores a new alarm.
+
+    Args:
+        alarm_time: Time of alarm as a datetime object.
+        day: Day of the week, if the alarm is repeated on a particular day.
+        repeat: Flag to indicate whether the alarm is repeated.
+    """
+    writer.write(
+        (
+            "INSERT INTO alarms (alarm_time, minute, day, repeat) VALUES (?,?,?,?);",
+            (alarm_time.strftime("%I:%M %p"), minute_of_day(alarm_time), day, int(repeat)),
+        )
+    )
+
+
+def delete_alarms(ids: List[int] = None) -> None:
+    """Deletes the alarms with the given IDs, or all the alarms if IDs are not provided.
+
+    Args:
+        ids: List of alarm IDs.
+    """
+    if ids is None:
+        writer.write("DELETE FROM alarms;")
+    else:
+        writer.write(
+            writer.Statement(query="DELETE FROM alarms WHERE rowid=?;", params=[(id_,) for id_ in ids], many=True)
+        )
+
+
+def due_alarms(now: datetime) -> List[Dict[str, int | str | bool]]:
+    """Get the alarms that are due since the previous tick, and deletes the ones that are not repeated.
+
+    Args:
+        now: Datetime object representing the current time.
+
+    Returns:
+        List[Dict[str, int | str | bool]]:
+        Returns a list of alarms that are due, excluding the ones that were skipped as per the misfire policy.
+    """
+    tick = now.replace(second=0, microsecond=0)
+    due = {}
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        for day, start, end in windows(previous_tick(cursor, "alarms", tick), tick):
+            for row in cursor.execute(
+                "SELECT rowid, alarm_time, day, repeat, minute FROM alarms "
+                "WHERE minute > ? AND minute <= ? AND (day IS NULL OR day=?);",
+                (start, end, day.strftime("%A")),
+            ).fetchall():
+                # An alarm is fired only once per tick, even if the window spans across days, so the latest one is kept
+                due[row[0]] = row[:4], due_at(day, row[4])
+    once = [(rowid,) for (rowid, *_, repeat), _ in due.values() if not repeat]
+    advance_tick("alarms", tick, writer.Statement(query="DELETE FROM alarms WHERE rowid=?;", params=once, many=True))
+    return [_alarm_dict(*row) for row, due_time in due.values() if not misfired("alarm", row[1], due_time, now)]
+
+
+def get_reminders() -> List[Dict[str, int | str]]:
+    """Get all the reminders.
+
+    Returns:
+        List[Dict[str, int | str]]:
+        Returns a list of reminders ordered by the date and time.
+    """
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        rows = cursor.execute(
+            "SELECT rowid, name, message, date, reminder_time FROM reminders ORDER BY date, minute;"
+        ).fetchall()
+    return [dict(zip(("id", "name", "message", "date", "reminder_time"), row)) for row in rows]
+
+
+def reminder_exists(reminder_time: datetime, message: str, name: str | None) -> bool:
+    """Checks if an identical reminder exists.
+
+    Args:
+        reminder_time: Time of reminder as a datetime object.
+        message: Message to be reminded for.
+        name: Name of the contact to be reminded.
+
+    Returns:
+        bool:
+        Returns a boolean flag to indicate whether the reminder exists.
+    """
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        return bool(
+            cursor.execute(
+                "SELECT 1 FROM reminders WHERE date=? AND minute=? AND message=? AND name IS ? LIMIT 1;",
+                (reminder_time.date().isoformat(), minute_of_day(reminder_time), message, name),
+            ).fetchone()
+        )
+
+
+def add_reminder(reminder_time: datetime, message: str, name: str | None) -> None:
+    """Stores a new reminder.
+
+    Args:
+        reminder_time: Time of reminder as a datetime object.
+        message: Message to be reminded for.
+        name: Name of the contact to be reminded.
+    """
+    writer.write(
+        (
+            "INSERT INTO reminders (name, message, date, minute, reminder_time) VALUES (?,?,?,?,?);",
+            (
+                name,
+                message,
+                reminder_time.date().isoformat(),
+                minute_of_day(reminder_time),
+                reminder_time.strftime("%I:%M %p"),
+            ),
+        )
+    )
+
+
+def due_reminders(now: datetime) -> List[Dict[str, int | str]]:
+    """Get the reminders that are due since the previous tick, and deletes them.
+
+    Args:
+        now: Datetime object representing the current time.
+
+    Returns:
+        List[Dict[str, int | str]]:
+        Returns a list of reminders that are due, excluding the ones that were skipped as per the misfire policy.
+
+    See Also:
+        - | Reminders that were due before the catch-up duration are included too, since they are never in a window,
+          | and are either fired late or skipped as per the misfire policy.
+    """
+    tick = now.replace(second=0, microsecond=0)
+    cap = tick - CATCH_UP
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        # Reminders missed by more than the catch-up duration are never in a window, so they are handled as misfires
+        due = [
+            (row[:5], due_at(date.fromisoformat(row[3]), row[5]))
+            for row in cursor.execute(
+                "SELECT rowid, name, message, date, reminder_time, minute FROM reminders "
+                "WHERE date < ? OR (date = ? AND minute <= ?) ORDER BY date, minute;",
+                (cap.date().isoformat(), cap.date().isoformat(), minute_of_day(cap)),
+            ).fetchall()
+        ]
+        for day, start, end in windows(previous_tick(cursor, "reminders", tick), tick):
+            due.extend(
+                (row[:5], due_at(day, row[5]))
+                for row in cursor.execute(
+                    "SELECT rowid, name, message, date, reminder_time, minute FROM reminders "
+                    "WHERE date=? AND minute > ? AND minute <= ?;",
+                    (day.isoformat(), start, end),
+                ).fetchall()
+            )
+    advance_tick(
+        "reminders",
+        tick,
+        writer.Statement(query="DELETE FROM reminders WHERE rowid=?;", params=[(row[0],) for row, _ in due], many=True),
+    )
+    return [
+        dict(zip(("id", "name", "message", "date", "reminder_time"), row))
+        for row, due_time in due
+        if not misfired("reminder", repr(row[2]), due_time, now)
+    ]
+
+
+def migrate() -> None:
+    """Imports the alarms and reminders from the YAML files, which are removed after a successful import.
+
+    See Also:
+        - | Entries are imported in a single transaction, and an entry is skipped if an identical one exists, so that
+          | the import can be re-run safely when it was interrupted before the YAML files were removed.
+    """
+    statements = []
+    if alarms := files.get_alarms():
+        params = []
+        for alarm in alarms:
+            alarm_time = datetime.strptime(alarm["alarm_time"], "%I:%M %p")
+            key = (minute_of_day(alarm_time), alarm.get("day"), int(alarm.get("repeat", False)))
+            params.append((alarm_time.strftime("%I:%M %p"), *key, *key))
+        statements.append(
+            writer.Statement(
+                query="INSERT INTO alarms (alarm_time, minute, day, repeat) SELECT ?,?,?,? "
+                "WHERE NOT EXISTS (SELECT 1 FROM alarms WHERE minute=? AND day IS ? AND repeat=?);",
+                params=params,
+                many=True,
+            )
+        )
+    if reminders := files.get_reminders():
+        params = []
+        for reminder in reminders:
+            reminder_time = datetime.combine(
+                datetime.strptime(str(reminder["date"]), "%Y-%m-%d").date(),
+                datetime.strptime(reminder["reminder_time"], "%I:%M %p").time(),
+            )
+            key = (
+                reminder_time.date().isoformat(),
+                minute_of_day(reminder_time),
+                reminder["message"],
+                reminder.get("name"),
+            )
+            params.append((*key, reminder_time.strftime("%I:%M %p"), *key))
+        statements.append(
+            writer.Statement(
+                query="INSERT INTO reminders (date, minute, message, name, reminder_time) SELECT ?,?,?,?,? "
+                "WHERE NOT EXISTS (SELECT 1 FROM reminders WHERE date=? AND minute=? AND message=? AND name IS ?);",
+                params=params,
+                many=True,
+            )
+        )
+    if statements:
+        result = writer.write(*statements)
+        logger.info(
+            "Imported %d of %d alarms and reminders from %s and %s",
+            result.rowcount,
+            len(alarms or []) + len(reminders or []),
+            models.fileio.alarms,
+            models.fileio.reminders,
+        )
+    for filepath in (models.fileio.alarms, models.fileio.reminders):
+        if os.path.isfile(filepath):
+            files.delete(filepath)
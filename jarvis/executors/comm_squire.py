@@ -127,7 +127,7 @@ def initiate_sms(body: str, to: str | int) -> None:
         speaker.speak(text=f"I don't think that's a right number {models.env.title}! Phone numbers are 10 digits.")
         return
 
-    if number and shared.called_by_offline:  # Number is present and called by offline
+    if number and shared.context().called_by_offline:  # Number is present and called by offline
         logger.info("'{body}' -> '{number}'".format(body=body, number=number))
         sms_response = communicator.send_sms(
             user=models.env.gmail_user,
@@ -140,7 +140,7 @@ def initiate_sms(body: str, to: str | int) -> None:
         else:
             speaker.speak(text=f"I'm sorry {models.env.title}! I wasn't able to send the email. " f"{sms_response}")
         return
-    elif shared.called_by_offline:  # Number is not present but called by offline
+    elif shared.context().called_by_offline:  # Number is not present but called by offline
         speaker.speak(text="SMS format should be::send some message to some number or name using sms or email.")
         return
     if not number:  # Number is not present
@@ -189,7 +189,7 @@ def initiate_email(body: str, to: str) -> None:
         support.no_env_vars()
         return
 
-    if body and shared.called_by_offline:  # Body is present and called by offline
+    if body and shared.context().called_by_offline:  # Body is present and called by offline
         logger.info("'%s' -> '%s'", body, to)
         mail_response = communicator.send_email(body=body, recipient=to)
         if mail_response is True:
@@ -197,7 +197,7 @@ def initiate_email(body: str, to: str) -> None:
         else:
             speaker.speak(text=f"I'm sorry {models.env.title}! I wasn't able to send the email. " f"{mail_response}")
         return
-    elif shared.called_by_offline:  # Number is not present but called by offline
+    elif shared.context().called_by_offline:  # Number is not present but called by offline
         speaker.speak(text="Email format should be::send some message to some email address.")
         return
 
@@ -1,23 +1,21 @@
+import contextvars
 import random
-import time
-import traceback
 from threading import Thread
 from typing import Tuple
 
 from jarvis.executors import (
     conditions,
     controls,
+    delayed_tasks,
     listener_controls,
-    offline,
     others,
-    resource_tracker,
     word_match,
 )
 from jarvis.modules.audio import speaker
 from jarvis.modules.conditions import conversation, keywords
 from jarvis.modules.logger import logger
 from jarvis.modules.models import models
-from jarvis.modules.utils import shared, support, util
+from jarvis.modules.utils import latency, shared, support, util
 
 
 def split_phrase(phrase: str) -> None:
@@ -36,28 +34,14 @@ def split_phrase(phrase: str) -> None:
     if " and " in phrase and not word_match.word_match(phrase=phrase, match_list=keywords.ignore_and):
         and_phrases = phrase.split(" and ")
         logger.info("Looping through %s in iterations.", and_phrases)
+        # Voice commands are executed serially, since executors may prompt for follow-ups through the microphone
         for each in and_phrases:
-            conditions.conditions(phrase=each.strip())
+            with latency.span("dispatch"):
+                conditions.conditions(phrase=each.strip())
             speaker.speak(run=True)
     else:
-        conditions.conditions(phrase=phrase.strip())
-
-
-def delay_condition(phrase: str, delay: int | float) -> None:
-    """Delays the execution after sleeping for the said time, after which it is sent to ``offline_communicator``.
-
-    Args:
-        phrase: Takes the phrase spoken as an argument.
-        delay: Sleeps for the number of seconds.
-    """
-    logger.info("'%s' will be executed after %s", phrase, support.time_converter(second=delay))
-    time.sleep(delay)
-    logger.info("Executing '%s'", phrase)
-    try:
-        offline.communicator(command=phrase)
-    except Exception as error:
-        logger.error(error)
-        logger.error(traceback.format_exc())
+        with latency.span("dispatch"):
+            conditions.conditions(phrase=phrase.strip())
 
 
 def timed_delay(phrase: str) -> Tuple[str, int | float] | None:
@@ -76,7 +60,7 @@ def timed_delay(phrase: str) -> Tuple[str, int | float] | None:
         split_ = phrase.split("after")
         if task := split_[0].strip():
             delay = util.delay_calculator(phrase=split_[1].strip())
-            resource_tracker.semaphores(delay_condition, kwargs={"phrase": task, "delay": delay})
+            delayed_tasks.schedule(command=task, delay=delay)
             return task, delay
     return None
 
@@ -117,7 +101,7 @@ def initiator(phrase: str = None) -> None:
         if (event := others.celebrate()) and "night" not in phrase.lower():
             speaker.speak(text=f"Happy {event}!")
         if "night" in phrase.split() or "goodnight" in phrase.split():
-            Thread(target=controls.sleep_control).start()
+            Thread(target=contextvars.copy_context().run, args=(controls.sleep_control,)).start()
     elif "you there" in phrase.lower() or word_match.word_match(phrase=phrase, match_list=models.env.wake_words):
         if not listener_controls.get_listener_state():
             speaker.speak(text=inactive_msg)
@@ -27,7 +27,7 @@ def read_gmail(*args) -> None:
     reader = gmailconnector.ReadEmail(gmail_user=models.env.gmail_user, gmail_pass=models.env.gmail_pass)
     response = reader.instantiate()
     if response.ok:
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             speaker.speak(
                 text=f"You have {response.count} unread email {models.env.title}."
             ) if response.count == 1 else speaker.speak(
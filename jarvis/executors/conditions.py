@@ -17,7 +17,7 @@ from jarvis.modules.conditions import keywords
 from jarvis.modules.logger import logger
 from jarvis.modules.models import enums, models
 from jarvis.modules.transformer import gpt
-from jarvis.modules.utils import shared, support
+from jarvis.modules.utils import latency, shared, support
 
 
 def conditions(phrase: str) -> None:
@@ -34,7 +34,7 @@ def conditions(phrase: str) -> None:
     """
     # Allow conditions during offline communication
     if (
-        not shared.called_by_offline
+        not shared.context().called_by_offline
         and not listener_controls.get_listener_state()
         # WATCH OUT: "activate" and "enable" are hard coded
         and not all(
@@ -50,64 +50,58 @@ def conditions(phrase: str) -> None:
         others.abusive(phrase)
         return
 
-    function_map = functions.function_mapping()
-    if shared.called_by_offline and restrictions.restricted(phrase=phrase):
+    dispatch = functions.registry.get()
+    # compiled index yields only the categories that word_match would have matched, in the same order
+    matches = list(word_match.intents.matches(phrase=phrase, mapping=keywords.keywords))
+    categories = [category for category, _ in matches]
+    if shared.context().called_by_offline and restrictions.restricted(phrase=phrase, categories=categories):
         return
-    if custom_conditions.custom_conditions(phrase=phrase, function_map=function_map):
+    if custom_conditions.custom_conditions(phrase=phrase, function_map=functions.registry.functions):
         return
 
-    for category, identifiers in keywords.keywords.items():
-        if matched := word_match.word_match(phrase=phrase, match_list=identifiers):
-            logger.debug("'%s' matched the category '%s'", matched, category)
+    for category, matched in matches:
+        logger.debug("'%s' matched the category '%s'", matched, category)
 
-            # custom rules for additional keyword matching
-            if category == "send_notification":
-                if "send" not in phrase.lower():
-                    continue
-            if category in ("distance", "kill"):
-                if word_match.word_match(phrase=phrase, match_list=keywords.keywords["avoid"]):
-                    continue
-            if category == "speed_test":
-                if not ("internet" in phrase.lower() or "connection" in phrase.lower() or "run" in phrase.lower()):
-                    continue
-
-            # Stand alone - Internally used [skip for both main and offline processes]
-            if category in ("avoid", "ok", "exit_", "secrets"):
+        # custom rules for additional keyword matching
+        if category == "send_notification":
+            if "send" not in phrase.lower():
+                continue
+        if category in ("distance", "kill"):
+            if word_match.word_match(phrase=phrase, match_list=keywords.keywords["avoid"]):
+                continue
+        if category == "speed_test":
+            if not ("internet" in phrase.lower() or "connection" in phrase.lower() or "run" in phrase.lower()):
                 continue
 
-            # Requires manual intervention [skip for offline communicator]
-            if shared.called_by_offline and category in (
-                "kill",
-                "report",
-                "repeat",
-                "directions",
-                "notes",
-                "faces",
-                "music",
-                "voice_changer",
-                "restart_control",
-                "shutdown",
-            ):
-                if models.settings.pname == enums.ProcessNames.jarvis_api and category == "restart_control":
-                    logger.info(
-                        "Allowing '%s' through the category '%s', for the process: '%s'",
-                        phrase,
-                        category,
-                        models.settings.pname,
-                    )
-                else:
-                    static_responses.not_allowed_offline()
-                    return
+        # Stand alone - Internally used [skip for both main and offline processes]
+        if category in ("avoid", "ok", "exit_", "secrets"):
+            continue
 
-            if function_map.get(category):  # keyword category matches function name
-                # call function with phrase as arg by default
-                method.executor(function_map[category], phrase)
-                if category in ("sleep_control", "sentry"):
-                    return
+        entry = dispatch[category]
+        # Requires manual intervention [skip for offline communicator]
+        if shared.context().called_by_offline and category in functions.OFFLINE_DISALLOWED:
+            if entry.offline:
+                logger.info(
+                    "Allowing '%s' through the category '%s', for the process: '%s'",
+                    phrase,
+                    category,
+                    models.settings.pname,
+                )
             else:
-                # edge case scenario if a category has matched but the function name is incorrect or not imported
-                warnings.warn("Condition matched for '%s' but there is not function to call." % category)
-            return
+                static_responses.not_allowed_offline()
+                return
+
+        if entry.func:  # keyword category matches function name
+            latency.categorize(category)
+            # call function with phrase as arg by default
+            with latency.span("executor"):
+                method.executor(entry.func, phrase)
+            if category in ("sleep_control", "sentry"):
+                return
+        else:
+            # edge case scenario if a category has matched but the function name is incorrect or not imported
+            warnings.warn("Condition matched for '%s' but there is not function to call." % category)
+        return
     # GPT instance available only for communicable processes
     if models.settings.pname not in (
         enums.ProcessNames.jarvis,
@@ -117,10 +111,12 @@ def conditions(phrase: str) -> None:
         return
     logger.info("Received unrecognized lookup parameter: %s", phrase)
     Thread(target=support.unrecognized_dumper, args=[{"CONDITIONS": phrase}]).start()
-    if not unconditional.google_maps(query=phrase):
-        if gpt.instance:
-            gpt.instance.query(phrase=phrase)
-        elif response := gpt.existing_response(request=phrase):
-            speaker.speak(text=response)
-        else:
-            static_responses.un_processable()
+    latency.categorize("unrecognized")
+    with latency.span("executor"):
+        if not unconditional.google_maps(query=phrase):
+            if gpt.instance:
+                gpt.instance.query(phrase=phrase)
+            elif response := gpt.existing_response(request=phrase):
+                speaker.speak(text=response)
+            else:
+                static_responses.un_processable()
@@ -15,10 +15,11 @@ import pywslocker
 from jarvis.executors import alarm, files, listener_controls, remind, volume, word_match
 from jarvis.modules.audio import listener, speaker, voices
 from jarvis.modules.conditions import conversation, keywords
+from jarvis.modules.database import writer
 from jarvis.modules.exceptions import StopSignal
 from jarvis.modules.logger import logger
 from jarvis.modules.models import enums, models
-from jarvis.modules.utils import shared, support, util
+from jarvis.modules.utils import control_plane, shared, support, util
 
 
 def restart(ask: bool = True) -> None:
@@ -126,13 +127,8 @@ def db_restart_entry(caller: enums.ProcessNames) -> None:
         caller: ProcessName enum that has to be restarted.
     """
     logger.debug("Adding restart entry into the DB for: %s", caller)
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute(
-            "INSERT or REPLACE INTO restart (flag, caller) VALUES (?,?);",
-            (True, caller.value),
-        )
-        cursor.connection.commit()
+    writer.write(("INSERT or REPLACE INTO restart (flag, caller) VALUES (?,?);", (True, caller.value)))
+    control_plane.notify()
 
 
 def restart_control(phrase: str = None, quiet: bool = False) -> None:
@@ -147,7 +143,7 @@ def restart_control(phrase: str = None, quiet: bool = False) -> None:
         logger.info("Restarting '%s'", caller)
         db_restart_entry(caller=caller)
         return
-    if shared.called_by_offline:
+    if shared.context().called_by_offline:
         if phrase:
             if "all" in phrase.lower().split():
                 logger.info("Restarting all background processes!")
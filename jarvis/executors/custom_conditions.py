@@ -3,9 +3,8 @@ from collections import OrderedDict
 from typing import Callable
 
 from jarvis.executors import files, method
-from jarvis.modules.audio import speaker
 from jarvis.modules.logger import logger
-from jarvis.modules.utils import shared, util
+from jarvis.modules.utils import util
 
 
 def custom_conditions(phrase: str, function_map: OrderedDict[str, Callable]) -> bool:
@@ -25,24 +24,13 @@ def custom_conditions(phrase: str, function_map: OrderedDict[str, Callable]) ->
         closest_match["ratio"],
     )
     executed = False
-    if shared.called_by_offline:
-        response = ""
-        for function_, task_ in task_map.items():
-            if function_map.get(function_):
-                executed = True
-                method.executor(function_map[function_], task_)
-                response += shared.text_spoken + "\n"
-            else:
-                warnings.warn("Custom condition map was found with incorrect function name: '%s'" % function_)
-        if response:
-            speaker.speak(text=response)
-    else:
-        for function_, task_ in task_map.items():
-            if function_map.get(function_):
-                executed = True
-                method.executor(function_map[function_], task_)
-            else:
-                warnings.warn("Custom condition map was found with incorrect function name: '%s'" % function_)
+    # Responses of each function are collected by the request context, when called by the offline communicator
+    for function_, task_ in task_map.items():
+        if function_map.get(function_):
+            executed = True
+            method.executor(function_map[function_], task_)
+        else:
+            warnings.warn("Custom condition map was found with incorrect function name: '%s'" % function_)
     if executed:
         return True
     logger.debug("Custom map was present but did not match with the current request.")
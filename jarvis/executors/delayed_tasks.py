@@ -0,0 +1,167 @@
+# noinspection PyUnresolvedReferences
+"""Module for the scheduler that executes delayed commands, such as "turn off the lights after 30 minutes".
+
+>>> DelayedTasks
+
+See Also:
+    - Delayed commands are persisted in the ``delayed`` table of the base DB, so they survive a restart.
+    - | A single thread in the main process holds the pending commands in a heap ordered by the due time,
+      | and sleeps until the earliest one is due, or until another process schedules or cancels a command.
+    - Commands are claimed by deleting the row before execution, so a cancelled command is never executed.
+"""
+
+import heapq
+import threading
+import time
+import traceback
+from typing import List, Tuple
+
+from jarvis.executors import offline
+from jarvis.modules.database import writer
+from jarvis.modules.logger import logger
+from jarvis.modules.models import models
+from jarvis.modules.utils import control_plane, support
+
+RECONCILE_INTERVAL = 60
+RETRY_INTERVAL = 5
+
+
+def schedule(command: str, delay: int | float) -> int:
+    """Stores the command in the base DB and notifies the scheduler.
+
+    Args:
+        command: Command that has to be executed.
+        delay: Number of seconds to wait before executing the command.
+
+    Returns:
+        int:
+        Returns the ID of the delayed task.
+    """
+    result = writer.write(("INSERT INTO delayed (command, due) VALUES (?,?);", (command, time.time() + delay)))
+    task_id = result.lastrowid
+    logger.info("'%s' will be executed after %s", command, support.time_converter(second=delay))
+    control_plane.notify(signal=control_plane.SCHEDULE)
+    return task_id
+
+
+def pending() -> List[Tuple[int, str, float]]:
+    """Get the delayed tasks that are yet to be executed.
+
+    Returns:
+        List[Tuple[int, str, float]]:
+        Returns a list of tuples with the task ID, command and the due time as epoch, ordered by the due time.
+    """
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        return cursor.execute("SELECT rowid, command, due FROM delayed ORDER BY due;").fetchall()
+
+
+def cancel(task_id: int) -> bool:
+    """Cancels a delayed task.
+
+    Args:
+        task_id: ID of the delayed task.
+
+    Returns:
+        bool:
+        Returns a boolean flag to indicate whether the task was cancelled.
+    """
+    cancelled = writer.write(("DELETE FROM delayed WHERE rowid=?;", (task_id,))).rowcount
+    if cancelled:
+        logger.info("Cancelled delayed task: %d", task_id)
+        control_plane.notify(signal=control_plane.SCHEDULE)
+    return bool(cancelled)
+
+
+def claim(task_id: int) -> bool:
+    """Removes the delayed task from the base DB, before it is executed.
+
+    Args:
+        task_id: ID of the delayed task.
+
+    Returns:
+        bool:
+        Returns a boolean flag to indicate whether the task was still pending.
+    """
+    return bool(writer.write(("DELETE FROM delayed WHERE rowid=?;", (task_id,))).rowcount)
+
+
+def execute(command: str) -> None:
+    """Executes the delayed command via offline communicator.
+
+    Args:
+        command: Command that has to be executed.
+    """
+    logger.info("Executing '%s'", command)
+    try:
+        offline.communicator(command=command)
+    except Exception as error:
+        logger.error(error)
+        logger.error(traceback.format_exc())
+
+
+class Scheduler:
+    """Heap ordered scheduler for the delayed commands.
+
+    >>> Scheduler
+
+    See Also:
+        - The heap is re-built from the base DB when notified via the control plane, or every reconcile interval.
+        - Each pending command takes a single heap entry, regardless of the delay.
+        - Commands that were due while Jarvis was stopped, are executed immediately after a restart.
+    """
+
+    def __init__(self):
+        """Instantiates an empty heap."""
+        self.heap: List[Tuple[float, int, str]] = []
+        self.thread: threading.Thread | None = None
+
+    def load(self) -> None:
+        """Re-builds the heap from the delayed tasks stored in the base DB."""
+        self.heap = [(due, task_id, command) for task_id, command, due in pending()]
+        heapq.heapify(self.heap)
+
+    def dispatch(self) -> float:
+        """Claims and executes the commands that are due.
+
+        Returns:
+            float:
+            Returns the number of seconds to wait for the next command that is due.
+        """
+        now = time.time()
+        while self.heap and self.heap[0][0] <= now:
+            due, task_id, command = heapq.heappop(self.heap)
+            if not claim(task_id):
+                continue
+            if (late := now - due) > RECONCILE_INTERVAL:
+                logger.warning("Delayed task '%s' is late by %s", command, support.time_converter(second=late))
+            threading.Thread(target=execute, args=(command,), daemon=True).start()
+        return min(self.heap[0][0] - now, RECONCILE_INTERVAL) if self.heap else RECONCILE_INTERVAL
+
+    def run(self) -> None:
+        """Executes the commands that are due, and waits for the next one or a notification.
+
+        See Also:
+            - | Errors from the base DB (like a locked database) are logged, and the heap is re-built from the base DB
+              | after the retry interval, so a command that was popped but not claimed is picked up again.
+        """
+        while True:
+            try:
+                self.load()
+                timeout = self.dispatch()
+            except Exception as error:
+                logger.error(error)
+                logger.error(traceback.format_exc())
+                timeout = RETRY_INTERVAL
+            control_plane.scheduled.wait(timeout=timeout)
+            control_plane.scheduled.clear()
+
+    def start(self) -> None:
+        """Starts the scheduler in a daemon thread."""
+        if self.thread and self.thread.is_alive():
+            return
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+
+scheduler = Scheduler()
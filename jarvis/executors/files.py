@@ -1,6 +1,7 @@
 """Wrapper for frequently used mapping files."""
 
 import collections
+import copy
 import os
 import shutil
 import sys
@@ -8,7 +9,7 @@ import time
 import warnings
 from datetime import datetime
 from threading import Timer
-from typing import Any, DefaultDict, Dict, List, OrderedDict
+from typing import Any, DefaultDict, Dict, List, OrderedDict, Tuple
 
 import yaml
 from pydantic import ValidationError
@@ -17,6 +18,21 @@ from pydantic.v1 import DirectoryPath, FilePath
 from jarvis.modules.logger import logger
 from jarvis.modules.models import classes, models
 
+# LibYAML bindings are an order of magnitude faster than the pure-Python parser, when available
+Loader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
+# Parsed data for each filepath along with the (mtime, size, inode) signature of the file when it was parsed
+_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
+
+def invalidate(filepath: FilePath) -> None:
+    """Removes the parsed data for the given filepath from the cache.
+
+    Args:
+        filepath: YAML filepath to invalidate.
+    """
+    _cache.pop(str(filepath), None)
+
 
 def _loader(
     filepath: FilePath,
@@ -28,15 +44,28 @@ def _loader(
         filepath: YAML filepath to load.
         default: Default value if loading failed or file missing.
 
+    See Also:
+        - Parsed data is cached, and re-used as long as the file's modified time, size and inode remain the same.
+        - A copy of the cached data is returned, so that callers can modify it without affecting the cache.
+
     Returns:
         List[Any] | Dict[str, Any]:
         Returns the YAML data as a list or dict.
     """
     caller = sys._getframe(1).f_code.co_name  # noqa
+    key = str(filepath)
     try:
-        with open(filepath) as file:
-            return yaml.load(stream=file, Loader=yaml.FullLoader) or default
+        stat = os.stat(filepath)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if (cached := _cache.get(key)) and cached[0] == signature:
+            data = cached[1]
+        else:
+            with open(filepath) as file:
+                data = yaml.load(stream=file, Loader=Loader)
+            _cache[key] = (signature, data)
+        return copy.deepcopy(data) or default
     except (yaml.YAMLError, FileNotFoundError) as error:
+        invalidate(filepath)
         logger.debug(error)
         logger.debug("Caller: %s", caller)
     return default
@@ -56,9 +85,13 @@ def _dumper(
         indent: Indentation to maintain.
         sort_keys: Boolean flag to sort the keys.
     """
-    with open(filepath, "w") as file:
-        yaml.dump(data=data, stream=file, sort_keys=sort_keys, indent=indent)
-        file.flush()
+    try:
+        with open(filepath, "w") as file:
+            yaml.dump(data=data, stream=file, sort_keys=sort_keys, indent=indent)
+            file.flush()
+    finally:
+        # Invalidate after writing, so that a read in between does not cache the partially written file
+        invalidate(filepath)
 
 
 def get_contacts() -> Dict[str, Dict[str, str]] | DefaultDict[str, Dict[str, str]]:
@@ -74,15 +107,6 @@ def get_frequent() -> Dict[str, int]:
     return _loader(models.fileio.frequent, default={})
 
 
-def put_frequent(data: Dict[str, int]) -> None:
-    """Writes frequently used keywords into a mapping file.
-
-    Args:
-        data: Takes the mapping dictionary as an argument.
-    """
-    _dumper(models.fileio.frequent, data)
-
-
 def get_location() -> DefaultDict[str, Dict | float | bool]:
     """Reads the location file and returns the location data."""
     # noinspection PyTypeChecker
@@ -202,33 +226,15 @@ def get_processes() -> Dict[str, List[int | List[str]]]:
 
 
 def get_reminders() -> List[Dict[str, str]]:
-    """Get all reminders stored."""
+    """Get all reminders stored in the YAML file, prior to the base DB."""
     return _loader(models.fileio.reminders, default=[])
 
 
-def put_reminders(data: List[Dict[str, str]]) -> None:
-    """Dumps the reminder data into the respective YAML file.
-
-    Args:
-        data: Data to be dumped.
-    """
-    _dumper(models.fileio.reminders, data)
-
-
 def get_alarms() -> List[Dict[str, str | bool]]:
-    """Get all alarms stored."""
+    """Get all alarms stored in the YAML file, prior to the base DB."""
     return _loader(models.fileio.alarms, default=[])
 
 
-def put_alarms(data: List[Dict[str, str | bool]]) -> None:
-    """Dumps the alarm data into the respective YAML file.
-
-    Args:
-        data: Data to be dumped.
-    """
-    return _dumper(models.fileio.alarms, data)
-
-
 def get_recognizer() -> classes.RecognizerSettings:
     """Get the stored settings for speech recognition."""
     try:
@@ -278,6 +284,7 @@ def delete(path: FilePath | DirectoryPath) -> None:
     """
     logger.info("Removing %s", path)
     if os.path.isfile(path):
+        invalidate(path)
         os.remove(path)
     elif os.path.isdir(path):
         shutil.rmtree(path)
@@ -5,8 +5,11 @@
 
 """
 
+import os
 from collections import OrderedDict
-from typing import Callable
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Mapping, Tuple
 
 from jarvis.executors import (
     alarm,
@@ -18,6 +21,7 @@ from jarvis.executors import (
     date_time,
     display_functions,
     face,
+    files,
     github,
     guard,
     internet,
@@ -37,7 +41,24 @@ from jarvis.executors import (
     weather,
 )
 from jarvis.modules.audio import voices
+from jarvis.modules.conditions import keywords
+from jarvis.modules.logger import logger
 from jarvis.modules.meetings import events, ics_meetings
+from jarvis.modules.models import enums, models
+
+# Requires manual intervention [not allowed via offline communicator]
+OFFLINE_DISALLOWED = (
+    "kill",
+    "report",
+    "repeat",
+    "directions",
+    "notes",
+    "faces",
+    "music",
+    "voice_changer",
+    "restart_control",
+    "shutdown",
+)
 
 
 def function_mapping() -> OrderedDict[str, Callable]:
@@ -109,3 +130,83 @@ def function_mapping() -> OrderedDict[str, Callable]:
         whats_up=static_responses.whats_up,
         about_me=static_responses.about_me,
     )
+
+
+@dataclass(frozen=True)
+class Dispatch:
+    """Dispatch entry that pairs a keyword category with its callable and offline flags.
+
+    >>> Dispatch
+
+    """
+
+    category: str
+    func: Callable | None
+    offline: bool
+    restricted: bool
+
+
+class DispatchRegistry:
+    """Immutable dispatch table built once, and refreshed only when the keywords or restrictions change.
+
+    >>> DispatchRegistry
+
+    See Also:
+        - Keywords are refreshed when ``rewrite_keywords`` replaces the mapping object.
+        - Restrictions are refreshed when the modified time or size of the restrictions file changes.
+    """
+
+    def __init__(self):
+        """Instantiates an empty registry that gets built on first access."""
+        self.source: OrderedDict | None = None
+        self.stamp: Tuple[int, int] | None = None
+        self.entries: Mapping[str, Dispatch] = MappingProxyType({})
+        self.functions: Mapping[str, Callable] = MappingProxyType({})
+
+    @staticmethod
+    def _stamp() -> Tuple[int, int]:
+        """Returns the modified time and size of the restrictions file."""
+        try:
+            stat = os.stat(models.fileio.restrictions)
+        except FileNotFoundError:
+            return 0, 0
+        return stat.st_mtime_ns, stat.st_size
+
+    def build(self) -> None:
+        """Pairs each category with its callable, offline-allowed flag and restricted flag."""
+        source, stamp = keywords.keywords, self._stamp()
+        function_map = function_mapping()
+        restricted = set(files.get_restrictions())
+        entries = {}
+        for category in (*source.keys(), *function_map.keys()):
+            if category in entries:
+                continue
+            entries[category] = Dispatch(
+                category=category,
+                func=function_map.get(category),
+                offline=category not in OFFLINE_DISALLOWED
+                or (category == "restart_control" and models.settings.pname == enums.ProcessNames.jarvis_api),
+                restricted=category in restricted,
+            )
+        logger.debug("Dispatch registry built with %d categories, restricted: %s", len(entries), restricted)
+        # Assign all at once, so that concurrent readers never see a partially built registry
+        self.entries, self.functions = MappingProxyType(entries), MappingProxyType(function_map)
+        self.source, self.stamp = source, stamp
+
+    def invalidate(self) -> None:
+        """Forces the registry to be rebuilt on next access."""
+        self.source = None
+
+    def get(self) -> Mapping[str, Dispatch]:
+        """Returns the dispatch table, rebuilding it if the keywords or restrictions have changed.
+
+        Returns:
+            Mapping[str, Dispatch]:
+            Read-only mapping of category and the dispatch entry.
+        """
+        if keywords.keywords is not self.source or self._stamp() != self.stamp:
+            self.build()
+        return self.entries
+
+
+registry = DispatchRegistry()
@@ -9,9 +9,10 @@ from typing import Tuple
 import gmailconnector
 import jinja2
 
-from jarvis.executors import communicator, word_match
+from jarvis.executors import communicator, resource_tracker, word_match
 from jarvis.modules.audio import listener, speaker
 from jarvis.modules.conditions import keywords
+from jarvis.modules.database import writer
 from jarvis.modules.facenet import face
 from jarvis.modules.logger import logger, multiprocessing_logger
 from jarvis.modules.models import enums, models
@@ -48,23 +49,17 @@ def put_state(state: bool) -> None:
     Args:
         state: True or False flag to stop the security mode.
     """
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        # noinspection PySimplifyBooleanCheck
-        if state is True:
-            if shared.called_by_offline:
-                trigger = "GUARD_OFFLINE"
-            else:
-                trigger = "GUARD_VOICE"
-            logger.info("Enabling security mode.")
-            cursor.execute(
-                "INSERT or REPLACE INTO guard (state, trigger) VALUES (?,?);",
-                (1, trigger),
-            )
+    # noinspection PySimplifyBooleanCheck
+    if state is True:
+        if shared.context().called_by_offline:
+            trigger = "GUARD_OFFLINE"
         else:
-            logger.info("Disabling security mode.")
-            cursor.execute("DELETE FROM guard WHERE state = 1")
-        connection.commit()
+            trigger = "GUARD_VOICE"
+        logger.info("Enabling security mode.")
+        writer.write(("INSERT or REPLACE INTO guard (state, trigger) VALUES (?,?);", (1, trigger)))
+    else:
+        logger.info("Disabling security mode.")
+        writer.write("DELETE FROM guard WHERE state = 1")
     time.sleep(0.5)
 
 
@@ -109,14 +104,14 @@ def guard_disable(*args) -> None:
     """
     if state := get_state():
         if state[1] == "GUARD_OFFLINE":  # enabled via offline communicator
-            if shared.called_by_offline:  # disabled via offline communicator
+            if shared.context().called_by_offline:  # disabled via offline communicator
                 stop_and_respond(stop=True)
             else:
                 stop_and_respond(stop=False)
                 Timer(interval=3, function=politely_disable).start()
             return
         if state[1] == "GUARD_VOICE":
-            if shared.called_by_offline:
+            if shared.context().called_by_offline:
                 stop_and_respond(stop=False)
                 Timer(interval=3, function=politely_disable).start()
             else:
@@ -193,7 +188,7 @@ def guard_enable(*args) -> None:
         text=f"Enabled security mode {models.env.title}! I will look out for potential threats and keep you "
         f"posted. Have a nice {util.part_of_day()}, and enjoy yourself {models.env.title}!"
     )
-    if shared.called_by_offline:
+    if shared.context().called_by_offline:
         if models.settings.os == enums.SupportedPlatforms.linux:
             pname = (models.settings.pname or "offline communicator").replace("_", " ")
             speaker.speak(
@@ -202,11 +197,7 @@ def guard_enable(*args) -> None:
             return
         process = Process(target=security_runner)
         process.start()
-        with models.db.connection as connection:
-            cursor = connection.cursor()
-            cursor.execute("UPDATE children SET guard=null")
-            cursor.execute("INSERT or REPLACE INTO children (guard) VALUES (?);", (process.pid,))
-            connection.commit()
+        resource_tracker.register(pid=process.pid, category="guard", replace=True)
         return
     TRACE["status"] = True
     speaker.speak(run=True)
@@ -241,7 +241,7 @@ def speed_test(*args) -> None:
     download_process = Process(target=st.download, kwargs={"threads": threads_per_core})
     upload_process.start()
     download_process.start()
-    if not shared.called_by_offline:
+    if not shared.context().called_by_offline:
         speaker.speak(
             text=f"Starting speed test {models.env.title}! I.S.P: {isp}. Location: {city} {state}",
             run=True,
@@ -78,7 +78,7 @@ def locate_device(target_device: AppleDevice) -> None:
         return
     lookup = str(target_device).split(":")[0].strip()
     if device_location:
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             post_code = device_location.get("postcode", "").split("-")[0]
         else:
             post_code = '"'.join(list(device_location.get("postcode", "").split("-")[0]))
@@ -124,7 +124,7 @@ def locate(phrase: str) -> None:
             "Please check the logs for more information."
         )
         return
-    if shared.called_by_offline:
+    if shared.context().called_by_offline:
         locate_device(target_device=target_device)
         return
     logger.info("Locating your %s", target_device)
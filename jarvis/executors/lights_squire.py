@@ -3,7 +3,9 @@ from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Process
 from typing import List
 
+from jarvis.executors import resource_tracker
 from jarvis.modules.audio import speaker
+from jarvis.modules.database import writer
 from jarvis.modules.lights import preset_values, smart_lights
 from jarvis.modules.models import models
 from jarvis.modules.utils import support
@@ -98,24 +100,17 @@ def check_status() -> str | int | None:
 
 def remove_status() -> None:
     """Removes all entries from the ``party`` table."""
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute("DELETE FROM party")
-        connection.commit()
+    writer.write("DELETE FROM party")
 
 
 def update_status(process: Process) -> None:
-    """Update the ``children`` and ``party`` tables with process ID.
+    """Update the ``party`` table and the child processes' registry with process ID.
 
     Args:
         process: Process for which the PID has to be stored in database.
     """
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute("UPDATE children SET party=null")
-        cursor.execute("INSERT or REPLACE INTO party (pid) VALUES (?);", (process.pid,))
-        cursor.execute("INSERT or REPLACE INTO children (party) VALUES (?);", (process.pid,))
-        connection.commit()
+    writer.write(("INSERT or REPLACE INTO party (pid) VALUES (?);", (process.pid,)))
+    resource_tracker.register(pid=process.pid, category="party", replace=True)
 
 
 def party_mode(host: List[str], phrase: str) -> bool:
@@ -1,9 +1,7 @@
-import sqlite3
-
 from jarvis.modules.audio import speaker
+from jarvis.modules.database import writer
 from jarvis.modules.logger import logger
 from jarvis.modules.models import models
-from jarvis.modules.retry import retry
 
 
 def listener_control(phrase: str) -> None:
@@ -50,7 +48,6 @@ def get_listener_state() -> bool:
     return False
 
 
-@retry.retry(attempts=3, interval=2, exclude_exc=sqlite3.OperationalError)
 def put_listener_state(state: bool) -> None:
     """Updates the state of the listener.
 
@@ -59,12 +56,11 @@ def put_listener_state(state: bool) -> None:
     """
     logger.info("Current listener status: '%s'", get_listener_state())
     logger.info("Updating listener status to %s", state)
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute("DELETE FROM listener")
-        if state:
-            cursor.execute("INSERT or REPLACE INTO listener (state) VALUES (?);", (state,))
-            cursor.execute("UPDATE listener SET state=(?)", (state,))
-        else:
-            cursor.execute("UPDATE listener SET state=null")
-        connection.commit()
+    if state:
+        writer.write(
+            "DELETE FROM listener",
+            ("INSERT or REPLACE INTO listener (state) VALUES (?);", (state,)),
+            ("UPDATE listener SET state=(?)", (state,)),
+        )
+    else:
+        writer.write("DELETE FROM listener", "UPDATE listener SET state=null")
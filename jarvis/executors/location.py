@@ -154,7 +154,7 @@ def distance_controller(origin: str = None, destination: str = None) -> None:
         - If ``destination`` is None, Jarvis will ask for a destination from the user.
     """
     if not destination:
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             speaker.speak(
                 text="Please include destination in your request with a 'from' and 'to', and capitalized place name."
             )
@@ -226,7 +226,7 @@ def locate_places(phrase: str = None) -> None:
         before_keyword, keyword, after_keyword = phrase.partition(keyword)
         place = after_keyword.replace(" in", "").strip()
     if not place:
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             speaker.speak(text=f"I need a location to get you the details {models.env.title}!")
             return
         speaker.speak(text="Tell me the name of a place!", run=True)
@@ -265,12 +265,12 @@ def locate_places(phrase: str = None) -> None:
                 speaker.speak(text=f"{place} is in {city or county}, {state}")
             else:
                 speaker.speak(text=f"{place} is in {city or county}, {state}, in {country}")
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             return
         shared.called["locate_places"] = True
     except (TypeError, AttributeError):
         speaker.speak(text=f"{place} is not a real place on Earth {models.env.title}! Try again.")
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             return
         locate_places(phrase=None)
     distance_controller(origin=None, destination=place)
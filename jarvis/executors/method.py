@@ -12,7 +12,7 @@ def executor(func: Callable, phrase: str) -> None:
         phrase: Takes the phrase spoken as an argument.
     """
     # disable logging for background tasks, as they are meant run very frequently
-    if shared.called_by_bg_tasks:
+    if shared.context().called_by_bg_tasks:
         logger.propagate = False
         logger.disabled = True
         func(phrase)
@@ -1,3 +1,8 @@
+import contextvars
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
 import requests
 from pydantic import HttpUrl
 
@@ -34,28 +39,115 @@ def ondemand_offline_automation(task: str) -> str | None:
         return None
 
 
-def communicator(command: str, bg_flag: bool = False) -> str | HttpUrl:
-    """Initiates conditions after flipping ``status`` flag in ``called_by_offline`` dict which suppresses the speaker.
+def communicator(command: str, bg_flag: bool = False, ollama_timeout: int = None) -> str | HttpUrl:
+    """Initiates conditions in a request scoped context with ``called_by_offline`` flag which suppresses the speaker.
 
     Args:
         command: Takes the command that has to be executed as an argument.
         bg_flag: Takes the background flag caller as an argument.
+        ollama_timeout: Timeout for the Ollama model, overriding the env var for this request.
+
+    See Also:
+        - | Caller type and the responses are stored in a ``RequestContext`` that is local to the current thread or
+          | task, so multiple commands can be processed concurrently without reading each other's responses.
+        - Every response spoken during the command is returned, one per line.
 
     Returns:
         str:
         Response from Jarvis.
     """
-    shared.called_by_offline = True
-    shared.called_by_bg_tasks = bg_flag
-    if word_match.word_match(phrase=command, match_list=keywords.keywords["photo"]):
-        return others.photo()
-    # Call condition instead of split_phrase as the 'and' and 'also' filter will overwrite the first response
-    conditions.conditions(phrase=command)
-    shared.called_by_offline = False
-    shared.called_by_bg_tasks = False
-    if response := shared.text_spoken:
-        shared.text_spoken = None
-        return response
+    context = shared.RequestContext(called_by_offline=True, called_by_bg_tasks=bg_flag, ollama_timeout=ollama_timeout)
+    token = shared.request_context.set(context)
+    try:
+        if word_match.word_match(phrase=command, match_list=keywords.keywords["photo"]):
+            return others.photo()
+        # Call condition instead of split_phrase as the 'and' and 'also' filter will overwrite the first response
+        conditions.conditions(phrase=command)
+    finally:
+        shared.request_context.reset(token)
+    # Hand over the caller to the enclosing context, as it is used to name the audio file for the response
+    shared.context().offline_caller = context.offline_caller
+    # Commands that speak more than once, or execute multiple functions, respond with all that was spoken
+    if context.responses:
+        return "\n".join(context.responses)
     else:
         logger.error("Offline request failed for '%s'", command)
         return f"I was unable to process the request: {command}"
+
+
+compound_executor = ThreadPoolExecutor(
+    max_workers=models.env.offline_workers, thread_name_prefix="compound_communicator"
+)
+
+
+def compound_category(phrase: str) -> str | None:
+    """Get the keyword category that the phrase is likely to be dispatched to.
+
+    Args:
+        phrase: Takes the phrase as an argument.
+
+    Returns:
+        str:
+        Returns the first matching category that is not internally used, or ``None`` for unrecognized phrases.
+    """
+    for category, _ in word_match.intents.matches(phrase=phrase, mapping=keywords.keywords):
+        if category not in ("avoid", "ok", "exit_", "secrets"):
+            return category
+    return None
+
+
+def _compound_chain(chain: List[Tuple[int, str]], ollama_timeout: int = None) -> List[Tuple[int, str]]:
+    """Executes the commands in a chain one after the other.
+
+    Args:
+        chain: List of tuples with the position and the command.
+        ollama_timeout: Timeout for the Ollama model.
+
+    Returns:
+        List[Tuple[int, str]]:
+        Returns a list of tuples with the position and the response.
+    """
+    responses = []
+    for position, command in chain:
+        try:
+            responses.append((position, communicator(command=command, ollama_timeout=ollama_timeout)))
+        except Exception as error:
+            logger.error("Sub-command failed for '%s': %s", command, error)
+            logger.error(traceback.format_exc())
+            responses.append((position, "Jarvis failed to process the request."))
+    return responses
+
+
+def compound_communicator(phrases: List[str], ollama_timeout: int = None) -> List[str]:
+    """Executes the sub-commands of a compound phrase concurrently, while preserving the response order.
+
+    Args:
+        phrases: List of sub-commands split from the compound phrase.
+        ollama_timeout: Timeout for the Ollama model.
+
+    See Also:
+        - Sub-commands that match the same category are chained, and executed serially to avoid conflicting actions.
+        - Unrecognized sub-commands are chained together, since they share the same GPT instance.
+        - Chains for independent categories are executed concurrently, at the latency of the slowest chain.
+
+    Returns:
+        List[str]:
+        Returns the responses in the same order as the sub-commands.
+    """
+    chains: Dict[str | None, List[Tuple[int, str]]] = {}
+    for position, phrase in enumerate(phrases):
+        phrase = phrase.strip()
+        chains.setdefault(compound_category(phrase), []).append((position, phrase))
+    logger.info("Executing %d sub-commands in %d chains: %s", len(phrases), len(chains), chains)
+    if len(chains) == 1:
+        results = _compound_chain(chain=list(chains.values())[0], ollama_timeout=ollama_timeout)
+    else:
+        futures = [
+            compound_executor.submit(contextvars.copy_context().run, _compound_chain, chain, ollama_timeout)
+            for chain in chains.values()
+        ]
+        results = [result for future in futures for result in future.result()]
+    responses = [""] * len(phrases)
+    for position, response in results:
+        responses[position] = response
+    return responses
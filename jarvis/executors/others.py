@@ -52,7 +52,7 @@ def repeat(phrase: str) -> None:
             else:
                 speaker.speak(text=f"I heard {keyword}")
     else:
-        if text := shared.text_spoken:
+        if text := shared.context().text_spoken:
             if text.startswith(f"Sure {models.env.title}, "):
                 speaker.speak(text)
             else:
@@ -77,7 +77,7 @@ def apps(phrase: str) -> None:
     keyword = phrase.split()[-1] if phrase else None
     ignore = ["app", "application"]
     if not keyword or keyword in ignore:
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             speaker.speak(text=f"I need an app name to open {models.env.title}!")
             return
         speaker.speak(text=f"Which app shall I open {models.env.title}?", run=True)
@@ -171,7 +171,7 @@ def google_home(device: str = None, file: str = None) -> None:
         speaker.speak(f"I'm sorry {models.env.title}! I wasn't able to get the private IP address.")
         return
 
-    if not shared.called_by_offline:
+    if not shared.context().called_by_offline:
         speaker.speak(
             text=f"Scanning your IP range for Google Home devices {models.env.title}!",
             run=True,
@@ -243,7 +243,7 @@ def google_home(device: str = None, file: str = None) -> None:
 # noinspection PyUnusedLocal
 def flip_a_coin(*args) -> None:
     """Says ``heads`` or ``tails`` from a random choice."""
-    playsound(sound=models.indicators.coin, block=True) if not shared.called_by_offline else None
+    playsound(sound=models.indicators.coin, block=True) if not shared.context().called_by_offline else None
     speaker.speak(
         text=f"""{random.choice(['You got', 'It landed on',
                                  "It's"])} {random.choice(['heads', 'tails'])} {models.env.title}"""
@@ -289,7 +289,7 @@ def news(news_source: str = "fox") -> None:
         return
     speaker.speak(text="News around you!")
     speaker.speak(text=" ".join([article["title"] for article in all_articles["articles"]]))
-    if shared.called_by_offline:
+    if shared.context().called_by_offline:
         return
 
     if shared.called["report"]:
@@ -393,7 +393,7 @@ def photo(*args) -> str:
     facenet.capture_image(filename=filename)
     if os.path.isfile(filename):
         # don't show preview on screen if requested via offline
-        if not shared.called_by_offline:
+        if not shared.context().called_by_offline:
             if models.settings.os != enums.SupportedPlatforms.windows:
                 subprocess.call(["open", filename])
             else:
@@ -1,8 +1,10 @@
+import collections
 import sqlite3
 from multiprocessing import Process
 from typing import Dict, List
 
-from jarvis.executors import process_map
+from jarvis.executors import process_map, resource_tracker
+from jarvis.modules.database import writer
 from jarvis.modules.logger import logger
 from jarvis.modules.models import models
 from jarvis.modules.utils import shared, support, util
@@ -10,6 +12,7 @@ from jarvis.modules.utils import shared, support, util
 
 def clear_db() -> None:
     """Deletes entries from all databases except for the tables assigned to hold data forever."""
+    statements = []
     with models.db.connection as connection:
         cursor = connection.cursor()
         for attr in models.tables.model_fields:
@@ -24,7 +27,8 @@ def clear_db() -> None:
                 table,
                 util.matrix_to_flat_list([list(filter(None, d)) for d in data if any(d)]),
             )
-            cursor.execute(f"DELETE FROM {table.name}")
+            statements.append(f"DELETE FROM {table.name}")
+    writer.write(*statements)
 
 
 # noinspection LongLine
@@ -77,31 +81,31 @@ def start_processes(func_name: str = None) -> Process | Dict[str, Process]:
     return processes[func_name] if func_name else processes
 
 
-def stop_child_processes() -> None:
-    """Stops sub processes (for meetings and events) triggered by child processes."""
-    children: Dict[str, List[int]] = {}
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        for child in models.tables.children.columns:
-            try:
-                # Use f-string or %s as condition cannot be parametrized
-                data = cursor.execute(f"SELECT {child} FROM children").fetchall()
-                children[child]: List[int] = util.matrix_to_flat_list([list(filter(None, d)) for d in data if any(d)])
-            except sqlite3.OperationalError as error:
-                logger.warning(error)
-    # Include empty lists so logs have more information but will get skipped when looping anyway
-    logger.info(children)
-    for category, pids in children.items():
-        for pid in pids:
-            logger.debug("Stopping process [%s] with PID: %d", category, pid)
-            support.stop_process(pid=pid)
+def child_processes() -> List[int]:
+    """Get the sub processes (for meetings, events, crontab etc.) triggered by child processes, that are still running.
+
+    Returns:
+        List[int]:
+        Returns a list of process IDs.
+    """
+    children: Dict[str, List[int]] = collections.defaultdict(list)
+    try:
+        for pid, category, started_at in resource_tracker.registered():
+            # Skip the PIDs that have been re-used by another process, since the child has exited
+            if resource_tracker.alive(pid, started_at):
+                children[category].append(pid)
+    except sqlite3.OperationalError as error:
+        logger.warning(error)
+    logger.info(dict(children))
+    return [pid for pids in children.values() for pid in pids]
 
 
 def stop_processes(func_name: str = None) -> None:
-    """Stops all background processes initiated during startup and removes database source file."""
-    stop_child_processes() if not func_name else None
+    """Stops all background processes initiated during startup, along with the sub processes, in parallel."""
+    pids = [] if func_name else child_processes()
     for func, process in shared.processes.items():
         if func_name and func_name != func:
             continue
         logger.info("Stopping process [%s] with PID: %d", func, process.pid)
-        support.stop_process(pid=process.pid)
+        pids.append(process.pid)
+    support.stop_processes(pids=pids)
@@ -6,7 +6,7 @@ from typing import List
 
 import pynotification
 
-from jarvis.executors import communicator, files, word_match
+from jarvis.executors import alerts, communicator, files, word_match
 from jarvis.modules.audio import listener, speaker
 from jarvis.modules.conditions import conversation
 from jarvis.modules.logger import logger
@@ -23,7 +23,7 @@ def create_reminder(
     day: str = None,
     timer: str = None,
 ) -> None:
-    """Updates the reminder file to set a reminder.
+    """Updates the reminders' table to set a reminder.
 
     Args:
         reminder_time: Time of reminder as a datetime object.
@@ -33,20 +33,12 @@ def create_reminder(
         day: Day to include in the response.
         timer: Number of minutes/hours to reminder.
     """
-    existing_reminders = files.get_reminders()
     name = find_name(phrase)
-    formatted = dict(
-        name=name,
-        message=message,
-        date=reminder_time.date(),
-        reminder_time=reminder_time.strftime("%I:%M %p"),
-    )
-    name = name or "you"
-    if formatted in existing_reminders:
+    if alerts.reminder_exists(reminder_time=reminder_time, message=message, name=name):
         speaker.speak(text=f"You have a duplicate reminder {models.env.title}!")
         return
-    existing_reminders.append(formatted)
-    files.put_reminders(data=existing_reminders)
+    alerts.add_reminder(reminder_time=reminder_time, message=message, name=name)
+    name = name or "you"
     logger.info("Reminder created for '%s' at %s", message, reminder_time.strftime("%I:%M %p"))
     if timer:
         response = (
@@ -96,7 +88,7 @@ def get_reminder_state() -> List[str]:
         List[str]:
         Returns a list of reminders framed as a response.
     """
-    reminders = files.get_reminders()
+    reminders = alerts.get_reminders()
     response = []
     for reminder_ in reminders:
         if reminder_["name"]:
@@ -172,7 +164,7 @@ def reminder(phrase: str) -> None:
             )
             return
     if not (extracted_time := util.extract_time(input_=phrase)):
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             speaker.speak(text="Reminder format should be::Remind me to do something, at some time.")
             return
         speaker.speak(text=f"When do you want to be reminded {models.env.title}?", run=True)
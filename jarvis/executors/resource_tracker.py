@@ -1,8 +1,129 @@
+# noinspection PyUnresolvedReferences
+"""Registry of the child processes that are started outside the process mapping, to clean them up at shutdown.
+
+>>> ResourceTracker
+
+See Also:
+    - Each child process is stored as a row in the ``child_processes`` table, with its category, start time and parent.
+    - A reaper prunes the entries of processes that have exited, or whose PIDs have been re-used by another process.
+"""
+
+import os
+import threading
+import time
 from multiprocessing import Process
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
+import psutil
+
+from jarvis.modules.database import writer
+from jarvis.modules.logger import logger
 from jarvis.modules.models import models
 
+REAP_INTERVAL = 60
+# Tolerance in seconds between the start time stored, and the creation time reported by the OS
+CREATE_TIME_TOLERANCE = 2
+
+_reaper: threading.Thread | None = None
+
+
+def register(pid: int, category: str, parent: int = None, replace: bool = False) -> None:
+    """Stores the process ID of a child process in the registry.
+
+    Args:
+        pid: Process ID of the child process.
+        category: Category of the child process.
+        parent: Process ID of the parent process, defaults to the current process.
+        replace: Boolean flag to forget the existing entries in the same category.
+    """
+    try:
+        process = psutil.Process(pid=pid)
+        started_at, cmdline = process.create_time(), " ".join(process.cmdline())
+    except psutil.Error as error:
+        logger.debug(error)
+        started_at, cmdline = time.time(), None
+    statements = [("DELETE FROM child_processes WHERE category=?;", (category,))] if replace else []
+    statements.append(
+        (
+            "INSERT OR REPLACE INTO child_processes (pid, category, started_at, parent, cmdline) VALUES (?,?,?,?,?);",
+            (pid, category, started_at, parent or os.getpid(), cmdline),
+        )
+    )
+    writer.write(*statements)
+
+
+def registered(category: str = None) -> List[Tuple[int, str, float]]:
+    """Get the child processes stored in the registry.
+
+    Args:
+        category: Category of the child processes, defaults to all the categories.
+
+    Returns:
+        List[Tuple[int, str, float]]:
+        Returns a list of tuples with the process ID, category and the start time as epoch.
+    """
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        if category:
+            return cursor.execute(
+                "SELECT pid, category, started_at FROM child_processes WHERE category=?;", (category,)
+            ).fetchall()
+        return cursor.execute("SELECT pid, category, started_at FROM child_processes;").fetchall()
+
+
+def alive(pid: int, started_at: float) -> bool:
+    """Checks if the process is still running, and was not replaced by another process with the same PID.
+
+    Args:
+        pid: Process ID of the child process.
+        started_at: Start time of the child process as epoch.
+
+    Returns:
+        bool:
+        Returns a boolean flag to indicate whether the child process is still running.
+    """
+    try:
+        process = psutil.Process(pid=pid)
+        return (
+            process.is_running()
+            and process.status() != psutil.STATUS_ZOMBIE
+            and abs(process.create_time() - started_at) <= CREATE_TIME_TOLERANCE
+        )
+    except psutil.Error:
+        return False
+
+
+def reap() -> List[int]:
+    """Removes the child processes that are no longer running from the registry.
+
+    Returns:
+        List[int]:
+        Returns the list of process IDs that were removed.
+    """
+    if dead := [pid for pid, category, started_at in registered() if not alive(pid, started_at)]:
+        writer.write(writer.Statement("DELETE FROM child_processes WHERE pid=?;", [(pid,) for pid in dead], True))
+        logger.debug("Reaped %d child processes: %s", len(dead), dead)
+    return dead
+
+
+def reaper() -> None:
+    """Reaps the child processes in a forever loop."""
+    while True:
+        time.sleep(REAP_INTERVAL)
+        try:
+            reap()
+        except Exception as error:
+            logger.error(error)
+
+
+def start_reaper() -> None:
+    """Starts the reaper in a daemon thread."""
+    global _reaper
+    if _reaper and _reaper.is_alive():
+        return
+    _reaper = threading.Thread(target=reaper, daemon=True)
+    _reaper.start()
+
 
 def semaphores(
     fn: Callable,
@@ -20,7 +141,4 @@ def semaphores(
     """
     process = Process(target=fn, args=args or (), kwargs=kwargs or {}, daemon=daemon)
     process.start()
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute("INSERT INTO children (undefined) VALUES (?);", (process.pid,))
-        connection.commit()
+    register(pid=process.pid, category="undefined")
@@ -1,4 +1,5 @@
 import string
+from typing import List
 
 from jarvis.executors import files, functions, word_match
 from jarvis.modules.audio import speaker
@@ -9,27 +10,30 @@ from jarvis.modules.models import models
 from jarvis.modules.utils import util
 
 
-def restricted(phrase: str) -> bool:
+def restricted(phrase: str, categories: List[str] | None = None) -> bool:
     """Check if phrase matches the category that's restricted.
 
     Args:
         phrase: Takes the phrase spoken as an argument.
+        categories: Categories already matched for the phrase, to avoid scanning the keywords again.
 
     Returns:
         bool:
         Returns a boolean flag if the category (function name) is present in restricted functions.
     """
-    if not (restricted_functions := files.get_restrictions()):
+    dispatch = functions.registry.get()
+    if not any(entry.restricted for entry in dispatch.values()):
         logger.debug("No restrictions in place.")
         return False
-    for category, identifiers in keywords.keywords.items():
-        if word_match.word_match(phrase=phrase, match_list=identifiers):
-            if category in restricted_functions:
-                speaker.speak(
-                    text=f"I'm sorry {models.env.title}! "
-                    f"{string.capwords(category)} category is restricted via offline communicator."
-                )
-                return True
+    if categories is None:
+        categories = [category for category, _ in word_match.intents.matches(phrase, keywords.keywords)]
+    for category in categories:
+        if dispatch[category].restricted:
+            speaker.speak(
+                text=f"I'm sorry {models.env.title}! "
+                f"{string.capwords(category)} category is restricted via offline communicator."
+            )
+            return True
     return False
 
 
@@ -58,7 +62,7 @@ def get_func(phrase: str) -> str:
         func = phrase.split("release")[1].strip()
     else:
         raise InvalidArgument("Please specify a valid function name to add or remove restrictions.")
-    function_names = list(functions.function_mapping().keys())
+    function_names = [category for category, entry in functions.registry.get().items() if entry.func]
     if func in function_names:
         return func
     raise InvalidArgument(f"No such function present. Valid: {function_names}")
@@ -90,12 +94,14 @@ def handle_restrictions(phrase: str) -> str:
             return f"Restriction for {string.capwords(func)} is already in place {models.env.title}!"
         current_restrictions.append(func)
         files.put_restrictions(restrictions=current_restrictions)
+        functions.registry.invalidate()
         return f"{string.capwords(func)} has been added to restricted functions {models.env.title}!"
     if "release" in phrase or "remove" in phrase:
         func = get_func(phrase)
         if func in current_restrictions:
             current_restrictions.remove(func)
             files.put_restrictions(restrictions=current_restrictions)
+            functions.registry.invalidate()
             return f"{string.capwords(func)} has been removed from restricted functions {models.env.title}!"
         else:
             return f"Restriction for {string.capwords(func)} was never in place {models.env.title}!"
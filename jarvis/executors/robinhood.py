@@ -9,6 +9,7 @@ import robin_stocks.robinhood as rh
 from blockstdout import BlockPrint
 
 from jarvis.modules.audio import speaker
+from jarvis.modules.database import writer
 from jarvis.modules.exceptions import EgressErrors
 from jarvis.modules.logger import logger
 from jarvis.modules.models import models
@@ -145,9 +146,5 @@ def robinhood(*args) -> None:
         speaker.speak(text=f"I'm sorry {models.env.title}! I wasn't able to fetch your investment summary.")
         return
     speaker.speak(text=summary)
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute("DELETE FROM robinhood;")
-        cursor.execute("INSERT or REPLACE INTO robinhood (summary) VALUES (?);", (summary,))
-        connection.commit()
+    writer.write("DELETE FROM robinhood;", ("INSERT or REPLACE INTO robinhood (summary) VALUES (?);", (summary,)))
     logger.info("Stored summary in database.")
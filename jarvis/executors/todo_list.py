@@ -20,7 +20,7 @@ def todo(phrase: str) -> None:
     if "plan" in phrase.lower():
         get_todo()
         return
-    if shared.called_by_offline:
+    if shared.context().called_by_offline:
         speaker.speak(text="Todo actions are limited to live conversations.")
         return
     if "add" in phrase.lower():
@@ -48,7 +48,7 @@ def get_todo() -> None:
             # updates category if already found in result
             result[category] = result[category] + ", " + item
     if result:
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             speaker.speak(text=json.dumps(result))
             return
         speaker.speak(text="Your to-do items are")
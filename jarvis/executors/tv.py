@@ -193,7 +193,7 @@ def television(phrase: str) -> None:
             for _ in range(3):
                 with ThreadPoolExecutor(max_workers=len(tv_mac)) as executor:
                     executor.map(power_controller.send_packet, tv_mac)
-            if not shared.called_by_offline:
+            if not shared.context().called_by_offline:
                 speaker.speak(
                     text=f"Looks like your {target_tv} is powered off {models.env.title}! "
                     "Let me try to turn it back on!",
@@ -52,7 +52,7 @@ def volume(phrase: str = None, level: int = None) -> None:
         pyvolume.custom(level, logger)
         speaker_volume(level=level)
     else:
-        if shared.called_by_offline or "system" in phrase:
+        if shared.context().called_by_offline or "system" in phrase:
             pyvolume.custom(level, logger)
         else:
             speaker_volume(level=level)
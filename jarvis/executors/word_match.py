@@ -5,13 +5,44 @@
 
 """
 
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterator, List, Set, Tuple
+
+CACHE_SIZE = 512
+_preprocessed: Dict[int, Tuple[List | Tuple, int, Tuple[Tuple[str, str], ...], FrozenSet[str]]] = {}
+
+
+def preprocess(match_list: List | Tuple) -> Tuple[Tuple[Tuple[str, str], ...], FrozenSet[str]]:
+    """Lower-cases and splits the match list, memoized on the list's identity and its length.
+
+    Args:
+        match_list: List or tuple of words against which the phrase has to be checked.
+
+    See Also:
+        - Most callers pass the same static tuples and keyword lists, so the lookups below become set-membership checks.
+        - | A cache hit costs an identity and a length check, instead of hashing the content of the list.
+          | The cached entry holds a reference to the list, so that its identity is never re-used by another object.
+        - | Lists that are modified in place are re-processed when their length changes. Keyword lists are replaced
+          | as a whole when they are reloaded, so they are never edited in place with the same length.
+
+    Returns:
+        Tuple[Tuple[Tuple[str, str], ...], FrozenSet[str]]:
+        A tuple of the original and lower-cased word pairs, and the set of individual words in the match list.
+    """
+    if (cached := _preprocessed.get(id(match_list))) and cached[0] is match_list and cached[1] == len(match_list):
+        return cached[2], cached[3]
+    lowered = tuple((word, word.lower()) for word in match_list)
+    # extract multi worded conditions in match list
+    words = frozenset(split for _, word in lowered for split in word.split())
+    if len(_preprocessed) >= CACHE_SIZE:
+        _preprocessed.clear()
+    _preprocessed[id(match_list)] = (match_list, len(lowered), lowered, words)
+    return lowered, words
 
 
 def reverse_lookup(lookup: str, match_list: List | Tuple) -> str | None:
     """Returns the word in phrase that matches the one in given list."""
-    # extract multi worded conditions in match list
-    reverse = sum([w.lower().split() for w in match_list], [])
+    reverse = preprocess(match_list)[1]
     for word in lookup.split():  # loop through words in the phrase
         # check at least one word in phrase matches the multi worded condition
         if word in reverse:
@@ -19,10 +50,10 @@ def reverse_lookup(lookup: str, match_list: List | Tuple) -> str | None:
     return None
 
 
-def forward_lookup(lookup: str | List | Tuple, match_list: List | Tuple) -> str | None:
+def forward_lookup(lookup: str | List | Tuple | Set, match_list: List | Tuple) -> str | None:
     """Returns the word in list that matches with the phrase given as string or list."""
-    for word in match_list:
-        if word.lower() in lookup:
+    for word, lowered in preprocess(match_list)[0]:
+        if lowered in lookup:
             return word
     return None
 
@@ -43,10 +74,75 @@ def word_match(phrase: str, match_list: List | Tuple, strict: bool = False) -> s
         return None
     # simply check at least one string in the match list is present in phrase
     if strict:
-        lookup = phrase.lower().split()
+        lookup = set(phrase.lower().split())
         return forward_lookup(lookup, match_list)
     else:
         lookup = phrase.lower()
-        if (fl := forward_lookup(lookup, match_list)) and reverse_lookup(lookup, match_list):
+        # reverse lookup is a set-membership check, so it runs first to skip the substring scan for most phrases
+        if reverse_lookup(lookup, match_list) and (fl := forward_lookup(lookup, match_list)):
             return fl
     return None
+
+
+class IntentIndex:
+    """Inverted index of keyword tokens to their categories, compiled once per keywords mapping.
+
+    >>> IntentIndex
+
+    See Also:
+        - | Resolves the categories for a phrase in a single pass over the phrase tokens, instead of running
+          | ``word_match`` against every category in the keywords mapping.
+        - Candidates are yielded in the same order as the mapping, and the matched keyword is the same as ``word_match``
+        - The index is re-compiled when the keywords mapping is replaced, i.e., when ``rewrite_keywords`` reloads it.
+    """
+
+    def __init__(self):
+        """Instantiates the index with an empty source."""
+        self.source: OrderedDict | None = None
+        self.index: Tuple[Dict[str, List[int]], List[Tuple[str, List[str]]]] = ({}, [])
+
+    def compile(self, mapping: OrderedDict[str, List[str]]) -> None:
+        """Builds the token to category position lookup for the given mapping.
+
+        Args:
+            mapping: Ordered dictionary of category and keywords as key-value pairs.
+        """
+        tokens: Dict[str, List[int]] = {}
+        categories: List[Tuple[str, List[str]]] = []
+        for position, (category, identifiers) in enumerate(mapping.items()):
+            categories.append((category, identifiers or []))
+            for identifier in identifiers or []:
+                for token in identifier.lower().split():
+                    if position not in (bucket := tokens.setdefault(token, [])):
+                        bucket.append(position)
+        # Assign as a single object, so that concurrent readers never see a partially built index
+        self.index = (tokens, categories)
+        self.source = mapping
+
+    def matches(self, phrase: str, mapping: OrderedDict[str, List[str]]) -> Iterator[Tuple[str, str]]:
+        """Yields the categories matching the phrase, along with the matched keyword.
+
+        Args:
+            phrase: Takes the phrase spoken as an argument.
+            mapping: Ordered dictionary of category and keywords as key-value pairs.
+
+        Yields:
+            Tuple[str, str]:
+            Tuple of the category and the keyword that was matched, in the order of the mapping.
+        """
+        if mapping is not self.source:
+            self.compile(mapping)
+        if not phrase:
+            return
+        tokens, categories = self.index
+        lookup = phrase.lower()
+        candidates = set()
+        for word in lookup.split():
+            candidates.update(tokens.get(word, ()))
+        for position in sorted(candidates):
+            category, identifiers = categories[position]
+            if matched := forward_lookup(lookup, identifiers):
+                yield category, matched
+
+
+intents = IntentIndex()
@@ -11,19 +11,23 @@ from packaging.version import Version
 from playsound import playsound
 
 from jarvis.executors import (
+    alerts,
     commander,
     controls,
+    delayed_tasks,
     internet,
     listener_controls,
     location,
     processor,
+    resource_tracker,
 )
 from jarvis.modules.audio import listener, speaker
+from jarvis.modules.database import writer
 from jarvis.modules.exceptions import DependencyError, StopSignal
 from jarvis.modules.logger import custom_handler, logger
 from jarvis.modules.models import enums, models
 from jarvis.modules.peripherals import audio_engine
-from jarvis.modules.utils import shared, support
+from jarvis.modules.utils import control_plane, latency, shared, support, usage
 
 
 # noinspection PyUnresolvedReferences
@@ -113,23 +117,28 @@ class Activator:
             input_device_index=models.env.microphone_index,
         )
 
-    def executor(self) -> None:
-        """Calls the listener for actionable phrase and runs the speaker node for response."""
+    def executor(self, wake_word: float = None) -> None:
+        """Calls the listener for actionable phrase and runs the speaker node for response.
+
+        Args:
+            wake_word: Time taken in seconds to read and process the audio frame with the wake word.
+        """
         if listener_controls.get_listener_state():
             playsound(sound=models.indicators.acknowledgement, block=False)
         audio_engine.close(stream=self.audio_stream)
-        # No confidence during initiation since this will interrupt with listener state
-        if phrase := listener.listen(sound=False, no_conf=True):
-            try:
-                commander.initiator(phrase=phrase)
-            except Exception as error:
-                logger.critical(error)
-                logger.error(traceback.format_exc())
-                speaker.speak(
-                    text=f"I'm sorry {models.env.title}! I ran into an unknown error. "
-                    "Please check the logs for more information."
-                )
-            speaker.speak(run=True)
+        with latency.trace(wake_word=wake_word):
+            # No confidence during initiation since this will interrupt with listener state
+            if phrase := listener.listen(sound=False, no_conf=True):
+                try:
+                    commander.initiator(phrase=phrase)
+                except Exception as error:
+                    logger.critical(error)
+                    logger.error(traceback.format_exc())
+                    speaker.speak(
+                        text=f"I'm sorry {models.env.title}! I ran into an unknown error. "
+                        "Please check the logs for more information."
+                    )
+                speaker.speak(run=True)
         self.audio_stream = self.open_stream()
         support.write_screen(text=self.label)
 
@@ -138,6 +147,7 @@ class Activator:
         try:
             support.write_screen(text=self.label)
             while True:
+                frame_start = time.perf_counter()
                 result = self.detector.process(
                     pcm=struct.unpack_from(
                         "h" * self.detector.frame_length,
@@ -148,7 +158,10 @@ class Activator:
                     )
                 )
                 if result >= 0:
-                    self.executor()
+                    self.executor(wake_word=time.perf_counter() - frame_start)
+                # In-memory flag set by the control plane, so the base DB is not queried for every frame
+                if not control_plane.consume():
+                    continue
                 try:
                     restart_checker()
                     if flag := support.check_stop():
@@ -187,7 +200,11 @@ class Activator:
 def start() -> None:
     """Starts main process to activate Jarvis after checking internet connection and initiating background processes."""
     logger.info("Current Process ID: %d", models.settings.pid)
+    # Writer should be serving before child processes are started, so they inherit its address
+    writer.serve()
     controls.starter()
+    usage.migrate()
+    alerts.migrate()
     # Instantiate the object here, so validations go through first
     activator = Activator()
     if internet.private_ip() and internet.public_ip_info():
@@ -212,6 +229,10 @@ def start() -> None:
                     run=True,
                 )
     support.write_screen(text=f"Current Process ID: {models.settings.pid}\tCurrent Volume: {models.env.volume}")
+    # Control plane should be listening before child processes are started, so they inherit the port
+    control_plane.listen()
+    delayed_tasks.scheduler.start()
+    resource_tracker.start_reaper()
     shared.processes = processor.start_processes()
     location.write_current_location()
     activator.start()
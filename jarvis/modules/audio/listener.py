@@ -20,7 +20,7 @@ from jarvis.modules.audio import speaker, wave
 from jarvis.modules.exceptions import EgressErrors
 from jarvis.modules.logger import logger
 from jarvis.modules.models import enums, models
-from jarvis.modules.utils import shared, support
+from jarvis.modules.utils import latency, shared, support
 
 recognizer = Recognizer()
 spectrum = wave.Spectrum()
@@ -56,12 +56,14 @@ def listen(
     with microphone as source:
         try:
             spectrum.activate(sound=sound, timeout=timeout, phrase_time_limit=phrase_time_limit)
-            listened = recognizer.listen(source=source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+            with latency.span("capture"):
+                listened = recognizer.listen(source=source, timeout=timeout, phrase_time_limit=phrase_time_limit)
             spectrum.deactivate(sound=sound)
-            # noinspection PyUnresolvedReferences
-            recognized, confidence = recognizer.recognize_google(audio_data=listened, with_confidence=True)
+            with latency.span("recognition"):
+                # noinspection PyUnresolvedReferences
+                recognized, confidence = recognizer.recognize_google(audio_data=listened, with_confidence=True)
             # SafetyNet: Should never meet the condition for called by offline
-            if no_conf or shared.called_by_offline:
+            if no_conf or shared.context().called_by_offline:
                 logger.info(recognized)
                 return recognized
             logger.info("Recognized '%s' with a confidence rate '%.2f'", recognized, confidence)
@@ -8,18 +8,16 @@ import os
 import re
 import sys
 from datetime import datetime
-from threading import Thread
 from urllib.parse import urljoin
 
 import pynotification
 import requests
 from playsound import playsound
 
-from jarvis.executors import files
 from jarvis.modules.exceptions import EgressErrors
 from jarvis.modules.logger import logger
 from jarvis.modules.models import models
-from jarvis.modules.utils import shared, support
+from jarvis.modules.utils import latency, shared, support, usage
 
 
 def speech_synthesizer(
@@ -98,23 +96,27 @@ def speak(text: str = None, run: bool = False, block: bool = True) -> None:
         "conditions",
         "custom_conditions",
     ):
-        Thread(target=frequently_used, kwargs={"function_name": caller}).start()
+        usage.counter.increment(function_name=caller)
     if text:
         text = text.replace("\n", "\t").strip()
-        shared.text_spoken = text
-        if shared.called_by_offline:
+        shared.context().text_spoken = text
+        if shared.context().called_by_offline:
+            shared.context().responses.append(text)
             logger.debug("Speaker called by: '%s' with text: '%s'", caller, text)
-            shared.offline_caller = caller
+            shared.context().offline_caller = caller
             return
         logger.info("Response: %s", text)
         support.write_screen(text=text)
-        if (
-            models.env.speech_synthesis_timeout
-            and models.env.speech_synthesis_api
-            and speech_synthesizer(text=text)
-            and os.path.isfile(models.fileio.speech_synthesis_wav)
-        ):
-            playsound(sound=models.fileio.speech_synthesis_wav, block=block)
+        with latency.span("synthesis"):
+            synthesized = (
+                models.env.speech_synthesis_timeout
+                and models.env.speech_synthesis_api
+                and speech_synthesizer(text=text)
+                and os.path.isfile(models.fileio.speech_synthesis_wav)
+            )
+        if synthesized:
+            with latency.span("playback"):
+                playsound(sound=models.fileio.speech_synthesis_wav, block=block)
             os.remove(models.fileio.speech_synthesis_wav)
         elif models.AUDIO_DRIVER:
             models.AUDIO_DRIVER.say(text=text)
@@ -127,25 +129,7 @@ def speak(text: str = None, run: bool = False, block: bool = True) -> None:
                 dialog=True,
             )
             print(text)
-    if run and models.AUDIO_DRIVER and not shared.called_by_offline:
+    if run and models.AUDIO_DRIVER and not shared.context().called_by_offline:
         logger.debug("Speaker called by: '%s'", caller)
-        models.AUDIO_DRIVER.runAndWait()
-
-
-def frequently_used(function_name: str) -> None:
-    """Writes the function called and the number of times into a YAML file.
-
-    Args:
-        function_name: Name of the function that called the speaker.
-
-    See Also:
-        - This function does not have purpose, but to analyze and re-order the conditions' module at a later time.
-    """
-    data = files.get_frequent()
-    data = {k: v for k, v in data.items() if isinstance(v, int)}  # clean up
-    if data.get(function_name):
-        data[function_name] += 1
-    else:
-        data[function_name] = 1
-    data = {k: v for k, v in sorted(data.items(), key=lambda x: x[1], reverse=True)}  # sort by size
-    files.put_frequent(data=data)
+        with latency.span("playback"):
+            models.AUDIO_DRIVER.runAndWait()
@@ -32,9 +32,9 @@ def text_to_audio(text: str, filename: FilePath | str = None) -> FilePath | str
         This can be flaky at times as it relies on converting native wav to kernel specific wav format.
     """
     if not filename:
-        if shared.offline_caller:
-            filename = f"{shared.offline_caller}.wav"
-            shared.offline_caller = None  # Reset caller after using it
+        if shared.context().offline_caller:
+            filename = f"{shared.context().offline_caller}.wav"
+            shared.context().offline_caller = None  # Reset caller after using it
         else:
             filename = f"{int(time.time())}.wav"
     AUDIO_DRIVER.save_to_file(filename=filename, text=text)
@@ -53,7 +53,7 @@ class Spectrum:
             phrase_time_limit: Custom time limit for functions expecting a longer user input.
         """
         shared.widget_connection.send("start") if shared.widget_connection else None
-        if models.env.listener_spectrum_key and not shared.called_by_offline:
+        if models.env.listener_spectrum_key and not shared.context().called_by_offline:
             Thread(target=self.make_request, args=(self.ACTIVATE,), daemon=True).start()
         if sound:
             playsound(sound=models.indicators.start, block=False)
@@ -66,7 +66,7 @@ class Spectrum:
             sound: Flag whether to play the listener indicator sound. Defaults to True unless set to False.
         """
         shared.widget_connection.send("stop") if shared.widget_connection else None
-        if models.env.listener_spectrum_key and not shared.called_by_offline:
+        if models.env.listener_spectrum_key and not shared.context().called_by_offline:
             Thread(target=self.make_request, args=(self.DEACTIVATE,), daemon=True).start()
         if sound:
             playsound(sound=models.indicators.end, block=False)
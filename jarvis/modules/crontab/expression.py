@@ -7,7 +7,7 @@
 
 import calendar
 import datetime
-from typing import Tuple
+from typing import List, Tuple
 
 from jarvis.modules.exceptions import InvalidArgument
 
@@ -53,6 +53,8 @@ class CronExpression:
         range(1, 13),
     )
     DEFAULT_EPOCH = (1970, 1, 1, 0, 0, 0)
+    # Number of years to look ahead or behind for a fire time, which covers the leap year and weekday cycles
+    MAX_YEARS = 28
     SUBSTITUTIONS = {
         "@yearly": "0 0 1 1 *",
         "@annually": "0 0 1 1 *",
@@ -122,8 +124,14 @@ class CronExpression:
 
         Notes:
             This method should only be called by the user if the string_tab member is modified.
+
+        See Also:
+            - Static values of each field are also compiled into a bitmask, where bit ``n`` is set if ``n`` is valid.
+            - | Atoms with special characters (%, #, L, W) are context and epoch sensitive, so they are stored
+              | separately to be evaluated against each date.
         """
         self.numerical_tab = []
+        self.specials = []
 
         for field_str, span in zip(self.string_tab, self.FIELD_RANGES):
             split_field_str = field_str.split(",")
@@ -131,19 +139,150 @@ class CronExpression:
                 raise InvalidArgument('"*" must be alone in a field.')
 
             unified = set()
+            specials = []
             for cron_atom in split_field_str:
                 # parse_atom only handles static cases
                 for special_char in ("%", "#", "L", "W"):
                     if special_char in cron_atom:
+                        specials.append(cron_atom)
                         break
                 else:
                     unified.update(parse_atom(cron_atom, span))
 
             self.numerical_tab.append(unified)
+            self.specials.append(tuple(specials))
 
         if self.string_tab[2] == "*" and self.string_tab[4] != "*":
             self.numerical_tab[2] = set()
 
+        self.bitmasks = [sum(1 << value for value in values) for values in self.numerical_tab]
+        self.sorted_tab = [sorted(values) for values in self.numerical_tab]
+
+    def _atom_match(
+        self, index: int, cron_atom: str, value: int, delta_t: int, first_dow: int, day: int, last_dom: int
+    ) -> bool:
+        """Evaluates a context or epoch sensitive atom of a field.
+
+        Args:
+            index: Index of the field in the string tab.
+            cron_atom: Atom with a special character.
+            value: Value of the field at the given time.
+            delta_t: Time elapsed since the epoch, in the unit of the field.
+            first_dow: Day of the week, on the first day of the month.
+            day: Day of the month.
+            last_dom: Last day of the month.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the atom matches the given time.
+        """
+        field_type = self.FIELD_RANGES[index]
+        if cron_atom[0] == "%":
+            return not (delta_t % int(cron_atom[1:]))
+
+        elif field_type == self.DAYS_OF_WEEK and "#" in cron_atom:
+            d, n = int(cron_atom[0]), int(cron_atom[2])
+            # Computes Nth occurence of D day of the week
+            return (((d - first_dow) % 7) + 1 + 7 * (n - 1)) == day
+
+        elif field_type == self.DAYS_OF_MONTH and cron_atom[-1] == "W":
+            target = min(int(cron_atom[:-1]), last_dom)
+            lands_on = (first_dow + target - 1) % 7
+            if lands_on == 0:
+                # Shift from Sun. to Mon. unless Mon. is next month
+                target += 1 if target < last_dom else -2
+            elif lands_on == 6:
+                # Shift from Sat. to Fri. unless Fri. in prior month
+                target += -1 if target > 1 else 2
+
+            # Match if the day is correct, and target is a weekday
+            return target == day and (first_dow + target - 7) % 7 > 1
+
+        elif field_type in self.L_FIELDS and cron_atom.endswith("L"):
+            # In dom field, L means the last day of the month
+            target = last_dom
+
+            if field_type == self.DAYS_OF_WEEK:
+                # Calculates the last occurence of given day of week
+                desired_dow = int(cron_atom[:-1])
+                target = ((desired_dow - first_dow) % 7) + 29
+                target -= 7 if target > last_dom else 0
+
+            return target == day
+        return False
+
+    def _field_match(
+        self, index: int, value: int, delta_t: int, first_dow: int = 0, day: int = 0, last_dom: int = 0
+    ) -> bool:
+        """Checks if a value matches a field, using the bitmask before evaluating the special atoms.
+
+        Args:
+            index: Index of the field in the string tab.
+            value: Value of the field at the given time.
+            delta_t: Time elapsed since the epoch, in the unit of the field.
+            first_dow: Day of the week, on the first day of the month.
+            day: Day of the month.
+            last_dom: Last day of the month.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the field matches the given value.
+        """
+        if self.bitmasks[index] >> value & 1:
+            return True
+        for cron_atom in self.specials[index]:
+            if self._atom_match(index, cron_atom, value, delta_t, first_dow, day, last_dom):
+                return True
+        return False
+
+    def _date_match(self, date: datetime.date) -> bool:
+        """Checks if a date matches the day of month, month and day of week fields.
+
+        Args:
+            date: Date to be checked.
+
+        See Also:
+            - | When both day of month and day of week are restricted, the date matches if either one of them matches.
+              | See 2010.11.15 of CHANGELOG
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the given date matches the crontab entry.
+        """
+        year, month, day = date.year, date.month, date.day
+        mod_delta_mon = month - self.epoch[1] + (year - self.epoch[0]) * 12
+        if not self._field_match(3, month, mod_delta_mon):
+            return False
+        last_dom = calendar.monthrange(year, month)[-1]
+        # In calendar and datetime.date.weekday, Monday = 0
+        given_dow = (date.weekday() + 1) % 7
+        first_dow = (given_dow + 1 - day) % 7
+        mod_delta_day = (date - datetime.date(*self.epoch[:3])).days
+        if self._field_match(2, day, mod_delta_day, first_dow, day, last_dom):
+            return True
+        return self.string_tab[4] != "*" and self._field_match(4, given_dow, mod_delta_day, first_dow, day, last_dom)
+
+    def _candidates(self, index: int, date: datetime.date, utc_offset: int, hour: int = None) -> List[int]:
+        """Get the hours of a date, or the minutes of an hour that match the time fields, in ascending order.
+
+        Args:
+            index: Index of the field in the string tab, ``0`` for minutes and ``1`` for hours.
+            date: Date to get the candidates for.
+            utc_offset: UTC offset.
+            hour: Hour to get the minutes for.
+
+        Returns:
+            List[int]:
+            Returns a list of matching hours or minutes.
+        """
+        if not self.specials[index]:
+            return self.sorted_tab[index]
+        mod_delta_hrs = (date - datetime.date(*self.epoch[:3])).days * 24 - self.epoch[3] + utc_offset - self.epoch[5]
+        if index == 1:
+            return [value for value in range(24) if self._field_match(1, value, mod_delta_hrs + value)]
+        mod_delta_min = (mod_delta_hrs + hour) * 60 - self.epoch[4]
+        return [value for value in range(60) if self._field_match(0, value, mod_delta_min + value)]
+
     def check_trigger(
         self,
         date_tuple: Tuple[int, int, int, int, int] | Tuple[int, ...] = None,
@@ -167,97 +306,80 @@ class CronExpression:
         if date_tuple:
             year, month, day, hour, mins = date_tuple
         else:
-            year, month, day, hour, mins = tuple(map(int, datetime.datetime.now().strftime("%Y %m %d %H %M").split()))
+            now = datetime.datetime.now()
+            year, month, day, hour, mins = now.year, now.month, now.day, now.hour, now.minute
         given_date = datetime.date(year, month, day)
-        zeroday = datetime.date(*self.epoch[:3])
-        last_dom = calendar.monthrange(year, month)[-1]
-        dom_matched = True
-
-        # In calendar and datetime.date.weekday, Monday = 0
-        given_dow = (datetime.date.weekday(given_date) + 1) % 7
-        first_dow = (given_dow + 1 - day) % 7
 
         # Figure out how much time has passed from the epoch to the given date
-        utc_diff = utc_offset - self.epoch[5]
-        mod_delta_yrs = year - self.epoch[0]
-        mod_delta_mon = month - self.epoch[1] + mod_delta_yrs * 12
-        mod_delta_day = (given_date - zeroday).days
-        mod_delta_hrs = hour - self.epoch[3] + mod_delta_day * 24 + utc_diff
+        mod_delta_day = (given_date - datetime.date(*self.epoch[:3])).days
+        mod_delta_hrs = hour - self.epoch[3] + mod_delta_day * 24 + utc_offset - self.epoch[5]
         mod_delta_min = mins - self.epoch[4] + mod_delta_hrs * 60
-
-        # Makes iterating through like components easier.
-        quintuple = zip(
-            (mins, hour, day, month, given_dow),
-            self.numerical_tab,
-            self.string_tab,
-            (mod_delta_min, mod_delta_hrs, mod_delta_day, mod_delta_mon, mod_delta_day),
-            self.FIELD_RANGES,
+        return (
+            self._field_match(0, mins, mod_delta_min)
+            and self._field_match(1, hour, mod_delta_hrs)
+            and self._date_match(given_date)
         )
 
-        for value, valid_values, field_str, delta_t, field_type in quintuple:
-            # All valid, static values for the fields are stored in sets
-            if value in valid_values:
-                continue
-
-            # The following for loop implements the logic for context
-            # sensitive and epoch sensitive constraints. break statements,
-            # which are executed when a match is found, lead to a continue
-            # in the outer loop. If there are no matches found, the given date
-            # does not match expression constraints, so the function returns
-            # False as seen at the end of this for...else... construct.
-            for cron_atom in field_str.split(","):
-                if cron_atom[0] == "%":
-                    if not (delta_t % int(cron_atom[1:])):
-                        break
+    def next_fire_time(self, after: datetime.datetime = None, utc_offset: int = 0) -> datetime.datetime | None:
+        """Get the earliest time after the given time, when the trigger is active.
 
-                elif field_type == self.DAYS_OF_WEEK and "#" in cron_atom:
-                    d, n = int(cron_atom[0]), int(cron_atom[2])
-                    # Computes Nth occurence of D day of the week
-                    if (((d - first_dow) % 7) + 1 + 7 * (n - 1)) == day:
-                        break
+        Args:
+            after: Datetime object in the local time. Defaults to current.
+            utc_offset: UTC offset.
 
-                elif field_type == self.DAYS_OF_MONTH and cron_atom[-1] == "W":
-                    target = min(int(cron_atom[:-1]), last_dom)
-                    lands_on = (first_dow + target - 1) % 7
-                    if lands_on == 0:
-                        # Shift from Sun. to Mon. unless Mon. is next month
-                        target += 1 if target < last_dom else -2
-                    elif lands_on == 6:
-                        # Shift from Sat. to Fri. unless Fri. in prior month
-                        target += -1 if target > 1 else 2
-
-                    # Break if the day is correct, and target is a weekday
-                    if target == day and (first_dow + target - 7) % 7 > 1:
-                        break
+        Returns:
+            datetime.datetime:
+            Returns the next fire time, or ``None`` if the trigger is not active within ``MAX_YEARS`` years.
+        """
+        start = (after or datetime.datetime.now()).replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        date = start.date()
+        end = date + datetime.timedelta(days=366 * self.MAX_YEARS)
+        while date <= end:
+            if not self._date_match(date):
+                date += datetime.timedelta(days=1)
+                continue
+            first = date == start.date()
+            for hour in self._candidates(1, date, utc_offset):
+                if first and hour < start.hour:
+                    continue
+                for minute in self._candidates(0, date, utc_offset, hour):
+                    if first and hour == start.hour and minute < start.minute:
+                        continue
+                    return datetime.datetime(date.year, date.month, date.day, hour, minute)
+            date += datetime.timedelta(days=1)
+        return None
 
-                elif field_type in self.L_FIELDS and cron_atom.endswith("L"):
-                    # In dom field, L means the last day of the month
-                    target = last_dom
+    def prev_fire_time(self, before: datetime.datetime = None, utc_offset: int = 0) -> datetime.datetime | None:
+        """Get the latest time before the given time, when the trigger was active.
 
-                    if field_type == self.DAYS_OF_WEEK:
-                        # Calculates the last occurence of given day of week
-                        desired_dow = int(cron_atom[:-1])
-                        target = ((desired_dow - first_dow) % 7) + 29
-                        target -= 7 if target > last_dom else 0
+        Args:
+            before: Datetime object in the local time. Defaults to current.
+            utc_offset: UTC offset.
 
-                    if target == day:
-                        break
-            else:
-                # See 2010.11.15 of CHANGELOG
-                if field_type == self.DAYS_OF_MONTH and self.string_tab[4] != "*":
-                    dom_matched = False
+        Returns:
+            datetime.datetime:
+            Returns the previous fire time, or ``None`` if the trigger was not active within ``MAX_YEARS`` years.
+        """
+        before = before or datetime.datetime.now()
+        start = before.replace(second=0, microsecond=0)
+        if start == before:
+            start -= datetime.timedelta(minutes=1)
+        date = start.date()
+        end = date - datetime.timedelta(days=366 * self.MAX_YEARS)
+        while date >= end:
+            if not self._date_match(date):
+                date -= datetime.timedelta(days=1)
+                continue
+            first = date == start.date()
+            for hour in reversed(self._candidates(1, date, utc_offset)):
+                if first and hour > start.hour:
                     continue
-                elif field_type == self.DAYS_OF_WEEK and self.string_tab[2] != "*":
-                    # If we got here, then days of months validated so it does
-                    # not matter that days of the week failed.
-                    return dom_matched
-
-                # None of the expressions matched which means this field fails
-                return False
-
-        # Arriving at this point means the date landed within the constraints
-        # of all fields; the associated trigger should be fired.
-        return True
+                for minute in reversed(self._candidates(0, date, utc_offset, hour)):
+                    if first and hour == start.hour and minute > start.minute:
+                        continue
+                    return datetime.datetime(date.year, date.month, date.day, hour, minute)
+            date -= datetime.timedelta(days=1)
+        return None
 
 
 def parse_atom(parse: str, minmax: tuple) -> set | None:
@@ -333,3 +455,6 @@ if __name__ == "__main__":
 
     print(job.check_trigger((2022, 7, 27, 0, 0)))
     print(job.check_trigger((2022, 7, 26, 0, 0)))
+
+    print(job.next_fire_time(datetime.datetime(2022, 7, 26, 0, 0)))
+    print(job.prev_fire_time(datetime.datetime(2022, 7, 26, 0, 0)))
@@ -0,0 +1,308 @@
+# noinspection PyUnresolvedReferences
+"""This is a space for the single writer that coalesces writes to the base DB from all the processes.
+
+>>> Writer
+
+See Also:
+    - | Main process owns a writer thread with a dedicated connection, which drains all the queued writes and commits
+      | them in a single transaction, so that concurrent writers never contend for the lock on the base DB.
+    - Child processes send their writes to a loopback socket owned by the main process, and wait for the result.
+    - Each write runs within a savepoint, so that a failing write does not affect the rest of the batch.
+    - Writes fall back to a direct connection when the writer is unavailable.
+    - Reads go directly to the base DB, since readers are not blocked by the writer in WAL mode.
+"""
+
+import hmac  # noqa: F401
+import os
+import queue
+import sqlite3
+import threading
+from multiprocessing.connection import AuthenticationError, Client, Connection, Listener
+from typing import Any, Iterable, List, NamedTuple, Sequence, Tuple
+
+from jarvis.modules.logger import logger
+from jarvis.modules.models import models
+
+ENV_PORT = "JARVIS_WRITER_PORT"
+ENV_AUTHKEY = "JARVIS_WRITER_AUTHKEY"
+HOST = "127.0.0.1"
+MAX_BATCH = 256
+BACKLOG = 32
+
+
+class Statement(NamedTuple):
+    """Statement to be executed by the writer.
+
+    >>> Statement
+
+    """
+
+    query: str
+    params: Sequence[Any] | Iterable[Sequence[Any]] = ()
+    many: bool = False
+
+
+class Result(NamedTuple):
+    """Result of a write, with the row ID of the last insert and the number of rows modified.
+
+    >>> Result
+
+    """
+
+    lastrowid: int | None
+    rowcount: int
+
+
+class Request:
+    """Queued write along with the event that is set when it is committed.
+
+    >>> Request
+
+    """
+
+    def __init__(self, statements: Tuple[Statement, ...]):
+        """Instantiates the request.
+
+        Args:
+            statements: Statements to be executed within the same transaction.
+        """
+        self.statements = statements
+        self.done = threading.Event()
+        self.result: Result | None = None
+        self.error: BaseException | None = None
+
+
+def apply(cursor: sqlite3.Cursor, statements: Tuple[Statement, ...]) -> Result:
+    """Executes the statements using the given cursor.
+
+    Args:
+        cursor: Cursor object from sqlite3.Connection.
+        statements: Statements to be executed.
+
+    Returns:
+        Result:
+        Returns the row ID of the last insert, and the total number of rows modified.
+    """
+    lastrowid, rowcount = None, 0
+    for statement in statements:
+        if statement.many:
+            cursor.executemany(statement.query, statement.params)
+        else:
+            cursor.execute(statement.query, statement.params)
+        lastrowid = cursor.lastrowid
+        rowcount += max(cursor.rowcount, 0)
+    return Result(lastrowid=lastrowid, rowcount=rowcount)
+
+
+class Writer:
+    """Single writer for the base DB, that is served by the main process.
+
+    >>> Writer
+
+    """
+
+    def __init__(self, max_batch: int):
+        """Instantiates the writer.
+
+        Args:
+            max_batch: Maximum number of writes to commit in a single transaction.
+        """
+        self.max_batch = max_batch
+        self.queue: queue.Queue[Request] = queue.Queue()
+        self.pid: int | None = None
+        self.client: Connection | None = None
+        self.client_pid: int | None = None
+        self.lock = threading.Lock()
+
+    def serve(self) -> None:
+        """Starts the writer thread, and binds a listener on the loopback interface for the child processes.
+
+        See Also:
+            - Port number and the authentication key are exported as env vars, so that child processes can connect.
+        """
+        if self.pid == os.getpid():
+            return
+        # Handshake imports 'hmac' lazily, which would otherwise hold the import lock in the acceptor thread,
+        # and deadlock a child process that is forked in the meantime. So it is imported upfront at module level.
+        authkey = os.urandom(16)
+        listener = Listener(address=(HOST, 0), backlog=BACKLOG, authkey=authkey)
+        os.environ[ENV_PORT] = str(listener.address[1])
+        os.environ[ENV_AUTHKEY] = authkey.hex()
+        self.pid = os.getpid()
+        logger.info("Base DB writer listening on %s:%s", HOST, os.environ[ENV_PORT])
+        threading.Thread(target=self.writer, daemon=True).start()
+        threading.Thread(target=self.acceptor, args=(listener,), daemon=True).start()
+
+    def batch(self) -> List[Request]:
+        """Waits for a write, and drains the writes that were queued in the meantime.
+
+        Returns:
+            List[Request]:
+            Returns the list of requests to be committed together.
+        """
+        requests = [self.queue.get()]
+        while len(requests) < self.max_batch:
+            try:
+                requests.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return requests
+
+    def writer(self) -> None:
+        """Commits the queued writes in batches, in a forever loop."""
+        connection = models.db.connect()
+        # Transactions and savepoints are managed explicitly
+        connection.isolation_level = None
+        cursor = connection.cursor()
+        while True:
+            requests = self.batch()
+            try:
+                cursor.execute("BEGIN IMMEDIATE;")
+                for request in requests:
+                    cursor.execute("SAVEPOINT request;")
+                    try:
+                        request.result = apply(cursor, request.statements)
+                    except Exception as error:
+                        cursor.execute("ROLLBACK TO request;")
+                        request.error = error
+                    cursor.execute("RELEASE request;")
+                cursor.execute("COMMIT;")
+            except sqlite3.Error as error:
+                logger.error("Failed to commit %d writes: %s", len(requests), error)
+                if connection.in_transaction:
+                    connection.rollback()
+                for request in requests:
+                    request.result, request.error = None, error
+            for request in requests:
+                request.done.set()
+
+    def acceptor(self, listener: Listener) -> None:
+        """Accepts connections from the child processes, and serves each of them in a dedicated thread.
+
+        Args:
+            listener: Listener bound on the loopback interface.
+        """
+        while True:
+            try:
+                connection = listener.accept()
+            except (AuthenticationError, ConnectionError, EOFError) as error:
+                # Handshake failed for a single client
+                logger.warning(error)
+                continue
+            except OSError as error:
+                logger.error("Base DB writer stopped accepting connections: %s", error)
+                return
+            threading.Thread(target=self.handler, args=(connection,), daemon=True).start()
+
+    def handler(self, connection: Connection) -> None:
+        """Queues the writes received from a child process, and sends back the results.
+
+        Args:
+            connection: Connection to the child process.
+        """
+        with connection:
+            while True:
+                try:
+                    statements = connection.recv()
+                except (EOFError, OSError):
+                    return
+                request = self.submit(tuple(Statement(*statement) for statement in statements))
+                connection.send((request.result and tuple(request.result), request.error))
+
+    def submit(self, statements: Tuple[Statement, ...]) -> Request:
+        """Queues the statements for the writer thread, and waits for them to be committed.
+
+        Args:
+            statements: Statements to be executed within the same transaction.
+
+        Returns:
+            Request:
+            Returns the request with its result or error.
+        """
+        request = Request(statements=statements)
+        self.queue.put(request)
+        request.done.wait()
+        return request
+
+    def remote(self, statements: Tuple[Statement, ...]) -> Tuple[Result | None, BaseException | None] | None:
+        """Sends the statements to the writer owned by the main process.
+
+        Args:
+            statements: Statements to be executed within the same transaction.
+
+        Returns:
+            Tuple[Result | None, BaseException | None]:
+            Returns the result and the error, or ``None`` if the writer could not be reached.
+        """
+        if not (port := os.environ.get(ENV_PORT)):
+            return
+        with self.lock:
+            try:
+                if self.client is None or self.client_pid != os.getpid():
+                    # Connections inherited from the parent process are never re-used
+                    self.client = Client(address=(HOST, int(port)), authkey=bytes.fromhex(os.environ[ENV_AUTHKEY]))
+                    self.client_pid = os.getpid()
+                # Sent as plain tuples, so that the payload does not depend on the classes in this module
+                self.client.send([tuple(statement) for statement in statements])
+            except (OSError, ValueError, KeyError, AuthenticationError) as error:
+                logger.warning("Base DB writer is unavailable, writing directly: %s", error)
+                self.client = None
+                return
+            try:
+                result, error = self.client.recv()
+            except (EOFError, OSError) as error:
+                self.client = None
+                # The write may or may not have been committed, so it is not retried with a direct connection
+                raise sqlite3.OperationalError(f"connection to base DB writer was lost: {error}")
+            return result and Result(*result), error
+
+    def write(self, *statements: Statement | Tuple | str) -> Result:
+        """Executes the statements within a single transaction, through the writer if it is available.
+
+        Args:
+            *statements: Statements, or tuples of query and parameters, or queries without parameters.
+
+        Returns:
+            Result:
+            Returns the row ID of the last insert, and the total number of rows modified.
+
+        Raises:
+            sqlite3.Error:
+            Raises the error from the base DB, in which case none of the statements are committed.
+        """
+        statements = tuple(
+            Statement(statement) if isinstance(statement, str) else Statement(*statement) for statement in statements
+        )
+        if self.pid == os.getpid():
+            request = self.submit(statements)
+            response = request.result, request.error
+        else:
+            response = self.remote(statements)
+        if response is None:
+            with models.db.connection as connection:
+                return apply(connection.cursor(), statements)
+        result, error = response
+        if error:
+            raise error
+        return result
+
+
+writer = Writer(max_batch=MAX_BATCH)
+
+
+def serve() -> None:
+    """Starts serving the writes for all the processes, from the main process."""
+    writer.serve()
+
+
+def write(*statements: Statement | Tuple | str) -> Result:
+    """Executes the statements within a single transaction, through the writer if it is available.
+
+    Args:
+        *statements: Statements, or tuples of query and parameters, or queries without parameters.
+
+    Returns:
+        Result:
+        Returns the row ID of the last insert, and the total number of rows modified.
+    """
+    return writer.write(*statements)
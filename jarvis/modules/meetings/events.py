@@ -7,7 +7,6 @@
 
 import os
 import re
-import sqlite3
 import subprocess
 from datetime import datetime
 
@@ -19,31 +18,26 @@ import pynotification
 
 from jarvis.executors import resource_tracker
 from jarvis.modules.audio import speaker
+from jarvis.modules.database import writer
 from jarvis.modules.logger import logger
 from jarvis.modules.models import enums, models
-from jarvis.modules.retry import retry
 from jarvis.modules.utils import shared, util
 
 
-@retry.retry(attempts=3, interval=2, exclude_exc=sqlite3.OperationalError)
 def events_writer() -> None:
     """Gets return value from ``events_gatherer`` function and writes it to events table in the database.
 
     This function runs in a dedicated process to avoid wait time when events information is requested.
     """
     info = events_gatherer()
-    query = (
-        f"INSERT or REPLACE INTO {models.env.event_app} (info, date) VALUES "
-        f"{(info, datetime.now().strftime('%Y_%m_%d'))}"
+    # Use f-string or %s as table names can't be parametrized
+    writer.write(
+        f"DELETE FROM {models.env.event_app}",
+        (
+            f"INSERT or REPLACE INTO {models.env.event_app} (info, date) VALUES (?,?)",
+            (info, datetime.now().strftime("%Y_%m_%d")),
+        ),
     )
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        # Use f-string or %s as table names can't be parametrized
-        cursor.execute(f"DELETE FROM {models.env.event_app}")
-        cursor.connection.commit()
-        cursor.execute(query)
-        cursor.connection.commit()
-    return
 
 
 def event_app_launcher() -> None:
@@ -165,7 +159,7 @@ def events(*args) -> None:
         resource_tracker.semaphores(events_writer)
         speaker.speak(text=f"Events table is outdated {models.env.title}. Please try again in a minute or two.")
     else:
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             logger.info("Starting adhoc process to get events from %s.", models.env.event_app)
             resource_tracker.semaphores(events_writer)
             speaker.speak(text=f"Events table is empty {models.env.title}. Please try again in a minute or two.")
@@ -6,7 +6,6 @@
 """
 
 import datetime
-import sqlite3
 import time
 from multiprocessing import Queue
 
@@ -20,15 +19,14 @@ from bs4 import BeautifulSoup
 
 from jarvis.executors import resource_tracker, word_match
 from jarvis.modules.audio import speaker
+from jarvis.modules.database import writer
 from jarvis.modules.exceptions import EgressErrors
 from jarvis.modules.logger import logger
 from jarvis.modules.meetings import ics
 from jarvis.modules.models import models
-from jarvis.modules.retry import retry
 from jarvis.modules.utils import shared, support
 
 
-@retry.retry(attempts=3, interval=2, exclude_exc=sqlite3.OperationalError)
 def meetings_writer(queue: Queue = None) -> None:
     """Gets return value from ``meetings()`` and writes it to a file.
 
@@ -38,18 +36,10 @@ def meetings_writer(queue: Queue = None) -> None:
         queue: Multiprocessing queue in case mute for meetings is enabled.
     """
     info = meetings_gatherer(queue=queue)
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute("DELETE FROM ics")
-        cursor.connection.commit()
-        cursor.execute(
-            "INSERT or REPLACE INTO ics (info, date) VALUES (?,?)",
-            (
-                info,
-                datetime.datetime.now().strftime("%Y_%m_%d"),
-            ),
-        )
-        cursor.connection.commit()
+    writer.write(
+        "DELETE FROM ics",
+        ("INSERT or REPLACE INTO ics (info, date) VALUES (?,?)", (info, datetime.datetime.now().strftime("%Y_%m_%d"))),
+    )
 
 
 def meetings_gatherer(custom_date: datetime.date = None, addon: str = "today", queue: Queue = None) -> str:
@@ -191,7 +181,7 @@ def meetings(phrase: str) -> None:
         resource_tracker.semaphores(meetings_writer)
         speaker.speak(text=f"Meetings table is outdated {models.env.title}. Please try again in a minute or two.")
     else:
-        if shared.called_by_offline:
+        if shared.context().called_by_offline:
             logger.info("Starting adhoc process to get meetings from ICS.")
             resource_tracker.semaphores(meetings_writer)
             speaker.speak(text=f"Meetings table is empty {models.env.title}. Please try again in a minute or two.")
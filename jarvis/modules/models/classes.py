@@ -237,6 +237,9 @@ class EnvConfig(BaseSettings):
     ntfy_topic: str | None = None
 
     notify_reminders: enums.ReminderOptions | List[enums.ReminderOptions] = enums.ReminderOptions.all
+    # Alarms and reminders that are late by more than the grace period in seconds, are either fired late or skipped
+    misfire_policy: enums.MisfirePolicy = enums.MisfirePolicy.fire
+    misfire_grace: PositiveInt = 120
 
     # Author specific
     author_mode: bool = False
@@ -273,6 +276,9 @@ class EnvConfig(BaseSettings):
     offline_host: str = socket.gethostbyname("localhost")
     offline_port: PositiveInt = 4483
     offline_pass: str = "OfflineComm"
+    offline_workers: PositiveInt = Field(4, le=32)
+    offline_queue_size: PositiveInt = 16
+    offline_timeout: PositiveInt = 90
     workers: PositiveInt = 1
 
     # Calendar events and meetings config
@@ -593,6 +599,7 @@ class FileIO(BaseModel):
     # Future useful
     frequent: FilePath = os.path.join(root, "frequent.yaml")
     training_data: FilePath = os.path.join(root, "training_data.yaml")
+    training_journal: FilePath = os.path.join(root, "training_data.jsonl")
     gpt_data: FilePath = os.path.join(root, "gpt_history.yaml")
 
     # Jarvis internal
@@ -51,6 +51,13 @@ class ReminderOptions(StrEnum):
     all = "all"
 
 
+class MisfirePolicy(StrEnum):
+    """Policy for the alarms and reminders that are late beyond the grace period."""
+
+    fire = "fire"
+    skip = "skip"
+
+
 class StartupOptions(StrEnum):
     """Background threads to startup."""
 
@@ -6,7 +6,6 @@
 """
 
 import os
-import pathlib
 import warnings
 from importlib import metadata
 
@@ -148,11 +147,12 @@ def _main_process_validations() -> None:
     for attr in tables.model_fields:
         table = getattr(tables, attr)
         db.create_table(table_name=table.name, columns=table.columns, primary_key=table.pkey)
+        for index in table.indexes:
+            db.create_index(table_name=table.name, columns=index)
+    # Sparse table with a column per category, replaced by the child processes' registry
+    with db.connection as connection:
+        connection.execute("DROP TABLE IF EXISTS children;")
     _set_fernet_key()
-    # Create required file for alarms
-    pathlib.Path(fileio.alarms).touch(exist_ok=True)
-    # Create required file for reminders
-    pathlib.Path(fileio.reminders).touch(exist_ok=True)
     # Create required directory for uploads
     os.makedirs(fileio.uploads, exist_ok=True)
 
@@ -18,6 +18,7 @@ class Table(BaseModel):
     columns: Sequence[str]
     pkey: str | None = None
     keep: bool = False
+    indexes: Sequence[Sequence[str]] = ()
 
 
 class Tables(BaseModel):
@@ -36,19 +37,55 @@ class Tables(BaseModel):
     stopper: Table = Table(name="stopper", columns=("flag", "caller"), pkey="caller")
     listener: Table = Table(name="listener", columns=("state",), pkey="state", keep=True)
     events: Table = Table(name=env.event_app or "calendar", columns=("info", "date"), pkey="date")
-    children: Table = Table(
-        name="children",
+    delayed: Table = Table(name="delayed", columns=("command", "due"), keep=True)
+    usage: Table = Table(name="usage", columns=("function", "count"), pkey="function", keep=True)
+    alarms: Table = Table(
+        name="alarms",
+        columns=("alarm_time", "minute", "day", "repeat"),
+        keep=True,
+        indexes=(("minute", "day"),),
+    )
+    reminders: Table = Table(
+        name="reminders",
+        columns=("name", "message", "date", "minute", "reminder_time"),
+        keep=True,
+        indexes=(("date", "minute"),),
+    )
+    ticks: Table = Table(name="ticks", columns=("name", "stamp"), pkey="name", keep=True)
+    latency: Table = Table(
+        name="latency",
         columns=(
-            "meetings",
-            "events",
-            "crontab",
-            "party",
-            "guard",
-            "surveillance",
-            "plot_mic",
-            "listener_widget",
-            "undefined",
+            "slot",
+            "stamp",
+            "category",
+            "wake_word",
+            "capture",
+            "recognition",
+            "dispatch",
+            "executor",
+            "synthesis",
+            "playback",
         ),
+        pkey="slot",
+        keep=True,
+    )
+    cron_runs: Table = Table(
+        name="cron_runs",
+        columns=("job", "started_at", "ended_at", "exit_code", "output_bytes"),
+        keep=True,
+        indexes=(("job", "started_at"),),
+    )
+    background_metrics: Table = Table(
+        name="background_metrics",
+        columns=("name", "runs", "failures", "last_duration_ms", "p50_ms", "p95_ms", "next_run", "updated_at"),
+        pkey="name",
+    )
+    leader: Table = Table(name="leader", columns=("name", "holder", "expires_at"), pkey="name")
+    child_processes: Table = Table(
+        name="child_processes",
+        columns=("pid", "category", "started_at", "parent", "cmdline"),
+        pkey="pid",
+        indexes=(("category",),),
     )
 
 
@@ -21,6 +21,7 @@ from pydantic import FilePath
 from jarvis.executors import commander, offline, restrictions, secure_send, word_match
 from jarvis.modules.audio import tts_stt
 from jarvis.modules.conditions import keywords
+from jarvis.modules.database import writer
 from jarvis.modules.exceptions import (
     BotInUse,
     BotTokenInvalid,
@@ -31,7 +32,7 @@ from jarvis.modules.exceptions import (
 from jarvis.modules.logger import logger
 from jarvis.modules.models import enums, models
 from jarvis.modules.telegram import audio_handler, file_handler, settings
-from jarvis.modules.utils import support, util
+from jarvis.modules.utils import control_plane, support, util
 
 USER_TITLE = {}
 BASE_URL = f"https://api.telegram.org/bot{models.env.bot_token}"
@@ -434,13 +435,8 @@ def verify_stop(chat: settings.Chat, data_class: settings.Text) -> bool:
     if "override" in data_class.text.lower():
         logger.info("%s requested a STOP override.", chat.username)
         reply_to(chat, f"Shutting down now {models.env.title}!\n{support.exit_message()}")
-        with models.db.connection as connection:
-            cursor = connection.cursor()
-            cursor.execute(
-                "INSERT or REPLACE INTO stopper (flag, caller) VALUES (?,?);",
-                (True, "TelegramAPI"),
-            )
-            cursor.connection.commit()
+        writer.write(("INSERT or REPLACE INTO stopper (flag, caller) VALUES (?,?);", (True, "TelegramAPI")))
+        control_plane.notify()
     else:
         reply_to(
             chat,
@@ -693,9 +689,12 @@ def jarvis(command: str, chat: settings.Chat) -> None:
 
     if " and " in command and not word_match.word_match(phrase=command, match_list=keywords.ignore_and):
         and_phrases = command.split(" and ")
-        logger.info("Looping through %s in iterations.", and_phrases)
-        for each in and_phrases:
-            executor(each, chat)
+        logger.info("Request: %s", and_phrases)
+        # Set to a max timeout of 1 minute to allow longer text conversations
+        for response in offline.compound_communicator(phrases=and_phrases, ollama_timeout=60):
+            response = response.replace(models.env.title, USER_TITLE.get(chat.username))
+            logger.info("Response: %s", response)
+            process_response(response, chat)
         return
 
     if " after " in command_lower and not word_match.word_match(phrase=command, match_list=keywords.ignore_after):
@@ -717,18 +716,17 @@ def executor(command: str, chat: settings.Chat) -> None:
         command: Command to be executed.
         chat: Required section of the payload as Chat object.
     """
-    ollama_timeout_backed = models.env.ollama_timeout
-    # Set to a max timeout of 1 minute to allow longer text conversations
-    models.env.ollama_timeout = 60
     logger.info("Request: %s", command)
     try:
-        response = offline.communicator(command=command).replace(models.env.title, USER_TITLE.get(chat.username))
+        # Set to a max timeout of 1 minute to allow longer text conversations
+        response = offline.communicator(command=command, ollama_timeout=60).replace(
+            models.env.title, USER_TITLE.get(chat.username)
+        )
     except Exception as error:
         logger.error(error)
         logger.error(traceback.format_exc())
         response = f"Jarvis failed to process the request.\n\n`{error}`"
     logger.info("Response: %s", response)
-    models.env.ollama_timeout = ollama_timeout_backed
     process_response(response, chat)
 
 
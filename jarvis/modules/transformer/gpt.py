@@ -18,6 +18,8 @@ References:
 
 import collections
 import difflib
+import heapq
+import os
 import time
 from collections.abc import Generator
 
@@ -25,7 +27,7 @@ from collections.abc import Generator
 from multiprocessing.context import TimeoutError as ThreadTimeoutError
 from multiprocessing.pool import ThreadPool
 from threading import Thread
-from typing import List
+from typing import Dict, List, Set, Tuple
 
 import ollama
 
@@ -33,7 +35,7 @@ from jarvis.executors import files, static_responses
 from jarvis.modules.audio import speaker
 from jarvis.modules.logger import logger
 from jarvis.modules.models import enums, models
-from jarvis.modules.utils import support
+from jarvis.modules.utils import shared, support
 
 
 def dump_history(request: str, response: str) -> None:
@@ -48,6 +50,119 @@ def dump_history(request: str, response: str) -> None:
     files.put_gpt_data(data)
 
 
+class HistoryIndex:
+    """Index of the GPT history, for exact and approximate lookups of historical requests.
+
+    >>> HistoryIndex
+
+    See Also:
+        - Identical requests are looked up in a hash map, keyed by the lower-cased request.
+        - | Approximate matches are retrieved from an inverted index of character trigrams, and only the ``TOP_K``
+          | candidates with the most trigrams in common are re-ranked with ``difflib.SequenceMatcher``.
+        - Requests with numbers in them are excluded from the trigram index, since they are never reused.
+        - The index is re-built when the modified time or the size of the GPT history file changes.
+    """
+
+    TOP_K = 32
+
+    def __init__(self):
+        """Instantiates an empty index."""
+        self.stamp: Tuple[int, int] | None = None
+        self.exact: Dict[str, str] = {}
+        self.entries: List[Tuple[str, str, str]] = []
+        self.grams: Dict[str, List[int]] = {}
+
+    @staticmethod
+    def trigrams(text: str) -> Set[str]:
+        """Get the character trigrams for a text, padded so that short texts have at least one trigram.
+
+        Args:
+            text: Lower-cased text.
+
+        Returns:
+            Set[str]:
+            Returns a set of trigrams.
+        """
+        padded = f"  {text} "
+        return {"".join(chars) for chars in zip(padded, padded[1:], padded[2:])}
+
+    def build(self, data: List[Dict[str, str]]) -> None:
+        """Builds the hash map and the trigram index for the given history.
+
+        Args:
+            data: List of dictionaries with the request and response.
+        """
+        exact, entries, grams = {}, [], {}
+        for d in data:
+            lowered = d["request"].lower()
+            # first occurrence takes precedence, to match a sequential scan of the history
+            exact.setdefault(lowered, d["response"])
+            if any(word.isdigit() for word in d["request"]):
+                continue
+            for gram in self.trigrams(lowered):
+                grams.setdefault(gram, []).append(len(entries))
+            entries.append((d["request"], lowered, d["response"]))
+        self.exact, self.entries, self.grams = exact, entries, grams
+
+    def refresh(self) -> bool:
+        """Re-builds the index if the GPT history file has changed.
+
+        Returns:
+            bool:
+            Returns a boolean flag to indicate whether the history is available.
+        """
+        try:
+            stat = os.stat(models.fileio.gpt_data)
+        except FileNotFoundError:
+            self.stamp = None
+            self.build([])
+            return False
+        if (stamp := (stat.st_mtime_ns, stat.st_size)) != self.stamp:
+            self.build(files.get_gpt_data())
+            self.stamp = stamp
+        return bool(self.exact)
+
+    def identical(self, request: str) -> str | None:
+        """Get the response for an identical historical request.
+
+        Args:
+            request: Lower-cased request.
+
+        Returns:
+            str:
+            Returns the response if an identical request exists.
+        """
+        return self.exact.get(request)
+
+    def closest(self, request: str, threshold: float) -> Tuple[str, str, float] | None:
+        """Get the closest historical request, among the candidates with the most trigrams in common.
+
+        Args:
+            request: Lower-cased request.
+            threshold: Minimum similarity ratio for the response to be re-used.
+
+        Returns:
+            Tuple[str, str, float]:
+            Returns a tuple of the historical request, its response and the similarity ratio.
+        """
+        shared_grams = collections.Counter()
+        for gram in self.trigrams(request):
+            shared_grams.update(self.grams.get(gram, ()))
+        # position is the tiebreaker, to prefer the earlier entry like a stable sort over the history
+        candidates = heapq.nsmallest(self.TOP_K, shared_grams, key=lambda pos: (-shared_grams[pos], pos))
+        best = None
+        for position in candidates:
+            existing_request, lowered, response = self.entries[position]
+            ratio = difflib.SequenceMatcher(a=lowered, b=request).ratio()
+            if ratio >= threshold and (not best or (ratio, -position) > (best[2], -best[3])):
+                best = (existing_request, response, ratio, position)
+        if best:
+            return best[:3]
+
+
+history = HistoryIndex()
+
+
 def existing_response(request: str) -> str | None:
     """Return existing response if the new prompt is an exact match or closely matches historical prompts.
 
@@ -72,22 +187,14 @@ def existing_response(request: str) -> str | None:
     if any(word.isdigit() for word in request):
         logger.debug("request: '%s' contains numbers in it, so skipping existing search", request)
         return None
-    if not (data := files.get_gpt_data()):
+    if not history.refresh():
         logger.debug("GPT history is empty")
         return None
 
-    # unpack data and store the request: response, match ratio in a new dict
     new_req = request.lower()
-    ratios = {}
-    for d in data:
-        ex_req = d["request"].lower()
-        if ex_req == new_req:
-            logger.info("Identical historical request: '%s'", d["request"])
-            return d["response"]
-        ratios[d["request"]] = (
-            d["response"],
-            difflib.SequenceMatcher(a=ex_req, b=new_req).ratio(),
-        )
+    if (response := history.identical(new_req)) is not None:
+        logger.info("Identical historical request: '%s'", request)
+        return response
 
     # no identical requests found in history, and reuse threshold was 0.0
     if not models.env.ollama_reuse_threshold:
@@ -97,20 +204,11 @@ def existing_response(request: str) -> str | None:
         )
         return None
 
-    # sort the new dict in reverse order so the closest match gets returned first
-    ratios = collections.OrderedDict(sorted(ratios.items(), key=lambda kv: kv[1][1], reverse=True))
-
-    # iterate over the ordered dict to look for numbers in existing requests and ignore them
-    for existing_request, response_ratio in ratios.items():
-        if response_ratio[1] >= models.env.ollama_reuse_threshold and not any(
-            word.isdigit() for word in existing_request
-        ):
-            logger.info(
-                "Closest historical request [%s]: '%s'",
-                response_ratio[1],
-                existing_request,
-            )
-            return response_ratio[0]
+    # requests with numbers in them are not indexed, so they are never reused
+    if closest := history.closest(request=new_req, threshold=models.env.ollama_reuse_threshold):
+        existing_request, response, ratio = closest
+        logger.info("Closest historical request [%s]: '%s'", ratio, existing_request)
+        return response
     return None
 
 
@@ -214,7 +312,7 @@ class Ollama:
         try:
             start_time = time.time()
             process = ThreadPool(processes=1).apply_async(self.generator, args=(phrase,))
-            model_response = process.get(models.env.ollama_timeout)
+            model_response = process.get(shared.context().ollama_timeout or models.env.ollama_timeout)
             token_gen = support.time_converter(time.time() - start_time)
             logger.info(
                 "GPT: Finished generating response from: %s in %s",
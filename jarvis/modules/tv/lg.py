@@ -60,7 +60,7 @@ class LGWebOS:
         except (socket.gaierror, ConnectionRefusedError) as error:
             logger.error(error)
             self._reconnect = True
-            if not shared.called_by_offline:
+            if not shared.context().called_by_offline:
                 speaker.speak(
                     f"The TV's IP has either changed or unreachable {models.env.title}! " "Scanning your IP range now.",
                     run=True,
@@ -83,7 +83,7 @@ class LGWebOS:
                 support.write_screen(text="Connected to the TV.")
                 break
             elif status == WebOSClient.PROMPTED:
-                if shared.called_by_offline:
+                if shared.context().called_by_offline:
                     logger.info("Connection request sent to '%s'", nickname)
                 else:
                     speaker.speak(
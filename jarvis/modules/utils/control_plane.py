@@ -0,0 +1,99 @@
+# noinspection PyUnresolvedReferences
+"""This is a space for the control plane that signals restart and stop requests to the main process.
+
+>>> Control Plane
+
+This module exposes functions and flags, not a class:
+    - ``listen`` binds the loopback socket in the main process, and starts the listener thread.
+    - ``notify`` sends a signal to the main process, from any writer.
+    - | ``consume`` checks and clears the ``pending`` flag, which is set for restart and stop requests and on every
+      | reconcile interval.
+    - ``scheduled`` is the flag that is set when a delayed task is written.
+
+See Also:
+    - Restart and stop requests are still persisted in the ``restart`` and ``stopper`` tables for crash recovery.
+    - | Writers (API, Telegram, offline router) send a datagram to a loopback socket owned by the main process,
+      | which sets an in-memory flag that the hot-word loop checks instead of querying the base DB every frame.
+    - The base DB is also reconciled periodically, to pick up entries from writers that could not notify.
+    - Writers of delayed tasks send a ``SCHEDULE`` datagram, which wakes the delayed tasks' scheduler instead.
+"""
+
+import os
+import socket
+import threading
+
+from jarvis.modules.logger import logger
+
+ENV_KEY = "JARVIS_CONTROL_PORT"
+HOST = "127.0.0.1"
+RECONCILE_INTERVAL = 5
+RECONCILE = b"1"
+SCHEDULE = b"2"
+
+pending = threading.Event()
+scheduled = threading.Event()
+_receiver: socket.socket | None = None
+
+
+def _listener() -> None:
+    """Sets the flag for the signal received, or the pending flag when the reconcile interval elapses."""
+    while True:
+        try:
+            signal = _receiver.recv(64)
+        except socket.timeout:
+            signal = RECONCILE
+        except OSError as error:
+            logger.error("Control plane listener stopped: %s", error)
+            return
+        if signal == SCHEDULE:
+            scheduled.set()
+        else:
+            pending.set()
+
+
+def listen() -> None:
+    """Binds a datagram socket on the loopback interface and starts a listener thread.
+
+    See Also:
+        - Port number is exported as an env var, so that child processes started after this call can notify.
+        - Flag is set during startup to process any entries persisted before a crash.
+    """
+    global _receiver
+    if _receiver:
+        return
+    _receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    _receiver.bind((HOST, 0))
+    _receiver.settimeout(RECONCILE_INTERVAL)
+    os.environ[ENV_KEY] = str(_receiver.getsockname()[1])
+    logger.info("Control plane listening on %s:%s", HOST, os.environ[ENV_KEY])
+    pending.set()
+    threading.Thread(target=_listener, daemon=True).start()
+
+
+def notify(signal: bytes = RECONCILE) -> None:
+    """Notifies the main process that a restart, stop or delayed task entry has been written to the base DB.
+
+    Args:
+        signal: Signal to send, ``RECONCILE`` for restart and stop entries, ``SCHEDULE`` for delayed tasks.
+    """
+    if not (port := os.environ.get(ENV_KEY)):
+        return
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            sender.sendto(signal, (HOST, int(port)))
+    except (OSError, ValueError) as error:
+        logger.warning("Failed to notify control plane: %s", error)
+
+
+def consume() -> bool:
+    """Checks and clears the pending flag.
+
+    Returns:
+        bool:
+        Returns a boolean flag to indicate whether the base DB has to be checked for restart or stop entries.
+    """
+    if pending.is_set():
+        # Clear before the DB is read, so that a notification received in between is not lost
+        pending.clear()
+        return True
+    return False
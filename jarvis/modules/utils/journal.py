@@ -0,0 +1,91 @@
+# noinspection PyUnresolvedReferences
+"""This is a space for the append-only journal of unrecognized phrases, that are used as training data.
+
+>>> Journal
+
+See Also:
+    - Each unrecognized phrase is appended as a JSON line, so a write does not depend on the size of the history.
+    - | Compaction merges the journal into the training data YAML file in its original shape, and starts a new journal.
+      | It can be triggered using the command ``jarvis export-training-data``
+"""
+
+import glob
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict
+
+import yaml
+
+from jarvis.modules.logger import logger
+from jarvis.modules.models import models
+
+TIMESTAMP_FORMAT = "%B %d, %Y %H:%M:%S.%f"
+
+_lock = threading.Lock()
+
+
+def append(train_data: Dict[str, str]) -> None:
+    """Appends the unrecognized phrase to the journal.
+
+    Args:
+        train_data: Dictionary of the category and the unrecognized phrase.
+    """
+    dt_string = datetime.now().strftime(TIMESTAMP_FORMAT)[:-3]
+    lines = "".join(
+        json.dumps(dict(category=category, timestamp=dt_string, phrase=phrase)) + "\n"
+        for category, phrase in train_data.items()
+    )
+    with _lock, open(models.fileio.training_journal, "a") as file:
+        file.write(lines)
+
+
+def export() -> None:
+    """Compacts the journal into the training data YAML file, sorted by the latest entry for each category.
+
+    See Also:
+        - | Journal is rotated to a unique ``.compacting`` file, which is removed only after the YAML file is written.
+          | Rotated files left behind by an interrupted export are merged again, which is idempotent since the entries
+          | are keyed by their timestamp.
+    """
+    journal = models.fileio.training_journal
+    if os.path.isfile(journal):
+        # Rename before reading, so that entries appended during the export go into a new journal
+        os.replace(journal, f"{journal}.{time.time_ns()}.compacting")
+    if not (compacting := sorted(glob.glob(f"{glob.escape(journal)}*.compacting"))):
+        logger.info("Nothing to export, %s is unavailable.", journal)
+        return
+    if len(compacting) > 1:
+        logger.warning("Merging %d journals, including the ones left by an interrupted export", len(compacting))
+    data = {}
+    if os.path.isfile(models.fileio.training_data):
+        with open(models.fileio.training_data) as file:
+            data = yaml.load(stream=file, Loader=yaml.FullLoader) or {}
+    count = 0
+    for filepath in compacting:
+        with open(filepath) as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError as error:
+                    logger.error("Skipping corrupted entry: %s, %s", line, error)
+                    continue
+                data.setdefault(entry["category"], {})[entry["timestamp"]] = entry["phrase"]
+                count += 1
+    data = {
+        func: dict(
+            sorted(
+                unrec_dict.items(),
+                reverse=True,
+                key=lambda item: datetime.strptime(item[0], TIMESTAMP_FORMAT),
+            )
+        )
+        for func, unrec_dict in data.items()
+    }
+    with open(models.fileio.training_data, "w") as file:
+        yaml.dump(data=data, stream=file, sort_keys=False)
+    for filepath in compacting:
+        os.remove(filepath)
+    logger.info("Exported %d entries to %s", count, models.fileio.training_data)
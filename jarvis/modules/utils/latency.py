@@ -0,0 +1,210 @@
+# noinspection PyUnresolvedReferences
+"""This is a space for the latency spans recorded across the stages of the voice pipeline.
+
+>>> Latency
+
+See Also:
+    - | Each voice interaction is traced from the wake word detection, through the listener, conditions and the
+      | executor, to the speech synthesis and playback.
+    - Spans are exclusive, so a listener invoked by an executor for a follow-up, is not counted in the executor stage.
+    - | Traces are persisted in the ``latency`` table of the base DB as a ring buffer, where the oldest slot is
+      | overwritten once the capacity is reached.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List
+
+from jarvis.modules.database import writer
+from jarvis.modules.logger import logger
+from jarvis.modules.models import models
+from jarvis.modules.utils import util
+
+STAGES = ("wake_word", "capture", "recognition", "dispatch", "executor", "synthesis", "playback")
+CAPACITY = 1024
+SUMMARY_INTERVAL = 25
+
+
+@dataclass
+class Trace:
+    """Latency spans for a single voice interaction.
+
+    >>> Trace
+
+    """
+
+    category: str | None = None
+    spans: Dict[str, float] = field(default_factory=dict)
+    nested: List[float] = field(default_factory=list)
+
+    def add(self, stage: str, duration: float) -> None:
+        """Adds the duration to the stage, since a stage can occur more than once in an interaction.
+
+        Args:
+            stage: Name of the stage.
+            duration: Duration in seconds.
+        """
+        self.spans[stage] = self.spans.get(stage, 0.0) + duration
+
+
+# Trace is active only within the voice loop, so offline and background callers are not recorded
+active: ContextVar[Trace | None] = ContextVar("latency_trace", default=None)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Records the time spent in a stage, excluding the time spent in the stages nested within.
+
+    Args:
+        stage: Name of the stage.
+    """
+    if not (trace_ := active.get()):
+        yield
+        return
+    trace_.nested.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        trace_.add(stage, elapsed - trace_.nested.pop())
+        if trace_.nested:
+            trace_.nested[-1] += elapsed
+
+
+def categorize(category: str) -> None:
+    """Sets the keyword category that the phrase was dispatched to.
+
+    Args:
+        category: Keyword category.
+    """
+    if (trace_ := active.get()) and not trace_.category:
+        trace_.category = category
+
+
+class RingBuffer:
+    """Fixed size storage for the traces in the base DB.
+
+    >>> RingBuffer
+
+    """
+
+    def __init__(self, capacity: int):
+        """Instantiates the buffer with the capacity.
+
+        Args:
+            capacity: Maximum number of traces to store.
+        """
+        self.capacity = capacity
+        self.cursor: int | None = None
+        self.recorded = 0
+        self.lock = threading.Lock()
+
+    def append(self, trace_: Trace) -> None:
+        """Stores the trace in the next slot.
+
+        Args:
+            trace_: Trace of a voice interaction.
+        """
+        with self.lock:
+            if self.cursor is None:
+                with models.db.connection as connection:
+                    cursor = connection.cursor()
+                    latest = cursor.execute("SELECT slot FROM latency ORDER BY stamp DESC LIMIT 1;").fetchone()
+                self.cursor = (latest[0] + 1) % self.capacity if latest else 0
+            writer.write(
+                (
+                    f"INSERT OR REPLACE INTO latency (slot, stamp, category, {', '.join(STAGES)}) "
+                    f"VALUES ({', '.join('?' * (len(STAGES) + 3))});",
+                    (self.cursor, time.time(), trace_.category, *(trace_.spans.get(stage) for stage in STAGES)),
+                )
+            )
+            self.cursor = (self.cursor + 1) % self.capacity
+            self.recorded += 1
+
+    def read(self) -> List[Dict[str, str | float | None]]:
+        """Reads all the traces in the buffer.
+
+        Returns:
+            List[Dict[str, str | float | None]]:
+            Returns a list of traces as dictionaries, ordered by time.
+        """
+        with models.db.connection as connection:
+            cursor = connection.cursor()
+            rows = cursor.execute(f"SELECT category, {', '.join(STAGES)} FROM latency ORDER BY stamp;").fetchall()
+        return [dict(zip(("category", *STAGES), row)) for row in rows]
+
+
+buffer = RingBuffer(capacity=CAPACITY)
+
+
+def histogram(values: List[float]) -> Dict[str, int | float]:
+    """Get the count and percentiles in milliseconds.
+
+    Args:
+        values: Durations in seconds.
+
+    Returns:
+        Dict[str, int | float]:
+        Returns a dictionary of count, p50, p95 and p99.
+    """
+    histogram_ = dict(count=len(values))
+    for pct in (50, 95, 99):
+        histogram_[f"p{pct}_ms"] = round(util.percentile(values, pct) * 1000, 2)
+    return histogram_
+
+
+def summary() -> Dict[str, Dict[str, Dict[str, int | float]]]:
+    """Aggregates the traces in the buffer into per-stage and per-category histograms.
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, int | float]]]:
+        Returns the histograms for each stage, and for the end-to-end latency of each category.
+    """
+    traces = buffer.read()
+    categories: Dict[str, List[float]] = {}
+    for trace_ in traces:
+        total = sum(trace_[stage] or 0.0 for stage in STAGES)
+        categories.setdefault(trace_["category"] or "uncategorized", []).append(total)
+    return dict(
+        stages={
+            stage: histogram([trace_[stage] for trace_ in traces if trace_[stage] is not None]) for stage in STAGES
+        },
+        categories={category: histogram(values) for category, values in categories.items()},
+    )
+
+
+def log_summary() -> None:
+    """Logs the per-stage histograms."""
+    for stage, histogram_ in summary()["stages"].items():
+        logger.info("Latency for %s: %s", stage, histogram_)
+
+
+@contextmanager
+def trace(wake_word: float = None) -> Iterator[Trace]:
+    """Traces a voice interaction, and stores it in the ring buffer when complete.
+
+    Args:
+        wake_word: Time taken in seconds to read and process the audio frame with the wake word.
+
+    Yields:
+        Trace:
+        Trace of the voice interaction.
+    """
+    trace_ = Trace()
+    if wake_word is not None:
+        trace_.add("wake_word", wake_word)
+    token = active.set(trace_)
+    try:
+        yield trace_
+    finally:
+        active.reset(token)
+        try:
+            buffer.append(trace_)
+            if buffer.recorded % SUMMARY_INTERVAL == 0:
+                log_summary()
+        except Exception as error:
+            logger.error(error)
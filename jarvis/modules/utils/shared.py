@@ -3,10 +3,20 @@
 
 >>> Shared
 
+See Also:
+    - | ``called_by_offline``, ``called_by_bg_tasks``, ``text_spoken``, ``offline_caller``, ``ollama_timeout`` and
+      | ``responses`` are read from the ``RequestContext`` of the current thread or task, with ``shared.context()``,
+      | so concurrent offline commands don't read each other's responses.
+    - | Threads started while processing a command have to be run with ``contextvars.copy_context().run``, to inherit
+      | the request context instead of the process wide context.
+    - Outside an offline request, ``shared.context()`` returns the process wide context used by the voice loop.
 """
 
 import sys
 import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List
 
 if sys.platform != "win32":
     # noinspection PyProtectedMember
@@ -15,14 +25,42 @@ else:
     # noinspection PyProtectedMember
     from multiprocessing.connection import PipeConnection as Connection
 
+
+@dataclass
+class RequestContext:
+    """Execution context for a command, carrying the caller type and the responses spoken.
+
+    >>> RequestContext
+
+    """
+
+    called_by_offline: bool = False
+    called_by_bg_tasks: bool = False
+    text_spoken: str | None = None
+    offline_caller: str | None = None
+    ollama_timeout: int | None = None
+    responses: List[str] = field(default_factory=list)
+
+
+# Context used by the voice loop, and any thread or task that is not processing an offline request
+process_context = RequestContext()
+request_context: ContextVar[RequestContext] = ContextVar("request_context", default=process_context)
+
+
+def context() -> RequestContext:
+    """Get the request context of the current thread or task.
+
+    Returns:
+        RequestContext:
+        Returns the context of the offline request being processed, or the process wide context outside of one.
+    """
+    return request_context.get()
+
+
 start_time = time.time()
 greeting = False
-called_by_offline = False
-called_by_bg_tasks = False
 widget_connection: Connection | None = None
 
-text_spoken = None
-offline_caller = None
 tv = {}
 
 processes = {}
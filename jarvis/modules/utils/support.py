@@ -21,12 +21,12 @@ import pytz
 import yaml
 from dateutil import parser, relativedelta
 
-from jarvis.executors import internet, others, word_match
+from jarvis.executors import internet, others, resource_tracker, word_match
 from jarvis.modules.audio import speaker
 from jarvis.modules.conditions import keywords
 from jarvis.modules.logger import logger, multiprocessing_logger
 from jarvis.modules.models import models
-from jarvis.modules.utils import shared, util
+from jarvis.modules.utils import journal, shared, util
 
 ENGINE = inflect.engine()
 
@@ -136,46 +136,18 @@ def get_capitalized(phrase: str, ignore: Iterable = None, dot: bool = True) -> s
 
 
 def unrecognized_dumper(train_data: dict) -> None:
-    """If none of the conditions are met, converted text is written to a YAML file for training purpose.
+    """If none of the conditions are met, converted text is written to a journal for training purpose.
 
     Args:
         train_data: Takes the dictionary that has to be written as an argument.
-    """
-    dt_string = datetime.now().strftime("%B %d, %Y %H:%M:%S.%f")[:-3]
-    data = {}
-    if os.path.isfile(models.fileio.training_data):
-        try:
-            with open(models.fileio.training_data) as reader:
-                data = yaml.load(stream=reader, Loader=yaml.FullLoader) or {}
-        except yaml.YAMLError as error:
-            logger.error(error)
-            os.rename(
-                src=models.fileio.training_data,
-                dst=str(models.fileio.training_data).replace(".", f"_{datetime.now().strftime('%m_%d_%Y_%H_%M')}."),
-            )
-        for key, value in train_data.items():
-            if data.get(key):
-                data[key].update({dt_string: value})
-            else:
-                data.update({key: {dt_string: value}})
-
-    if not data:
-        data = {key1: {dt_string: value1} for key1, value1 in train_data.items()}
-
-    data = {
-        func: {
-            dt: unrec
-            for dt, unrec in sorted(
-                unrec_dict.items(),
-                reverse=True,
-                key=lambda item: datetime.strptime(item[0], "%B %d, %Y %H:%M:%S.%f"),
-            )
-        }
-        for func, unrec_dict in data.items()
-    }
 
-    with open(models.fileio.training_data, "w") as writer:
-        yaml.dump(data=data, stream=writer, sort_keys=False)
+    See Also:
+        - Use ``jarvis export-training-data`` to compact the journal into the training data YAML file.
+    """
+    try:
+        journal.append(train_data=train_data)
+    except OSError as error:
+        logger.error(error)
 
 
 def size_converter(byte_size: int | float) -> str:
@@ -474,7 +446,7 @@ def write_screen(text: Any) -> None:
     Args:
         text: Text to be written.
     """
-    if shared.called_by_offline:
+    if shared.context().called_by_offline:
         return
     text = str(text).strip()
     if models.settings.interactive:
@@ -610,6 +582,35 @@ def stop_process(pid: int) -> None:
         logger.error(error)
 
 
+def stop_processes(pids: List[int], timeout: int | float = 5) -> None:
+    """Stop multiple processes in parallel using ``SIGTERM`` and ``SIGKILL`` signals.
+
+    Args:
+        pids: Process IDs that have to be shut down.
+        timeout: Seconds to wait for all the processes to terminate gracefully, before killing them.
+    """
+    processes = []
+    for pid in set(pids):
+        try:
+            proc = psutil.Process(pid=pid)
+            # Step 1: ask all the processes to terminate gracefully, without waiting for each one of them
+            proc.terminate()
+            processes.append(proc)
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.AccessDenied as error:
+            logger.error(error)
+    # Step 2: wait for all of them together, and force kill the ones that didn't exit
+    _, alive = psutil.wait_procs(processes, timeout=timeout)
+    for proc in alive:
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.AccessDenied as error:
+            logger.error(error)
+
+
 def pre_processor(func_name: str, impact_list: List[str]) -> None:
     """Pre-processor for initiating a dedicated process for microphone plotter and wake word detection widget.
 
@@ -620,12 +621,8 @@ def pre_processor(func_name: str, impact_list: List[str]) -> None:
     multiprocessing_logger(filename=os.path.join("logs", f"{func_name}_%d-%m-%Y.log"))
 
     subprocess_id = os.getpid()
-    logger.info("Updating process ID [%d] in [%s] children table.", subprocess_id, func_name)
-    with models.db.connection as connection:
-        cursor = connection.cursor()
-        cursor.execute(f"UPDATE children SET {func_name}=null")
-        cursor.execute(f"INSERT or REPLACE INTO children ({func_name}) VALUES (?);", (subprocess_id,))
-        connection.commit()
+    logger.info("Updating process ID [%d] in [%s] child processes' registry.", subprocess_id, func_name)
+    resource_tracker.register(pid=subprocess_id, category=func_name, parent=os.getppid(), replace=True)
 
     logger.info("Updating process ID [%d] in [%s] processes mapping.", subprocess_id, func_name)
     if os.path.isfile(models.fileio.processes):
@@ -0,0 +1,124 @@
+# noinspection PyUnresolvedReferences
+"""This is a space for the usage counters of the functions that invoke the speaker.
+
+>>> Usage
+
+See Also:
+    - Counters are aggregated in memory, and flushed to the ``usage`` table of the base DB as deltas.
+    - Deltas are flushed in a single transaction every ``FLUSH_INTERVAL`` seconds, and when the process exits.
+    - | Child processes exit without running the ``atexit`` hooks, so the final flush is registered as a finalizer
+      | that ``multiprocessing`` runs at the exit of the main process and the child processes alike.
+    - This data does not have a purpose, but to analyze and re-order the conditions' module at a later time.
+"""
+
+import os
+import threading
+import time
+from collections import Counter
+from multiprocessing import util
+from typing import Dict
+
+from jarvis.executors import files
+from jarvis.modules.database import writer
+from jarvis.modules.logger import logger
+from jarvis.modules.models import models
+
+FLUSH_INTERVAL = 60
+
+
+class UsageCounter:
+    """In-memory counter that is periodically flushed to the base DB.
+
+    >>> UsageCounter
+
+    """
+
+    def __init__(self, interval: int):
+        """Instantiates the counter and the lock.
+
+        Args:
+            interval: Interval in seconds to flush the counters.
+        """
+        self.interval = interval
+        self.deltas: Counter = Counter()
+        self.lock = threading.Lock()
+        self.thread: threading.Thread | None = None
+        self.pid: int | None = None
+
+    def increment(self, function_name: str) -> None:
+        """Increments the counter for a function, and starts the flusher if it isn't running in this process.
+
+        Args:
+            function_name: Name of the function that called the speaker.
+        """
+        with self.lock:
+            if self.pid != os.getpid():
+                # Threads don't survive a fork, so the flusher has to be started once per process
+                self.deltas = Counter()
+                self.pid = os.getpid()
+                self.thread = threading.Thread(target=self.flusher, daemon=True)
+                self.thread.start()
+                util.Finalize(self, self.flush, exitpriority=0)
+            self.deltas[function_name] += 1
+
+    def flush(self) -> None:
+        """Adds the pending deltas to the stored counts in a single transaction."""
+        with self.lock:
+            deltas, self.deltas = self.deltas, Counter()
+        if not deltas:
+            return
+        try:
+            writer.write(
+                writer.Statement(
+                    query="INSERT INTO usage (function, count) VALUES (?,?) "
+                    "ON CONFLICT(function) DO UPDATE SET count = count + excluded.count;",
+                    params=list(deltas.items()),
+                    many=True,
+                )
+            )
+        except Exception as error:
+            logger.error(error)
+            # Retain the deltas, so they are retried in the next flush
+            with self.lock:
+                self.deltas.update(deltas)
+
+    def flusher(self) -> None:
+        """Flushes the deltas in a forever loop."""
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+
+counter = UsageCounter(interval=FLUSH_INTERVAL)
+
+
+def counts() -> Dict[str, int]:
+    """Get the usage counts for each function, including the deltas that are yet to be flushed.
+
+    Returns:
+        Dict[str, int]:
+        Returns a dictionary of function names and counts, sorted by the count in descending order.
+    """
+    with models.db.connection as connection:
+        cursor = connection.cursor()
+        stored = Counter(dict(cursor.execute("SELECT function, count FROM usage;").fetchall()))
+    with counter.lock:
+        stored.update(counter.deltas)
+    return dict(stored.most_common())
+
+
+def migrate() -> None:
+    """Imports the counts from the frequently used YAML file, which is removed after a successful import."""
+    if not os.path.isfile(models.fileio.frequent):
+        return
+    if data := {k: v for k, v in files.get_frequent().items() if isinstance(v, int)}:
+        writer.write(
+            writer.Statement(
+                query="INSERT INTO usage (function, count) VALUES (?,?) "
+                "ON CONFLICT(function) DO UPDATE SET count = count + excluded.count;",
+                params=list(data.items()),
+                many=True,
+            )
+        )
+        logger.info("Imported %d usage counts from %s", len(data), models.fileio.frequent)
+    files.delete(models.fileio.frequent)
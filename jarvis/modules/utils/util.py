@@ -8,6 +8,7 @@
 import contextlib
 import difflib
 import hashlib
+import math
 import random
 import re
 import socket
@@ -338,10 +339,28 @@ def matrix_to_flat_list(input_: List[list]) -> List:
     """
     # do conversion only if it is a real matrix
     if filter(lambda x: isinstance(x, list), input_):
-        return sum(input_, []) or [item for sublist in input_ for item in sublist]
+        # Avoid sum(input_, []) which creates a new list for every sublist, and is quadratic in the number of sublists
+        return [item for sublist in input_ for item in sublist]
     return input_
 
 
+def percentile(input_: List[int | float], pct: int | float) -> int | float:
+    """Get the nearest-rank percentile from a list of numbers.
+
+    Args:
+        input_: List of numbers.
+        pct: Percentile to compute, between 0 and 100.
+
+    Returns:
+        int | float:
+        Returns the value at the given percentile, or 0 for an empty list.
+    """
+    if not input_:
+        return 0
+    ordered = sorted(input_)
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))]
+
+
 def remove_none(input_: List[Any]) -> List[Any]:
     """Removes None values from a list.
 
@@ -0,0 +1,159 @@
+import sqlite3
+import unittest
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from jarvis.executors import alerts
+from jarvis.modules.models import enums
+from tests.helper_test import MemoryDB
+
+
+class TestWindows(unittest.TestCase):
+    """TestCase object for testing the windows of minutes between the ticks.
+
+    >>> TestWindows
+
+    """
+
+    def test_single_minute(self) -> None:
+        """Test that consecutive ticks look up a single minute."""
+        now = datetime(2026, 1, 1, 10, 30)
+        self.assertEqual(alerts.windows(now - timedelta(minutes=1), now), [(date(2026, 1, 1), 629, 630)])
+
+    def test_catch_up_across_days(self) -> None:
+        """Test that a gap spanning midnight is split into a window for each date."""
+        since, now = datetime(2026, 1, 1, 23, 0), datetime(2026, 1, 2, 1, 0)
+        self.assertEqual(alerts.windows(since, now), [(date(2026, 1, 1), 1380, 1439), (date(2026, 1, 2), -1, 60)])
+
+    def test_no_window_for_the_same_tick(self) -> None:
+        """Test that a repeated tick does not look up any minute."""
+        now = datetime(2026, 1, 1, 10, 30)
+        self.assertEqual(alerts.windows(now, now), [])
+
+
+class TestDueReminders(unittest.TestCase):
+    """TestCase object for testing the catch-up and the misfire policy for the reminders.
+
+    >>> TestDueReminders
+
+    """
+
+    def setUp(self) -> None:
+        """Creates the tables in an in-memory database, and patches the base DB and the writer to use it."""
+        self.db = MemoryDB(
+            "CREATE TABLE reminders (name, message, date, minute, reminder_time)",
+            "CREATE TABLE ticks (name, stamp, PRIMARY KEY (name))",
+        )
+        self.connection = self.db.connection
+        self.models = MagicMock()
+        self.models.db.connection = self.connection
+        self.models.env.misfire_grace = 120
+        self.models.env.misfire_policy = enums.MisfirePolicy.fire
+        self.patches = [
+            patch.object(alerts, "models", self.models),
+            patch.object(alerts.writer, "write", self.db.write),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        self.now = datetime(2026, 1, 1, 10, 30)
+
+    def tearDown(self) -> None:
+        """Stops the patches and closes the in-memory database."""
+        for patcher in self.patches:
+            patcher.stop()
+        self.db.close()
+
+    def add(self, due: datetime, message: str) -> None:
+        """Stores a reminder in the in-memory database.
+
+        Args:
+            due: Time when the reminder is due.
+            message: Message of the reminder.
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO reminders (name, message, date, minute, reminder_time) VALUES (?,?,?,?,?);",
+                (None, message, due.date().isoformat(), alerts.minute_of_day(due), due.strftime("%I:%M %p")),
+            )
+
+    def set_tick(self, tick: datetime) -> None:
+        """Stores the previous tick, as another process would.
+
+        Args:
+            tick: Previous tick.
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO ticks (name, stamp) VALUES (?,?);", ("reminders", tick.timestamp())
+            )
+
+    def stored_tick(self) -> datetime:
+        """Reads the previous tick from the in-memory database."""
+        return datetime.fromtimestamp(self.connection.execute("SELECT stamp FROM ticks;").fetchone()[0])
+
+    def messages(self) -> list:
+        """Get the messages of the reminders that are still pending."""
+        return [row[0] for row in self.connection.execute("SELECT message FROM reminders;").fetchall()]
+
+    def test_first_tick(self) -> None:
+        """Test that the first tick fires only the current minute, and stores the tick."""
+        self.add(self.now - timedelta(minutes=5), "stale")
+        self.add(self.now, "current")
+        self.assertEqual([r["message"] for r in alerts.due_reminders(self.now)], ["current"])
+        self.assertEqual(self.messages(), ["stale"])
+        self.assertEqual(self.stored_tick(), self.now)
+
+    def test_catch_up_fires_late(self) -> None:
+        """Test that the reminders due since the stored tick are caught up, and fired late with the fire policy."""
+        self.set_tick(self.now - timedelta(minutes=40))
+        self.add(self.now - timedelta(minutes=30), "late")
+        self.add(self.now - timedelta(minutes=50), "before the tick")
+        self.assertEqual([r["message"] for r in alerts.due_reminders(self.now)], ["late"])
+        self.assertEqual(self.messages(), ["before the tick"])
+
+    def test_catch_up_skips_late(self) -> None:
+        """Test that the reminders late beyond the grace period are skipped and removed, with the skip policy."""
+        self.models.env.misfire_policy = enums.MisfirePolicy.skip
+        self.set_tick(self.now - timedelta(minutes=40))
+        self.add(self.now - timedelta(minutes=30), "late")
+        self.add(self.now - timedelta(minutes=1), "within grace")
+        self.assertEqual([r["message"] for r in alerts.due_reminders(self.now)], ["within grace"])
+        self.assertEqual(self.messages(), [])
+
+    def test_missed_beyond_catch_up_fires_late(self) -> None:
+        """Test that the reminders missed by more than the catch-up duration are fired late, with the fire policy."""
+        self.set_tick(self.now - timedelta(days=3))
+        self.add(self.now - timedelta(days=2), "two days late")
+        self.add(self.now - timedelta(hours=2), "within catch-up")
+        self.assertEqual([r["message"] for r in alerts.due_reminders(self.now)], ["two days late", "within catch-up"])
+        self.assertEqual(self.messages(), [])
+
+    def test_missed_beyond_catch_up_skipped(self) -> None:
+        """Test that the reminders missed by more than the catch-up duration are removed, with the skip policy."""
+        self.models.env.misfire_policy = enums.MisfirePolicy.skip
+        self.add(self.now - timedelta(days=2), "two days late")
+        self.add(self.now + timedelta(minutes=5), "upcoming")
+        self.assertEqual(alerts.due_reminders(self.now), [])
+        self.assertEqual(self.messages(), ["upcoming"])
+
+    def test_tick_is_read_from_the_base_db(self) -> None:
+        """Test that a tick stored by another process is honored, instead of a tick from an earlier call."""
+        alerts.due_reminders(self.now - timedelta(minutes=40))
+        self.add(self.now - timedelta(minutes=30), "fired by the other process")
+        self.set_tick(self.now - timedelta(minutes=10))
+        self.assertEqual(alerts.due_reminders(self.now), [])
+        self.assertEqual(self.messages(), ["fired by the other process"])
+
+    def test_tick_is_not_advanced_on_failure(self) -> None:
+        """Test that the tick and the reminders are retained, when the transaction fails."""
+        self.set_tick(self.now - timedelta(minutes=5))
+        self.add(self.now - timedelta(minutes=2), "retried")
+        with patch.object(alerts.writer, "write", side_effect=sqlite3.OperationalError("database is locked")):
+            with self.assertRaises(sqlite3.OperationalError):
+                alerts.due_reminders(self.now)
+        self.assertEqual(self.stored_tick(), self.now - timedelta(minutes=5))
+        self.assertEqual([r["message"] for r in alerts.due_reminders(self.now)], ["retried"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from jarvis.api.background_task import cron
+from tests.helper_test import MemoryDB, inline_pool
+
+
+def cron_job(statement: str) -> MagicMock:
+    """Creates a cron job with the given statement.
+
+    Args:
+        statement: Cron statement to be executed.
+
+    Returns:
+        MagicMock:
+        Returns an object that behaves like a CronExpression for the runner.
+    """
+    job = MagicMock(comment=statement)
+    job.__str__.return_value = f"* * * * * {statement}"
+    return job
+
+
+class TestCronRunner(unittest.IsolatedAsyncioTestCase):
+    """TestCase object for testing the overlap policy and the concurrency limit of the cron runner.
+
+    >>> TestCronRunner
+
+    """
+
+    async def asyncSetUp(self) -> None:
+        """Creates a runner, whose executions wait until they are released."""
+        self.runner = cron.CronRunner(max_concurrency=1)
+        self.release = asyncio.Event()
+        self.executed = []
+        self.runner.execute = self.execute
+
+    async def execute(self, key: str, statement: str) -> None:
+        """Records the execution, and waits until it is released.
+
+        Args:
+            key: Cron job as a string.
+            statement: Cron statement to be executed.
+        """
+        self.executed.append(statement)
+        await self.release.wait()
+
+    async def test_overlapping_run_is_skipped(self) -> None:
+        """Test that a cron job that is due while its previous run is in progress, is skipped instead of stacked."""
+        job = cron_job("sleep 60")
+        first = asyncio.create_task(self.runner.run(job))
+        await asyncio.sleep(0)
+        await self.runner.run(job)
+        self.assertEqual(self.executed, ["sleep 60"])
+        self.release.set()
+        await first
+        self.assertEqual(self.runner.running, {})
+        await self.runner.run(job)
+        self.assertEqual(self.executed, ["sleep 60", "sleep 60"])
+
+    async def test_waits_for_a_slot(self) -> None:
+        """Test that the cron jobs beyond the concurrency limit wait for a slot, and are tracked as running."""
+        first = asyncio.create_task(self.runner.run(cron_job("first")))
+        second = asyncio.create_task(self.runner.run(cron_job("second")))
+        await asyncio.sleep(0)
+        self.assertEqual(self.executed, ["first"])
+        self.assertEqual(self.runner.running, {"* * * * * first": 0, "* * * * * second": 0})
+        self.release.set()
+        await asyncio.gather(first, second)
+        self.assertEqual(self.executed, ["first", "second"])
+        self.assertEqual(self.runner.running, {})
+
+
+class TestCronExecute(unittest.IsolatedAsyncioTestCase):
+    """TestCase object for testing the subprocess execution and the recorded run of a cron job.
+
+    >>> TestCronExecute
+
+    """
+
+    async def asyncSetUp(self) -> None:
+        """Patches the log file, the resource tracker, the database pool and the history."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.directory.name, "cron.log")
+        self.record = MagicMock()
+        self.patches = [
+            patch.object(cron.crontab, "LOG_FILE", self.log_file),
+            patch.object(cron.resource_tracker, "register", MagicMock()),
+            patch.dict(cron.offload.pools, {"database": inline_pool()}),
+            patch.object(cron, "record", self.record),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    async def asyncTearDown(self) -> None:
+        """Stops the patches, and removes the temporary log file."""
+        for patcher in self.patches:
+            patcher.stop()
+        self.directory.cleanup()
+
+    async def test_records_output_and_exit_code(self) -> None:
+        """Test that the output is appended to the log file, and the run is recorded with its exit code and size."""
+        await cron.CronRunner(max_concurrency=1).execute("key", "echo hello && exit 3")
+        with open(self.log_file, "rb") as file:
+            self.assertEqual(file.read(), b"\nhello\n")
+        key, started_at, ended_at, exit_code, output_bytes = self.record.call_args.args
+        self.assertEqual(key, "key")
+        self.assertLessEqual(started_at, ended_at)
+        self.assertEqual(exit_code, 3)
+        self.assertEqual(output_bytes, len(b"hello\n"))
+
+
+class TestCronHistory(unittest.TestCase):
+    """TestCase object for testing the pruning of the run history.
+
+    >>> TestCronHistory
+
+    """
+
+    def setUp(self) -> None:
+        """Creates the table in an in-memory database, and patches the base DB and the writer to use it."""
+        self.db = MemoryDB("CREATE TABLE cron_runs (job, started_at, ended_at, exit_code, output_bytes)")
+        self.models = MagicMock()
+        self.models.db.connection = self.db.connection
+        self.patches = [
+            patch.object(cron, "models", self.models),
+            patch.object(cron.writer, "write", self.db.write),
+            patch.object(cron, "HISTORY_SIZE", 3),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        """Stops the patches and closes the in-memory database."""
+        for patcher in self.patches:
+            patcher.stop()
+        self.db.close()
+
+    def test_history_is_pruned(self) -> None:
+        """Test that only the latest runs within the history size are retained, across all the cron jobs."""
+        for started_at in range(5):
+            cron.record(f"job{started_at % 2}", started_at, started_at + 1, 0, 0)
+        self.assertEqual([run[1] for run in cron.history()], [4, 3, 2])
+        self.assertEqual([run[1] for run in cron.history(job="job0")], [4, 2])
+        self.assertEqual([run[1] for run in cron.history(limit=1)], [4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import sqlite3
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from jarvis.executors import delayed_tasks
+
+
+class StopLoop(Exception):
+    """Raised by the mocked control plane, to break out of the scheduler's forever loop."""
+
+
+class TestDelayedTasks(unittest.TestCase):
+    """TestCase object for testing the claim and reload of the delayed tasks' scheduler.
+
+    >>> TestDelayedTasks
+
+    """
+
+    def setUp(self) -> None:
+        """Creates a scheduler and an in-memory table for the delayed tasks."""
+        self.scheduler = delayed_tasks.Scheduler()
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE delayed (command, due)")
+
+    def tearDown(self) -> None:
+        """Closes the in-memory database."""
+        self.connection.close()
+
+    def insert(self, command: str, due: float) -> int:
+        """Inserts a delayed task in the in-memory table.
+
+        Args:
+            command: Command to be executed.
+            due: Due time as epoch.
+
+        Returns:
+            int:
+            Returns the ID of the delayed task.
+        """
+        return self.connection.execute("INSERT INTO delayed (command, due) VALUES (?,?);", (command, due)).lastrowid
+
+    def pending(self) -> list:
+        """Reads the delayed tasks from the in-memory table, like ``delayed_tasks.pending``."""
+        return self.connection.execute("SELECT rowid, command, due FROM delayed ORDER BY due;").fetchall()
+
+    def claim(self, task_id: int) -> bool:
+        """Deletes the delayed task from the in-memory table, like ``delayed_tasks.claim``."""
+        return bool(self.connection.execute("DELETE FROM delayed WHERE rowid=?;", (task_id,)).rowcount)
+
+    @patch("jarvis.executors.delayed_tasks.threading.Thread")
+    def test_dispatch_claims_due_tasks(self, mock_thread: MagicMock) -> None:
+        """Test that only the due tasks are claimed and executed, in the order of the due time.
+
+        Args:
+            mock_thread: Mock object for the thread that executes the command.
+        """
+        now = time.time()
+        self.insert("second", now - 1)
+        self.insert("first", now - 5)
+        self.insert("later", now + 30)
+        with patch.object(delayed_tasks, "pending", self.pending), patch.object(delayed_tasks, "claim", self.claim):
+            self.scheduler.load()
+            timeout = self.scheduler.dispatch()
+        commands = [call.kwargs["args"][0] for call in mock_thread.call_args_list]
+        self.assertEqual(commands, ["first", "second"])
+        self.assertEqual([command for _, command, _ in self.pending()], ["later"])
+        self.assertTrue(0 < timeout <= 30)
+
+    @patch("jarvis.executors.delayed_tasks.threading.Thread")
+    def test_dispatch_skips_cancelled_tasks(self, mock_thread: MagicMock) -> None:
+        """Test that a task cancelled after the heap was loaded, is not executed.
+
+        Args:
+            mock_thread: Mock object for the thread that executes the command.
+        """
+        task_id = self.insert("cancelled", time.time() - 1)
+        with patch.object(delayed_tasks, "pending", self.pending), patch.object(delayed_tasks, "claim", self.claim):
+            self.scheduler.load()
+            self.claim(task_id)
+            timeout = self.scheduler.dispatch()
+        mock_thread.assert_not_called()
+        self.assertEqual(timeout, delayed_tasks.RECONCILE_INTERVAL)
+
+    @patch("jarvis.executors.delayed_tasks.threading.Thread")
+    @patch("jarvis.executors.delayed_tasks.control_plane")
+    def test_run_survives_database_errors(self, mock_control_plane: MagicMock, mock_thread: MagicMock) -> None:
+        """Test that the loop keeps running, when loading or claiming fails, and reloads the tasks afterward.
+
+        Args:
+            mock_control_plane: Mock object for the control plane.
+            mock_thread: Mock object for the thread that executes the command.
+        """
+        self.insert("command", time.time() - 1)
+        mock_control_plane.scheduled.wait.side_effect = [None, None, StopLoop]
+        locked = sqlite3.OperationalError("database is locked")
+        mock_pending = MagicMock(side_effect=[locked, self.pending(), self.pending()])
+        mock_claim = MagicMock(side_effect=[locked, True])
+        with patch.object(delayed_tasks, "pending", mock_pending), patch.object(delayed_tasks, "claim", mock_claim):
+            with self.assertRaises(StopLoop):
+                self.scheduler.run()
+        timeouts = [call.kwargs["timeout"] for call in mock_control_plane.scheduled.wait.call_args_list]
+        self.assertEqual(timeouts[:2], [delayed_tasks.RETRY_INTERVAL, delayed_tasks.RETRY_INTERVAL])
+        self.assertEqual(mock_claim.call_count, 2)
+        mock_thread.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock
+
+from jarvis.modules.database import writer
+
+
+class MemoryDB:
+    """In-memory database that stands in for the base DB, and applies the writes like the base DB writer.
+
+    >>> MemoryDB
+
+    """
+
+    def __init__(self, *schemas: str):
+        """Creates the tables in an in-memory database.
+
+        Args:
+            *schemas: Statements to create the tables.
+        """
+        self.connection = sqlite3.connect(":memory:")
+        for schema in schemas:
+            self.connection.execute(schema)
+
+    def write(self, *statements: writer.Statement | tuple) -> writer.Result:
+        """Executes the statements within a single transaction, like the base DB writer.
+
+        Args:
+            *statements: Statements, or tuples of query and parameters.
+
+        Returns:
+            Result:
+            Returns the row ID of the last insert, and the total number of rows modified.
+        """
+        with self.connection:
+            return writer.apply(
+                self.connection.cursor(), tuple(writer.Statement(*statement) for statement in statements)
+            )
+
+    def close(self) -> None:
+        """Closes the in-memory database."""
+        self.connection.close()
+
+
+def inline_pool() -> MagicMock:
+    """Creates a pool that runs the functions in place, instead of in a worker thread.
+
+    Returns:
+        MagicMock:
+        Returns an object that behaves like ``offload.Pool`` for the callers.
+    """
+    pool = MagicMock()
+    pool.run = AsyncMock(side_effect=lambda func, *args, **kwargs: func(*args, **kwargs))
+    return pool
@@ -0,0 +1,114 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from jarvis.api.background_task import leader
+from tests.helper_test import MemoryDB, inline_pool
+
+
+class TestLeaderElection(unittest.IsolatedAsyncioTestCase):
+    """TestCase object for testing the acquisition, renewal, expiry and release of the lease.
+
+    >>> TestLeaderElection
+
+    """
+
+    async def asyncSetUp(self) -> None:
+        """Creates the table in an in-memory database, and patches the writer, the clock and the lease pool."""
+        self.db = MemoryDB("CREATE TABLE leader (name, holder, expires_at, PRIMARY KEY (name))")
+        self.now = 1_000.0
+        self.patches = [
+            patch.object(leader.writer, "write", self.db.write),
+            patch.object(leader.time, "time", lambda: self.now),
+            patch.dict(leader.offload.pools, {"lease": inline_pool()}),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        self.first = leader.LeaderElection(name="test", lease_duration=10, heartbeat_interval=3)
+        self.second = leader.LeaderElection(name="test", lease_duration=10, heartbeat_interval=3)
+
+    async def asyncTearDown(self) -> None:
+        """Stops the patches and closes the in-memory database."""
+        for patcher in self.patches:
+            patcher.stop()
+        self.db.close()
+
+    def holder(self) -> tuple | None:
+        """Get the holder and the expiry of the lease."""
+        return self.db.connection.execute("SELECT holder, expires_at FROM leader WHERE name='test';").fetchone()
+
+    def test_single_holder(self) -> None:
+        """Test that only one of the contenders holds the lease, and the holder can renew it."""
+        self.assertTrue(self.first.acquire())
+        self.assertFalse(self.second.acquire())
+        self.now += 5
+        self.assertTrue(self.first.acquire())
+        self.assertEqual(self.holder(), (self.first.holder, self.now + 10))
+        self.assertFalse(self.second.acquire())
+
+    def test_takeover_after_expiry(self) -> None:
+        """Test that another contender takes over the lease once it has expired without a renewal."""
+        self.assertTrue(self.first.acquire())
+        self.now += 10
+        self.assertFalse(self.second.acquire())
+        self.now += 1
+        self.assertTrue(self.second.acquire())
+        self.assertFalse(self.first.acquire())
+        self.assertEqual(self.holder()[0], self.second.holder)
+
+    def test_release(self) -> None:
+        """Test that only the holder can release the lease, after which another contender can acquire it."""
+        self.assertTrue(self.first.acquire())
+        self.second.release()
+        self.assertEqual(self.holder()[0], self.first.holder)
+        self.first.release()
+        self.assertIsNone(self.holder())
+        self.assertTrue(self.second.acquire())
+
+    async def test_steps_down_when_lease_is_lost(self) -> None:
+        """Test that the coroutine is cancelled when the lease is lost, and the lease is not released for the taker."""
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def coroutine() -> None:
+            """Runs until it is cancelled."""
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        self.first.heartbeat_interval = 0.01
+        election = asyncio.create_task(self.first.run(coroutine))
+        await asyncio.wait_for(started.wait(), timeout=1)
+        self.assertTrue(self.first.leading)
+        # Lease is taken over as if the heartbeat had stalled beyond the lease duration
+        self.now += 11
+        self.assertTrue(self.second.acquire())
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        self.assertFalse(self.first.leading)
+        election.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await election
+        self.assertEqual(self.holder()[0], self.second.holder)
+
+    async def test_releases_when_cancelled(self) -> None:
+        """Test that the leader releases the lease when it is cancelled, so that another worker can take over."""
+        started = asyncio.Event()
+
+        async def coroutine() -> None:
+            """Runs until it is cancelled."""
+            started.set()
+            await asyncio.Event().wait()
+
+        election = asyncio.create_task(self.first.run(coroutine))
+        await asyncio.wait_for(started.wait(), timeout=1)
+        election.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await election
+        self.assertIsNone(self.holder())
+        self.assertTrue(self.second.acquire())
+
+
+if __name__ == "__main__":
+    unittest.main()
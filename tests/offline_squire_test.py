@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import unittest
+from http import HTTPStatus
+
+from jarvis.api.squire.offline_squire import CommandPool
+from jarvis.modules.exceptions import APIResponse
+
+
+class TestCommandPool(unittest.IsolatedAsyncioTestCase):
+    """TestCase object for testing the limits of the offline command pool.
+
+    >>> TestCommandPool
+
+    """
+
+    def setUp(self) -> None:
+        """Creates an event to hold the commands in the worker threads."""
+        self.release = threading.Event()
+
+    def tearDown(self) -> None:
+        """Releases the commands that are still held."""
+        self.release.set()
+
+    def blocking(self) -> str:
+        """Command that holds its worker until it is released."""
+        self.release.wait(timeout=5)
+        return "done"
+
+    async def wait_running(self, pool: CommandPool) -> None:
+        """Waits until a command has started in a worker thread.
+
+        Args:
+            pool: Pool to wait on.
+        """
+        while not pool.running:
+            await asyncio.sleep(0.01)
+
+    async def test_rejects_when_full(self) -> None:
+        """Test that a command is rejected with 429, when the workers are busy and the queue is full."""
+        pool = CommandPool(workers=1, queue_size=0, timeout=5)
+        first = asyncio.create_task(pool.run(self.blocking))
+        await self.wait_running(pool)
+        with self.assertRaises(APIResponse) as context:
+            await pool.run(self.blocking)
+        self.assertEqual(context.exception.status_code, HTTPStatus.TOO_MANY_REQUESTS.real)
+        self.assertIn("Retry-After", context.exception.headers)
+        self.assertEqual(pool.status()["rejected"], 1)
+        self.release.set()
+        self.assertEqual(await first, "done")
+        # Slot is released once the command completes
+        self.assertEqual(await pool.run(str, "next"), "next")
+        pool.shutdown()
+
+    async def test_rejects_when_shutting_down(self) -> None:
+        """Test that a command is rejected with 503, after the pool has been shut down."""
+        pool = CommandPool(workers=1, queue_size=1, timeout=5)
+        pool.shutdown()
+        with self.assertRaises(APIResponse) as context:
+            await pool.run(self.blocking)
+        self.assertEqual(context.exception.status_code, HTTPStatus.SERVICE_UNAVAILABLE.real)
+
+    async def test_times_out(self) -> None:
+        """Test that a command exceeding the timeout gets a 504, and keeps its slot until it finishes."""
+        pool = CommandPool(workers=1, queue_size=0, timeout=0.1)
+        with self.assertRaises(APIResponse) as context:
+            await pool.run(self.blocking)
+        self.assertEqual(context.exception.status_code, HTTPStatus.GATEWAY_TIMEOUT.real)
+        self.assertIn("continue in the background", context.exception.detail)
+        self.assertEqual(pool.status()["timed_out"], 1)
+        with self.assertRaises(APIResponse) as context:
+            await pool.run(self.blocking)
+        self.assertEqual(context.exception.status_code, HTTPStatus.TOO_MANY_REQUESTS.real)
+        self.release.set()
+        while pool.running:
+            await asyncio.sleep(0.01)
+        self.assertEqual(await pool.run(str, "next"), "next")
+        pool.shutdown()
+
+    async def test_cancels_queued_on_timeout(self) -> None:
+        """Test that a queued command is cancelled when it times out, and its slot is released."""
+        pool = CommandPool(workers=1, queue_size=1, timeout=0.2)
+        first = asyncio.create_task(pool.run(self.blocking))
+        await self.wait_running(pool)
+        with self.assertRaises(APIResponse) as context:
+            await pool.run(self.blocking)
+        self.assertEqual(context.exception.status_code, HTTPStatus.GATEWAY_TIMEOUT.real)
+        self.assertIn("before it could be started", context.exception.detail)
+        self.assertEqual(pool.status()["queued"], 0)
+        with self.assertRaises(APIResponse):
+            await first
+        self.release.set()
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import asyncio
+import time
+import unittest
+
+from jarvis.api.background_task.scheduler import Job, Scheduler, every
+
+
+class TestScheduler(unittest.TestCase):
+    """TestCase object for testing the ordering and the replacement of the jobs in the heap scheduler.
+
+    >>> TestScheduler
+
+    """
+
+    def setUp(self) -> None:
+        """Creates a scheduler and a list to record the executions."""
+        self.scheduler = Scheduler()
+        self.executed = []
+
+    def job(self, name: str, seconds: int | float = 60, label: str = None) -> Job:
+        """Creates a job that records its execution.
+
+        Args:
+            name: Name of the job.
+            seconds: Interval of the job in seconds.
+            label: Label to record, defaults to the name of the job.
+
+        Returns:
+            Job:
+            Returns the job object.
+        """
+        return Job(name=name, action=lambda: self.executed.append(label or name), trigger=every(seconds))
+
+    def test_executes_in_order_of_due_time(self) -> None:
+        """Test that the jobs that are due are executed in the order of their due time, and the rest are not."""
+        now = time.time()
+        self.scheduler.add(self.job("third"), due=now - 1)
+        self.scheduler.add(self.job("first"), due=now - 3)
+        self.scheduler.add(self.job("later"), due=now + 60)
+        self.scheduler.add(self.job("second"), due=now - 2)
+        self.scheduler.run_pending()
+        self.assertEqual(self.executed, ["first", "second", "third"])
+        self.assertAlmostEqual(self.scheduler.timeout(), 57, delta=1)
+
+    def test_replaced_job_runs_once(self) -> None:
+        """Test that a replaced job runs only with its new action, and its stale heap entry is skipped."""
+        now = time.time()
+        self.scheduler.add(self.job("job", label="old"), due=now - 2)
+        self.scheduler.add(self.job("job", label="new"), due=now - 1)
+        self.scheduler.run_pending()
+        self.assertEqual(self.executed, ["new"])
+
+    def test_removed_jobs_are_skipped(self) -> None:
+        """Test that the jobs removed by prefix are not executed, and leave no deadline behind."""
+        now = time.time()
+        self.scheduler.add(self.job("task:a"), due=now - 1)
+        self.scheduler.add(self.job("task:b"), due=now + 10)
+        self.scheduler.add(self.job("cron:a"), due=now - 1)
+        self.scheduler.remove(prefix="task:")
+        self.scheduler.run_pending()
+        self.assertEqual(self.executed, ["cron:a"])
+        self.assertEqual(list(self.scheduler.jobs), ["cron:a"])
+        self.scheduler.remove(prefix="")
+        self.assertIsNone(self.scheduler.timeout())
+
+    def test_missed_executions_are_skipped(self) -> None:
+        """Test that a job that missed several executions runs once, and is rescheduled from the current time."""
+        now = time.time()
+        self.scheduler.add(self.job("job", seconds=10), due=now - 35)
+        self.scheduler.run_pending()
+        self.assertEqual(self.executed, ["job"])
+        self.assertGreater(self.scheduler.jobs["job"].due, now)
+        self.assertEqual(len(self.scheduler.heap), 1)
+
+    def test_trigger_can_stop_the_job(self) -> None:
+        """Test that a job is removed when its trigger does not return a due time."""
+        once = Job(name="once", action=lambda: self.executed.append("once"), trigger=lambda _: None)
+        self.scheduler.add(once, due=time.time())
+        self.scheduler.run_pending()
+        self.assertEqual(self.executed, ["once"])
+        self.assertNotIn("once", self.scheduler.jobs)
+
+    def test_sync_retains_due_times(self) -> None:
+        """Test that syncing keeps the due time of the existing jobs, and removes the jobs that are not present."""
+        due = time.time() + 30
+        self.scheduler.add(self.job("task:kept"), due=due)
+        self.scheduler.add(self.job("task:removed"), due=due)
+        self.scheduler.sync(prefix="task:", jobs=[self.job("task:kept", label="updated"), self.job("task:new")])
+        self.assertEqual(sorted(self.scheduler.jobs), ["task:kept", "task:new"])
+        self.assertEqual(self.scheduler.jobs["task:kept"].due, due)
+        self.scheduler.jobs["task:kept"].action()
+        self.assertEqual(self.executed, ["updated"])
+
+    def test_add_wakes_up_the_loop(self) -> None:
+        """Test that a job added while the scheduler is sleeping, is executed without waiting for the next deadline."""
+
+        async def scenario() -> None:
+            """Adds a job that is due now, while the scheduler is sleeping until a later deadline."""
+            self.scheduler.add(self.job("later"), due=time.time() + 60)
+            task = asyncio.create_task(self.scheduler.run())
+            await asyncio.sleep(0.05)
+            self.scheduler.add(self.job("now"), due=time.time())
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+        asyncio.run(scenario())
+        self.assertEqual(self.executed, ["now"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+import contextvars
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -79,11 +81,24 @@ class TestSpeak(unittest.TestCase):
             mock_playsound: Mock object for playsound module.
             mock_speech_synthesizer: Mock object for speaker.speech_synthesizer function.
         """
-        shared.called_by_offline = True
+        shared.context().called_by_offline = True
         speaker.speak(text=SAMPLE_PHRASE)
         mock_speech_synthesizer.assert_not_called()
         mock_playsound.assert_not_called()
-        shared.called_by_offline = False
+        shared.context().called_by_offline = False
+
+    def test_offline_responses(self) -> None:
+        """Test that every response spoken for an offline request is collected, including the ones from threads."""
+        context = shared.RequestContext(called_by_offline=True)
+        token = shared.request_context.set(context)
+        try:
+            speaker.speak(text="first")
+            thread = threading.Thread(target=contextvars.copy_context().run, args=(speaker.speak, "second"))
+            thread.start()
+            thread.join()
+        finally:
+            shared.request_context.reset(token)
+        self.assertEqual(context.responses, ["first", "second"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+import sqlite3
+import unittest
+from unittest.mock import MagicMock, patch
+
+from jarvis.modules.utils import usage
+from tests.helper_test import MemoryDB
+
+
+class TestUsage(unittest.TestCase):
+    """TestCase object for testing the flush and the read of the usage counters.
+
+    >>> TestUsage
+
+    """
+
+    def setUp(self) -> None:
+        """Creates the table in an in-memory database, and patches the base DB, the writer and the counter."""
+        self.db = MemoryDB("CREATE TABLE usage (function, count, PRIMARY KEY (function))")
+        self.models = MagicMock()
+        self.models.db.connection = self.db.connection
+        # Interval is long enough that the flusher thread never runs during the test
+        self.counter = usage.UsageCounter(interval=3_600)
+        self.patches = [
+            patch.object(usage, "models", self.models),
+            patch.object(usage.writer, "write", self.db.write),
+            patch.object(usage, "counter", self.counter),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        """Discards the pending deltas, stops the patches and closes the in-memory database."""
+        # Counter is flushed at exit, which should not write to the base DB
+        self.counter.deltas.clear()
+        for patcher in self.patches:
+            patcher.stop()
+        self.db.close()
+
+    def stored(self) -> dict:
+        """Get the counts stored in the in-memory database."""
+        return dict(self.db.connection.execute("SELECT function, count FROM usage;").fetchall())
+
+    def test_counts_include_pending_deltas(self) -> None:
+        """Test that the counts merge the stored rows with the deltas that are yet to be flushed."""
+        for name in ("weather", "weather", "time"):
+            self.counter.increment(function_name=name)
+        self.counter.flush()
+        self.assertEqual(self.stored(), {"weather": 2, "time": 1})
+        self.counter.increment(function_name="time")
+        self.counter.increment(function_name="time")
+        self.counter.increment(function_name="lights")
+        self.assertEqual(usage.counts(), {"time": 3, "weather": 2, "lights": 1})
+        self.assertEqual(self.stored(), {"weather": 2, "time": 1})
+
+    def test_failed_flush_retains_deltas(self) -> None:
+        """Test that the deltas are retained when the flush fails, and are added on the next flush."""
+        self.counter.increment(function_name="weather")
+        with patch.object(usage.writer, "write", side_effect=sqlite3.OperationalError("database is locked")):
+            self.counter.flush()
+        self.assertEqual(self.stored(), {})
+        self.counter.increment(function_name="weather")
+        self.counter.flush()
+        self.assertEqual(self.stored(), {"weather": 2})
+        self.assertEqual(usage.counts(), {"weather": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
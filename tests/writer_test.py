@@ -0,0 +1,105 @@
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from jarvis.modules.database import database, writer
+
+
+class TestWriter(unittest.TestCase):
+    """TestCase object for testing the savepoints and the fallback of the base DB writer.
+
+    >>> TestWriter
+
+    """
+
+    def setUp(self) -> None:
+        """Creates a database in a temporary directory, and patches the base DB to use it."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = database.Database(database=os.path.join(self.directory.name, "test"))
+        with self.db.connection as connection:
+            connection.execute("CREATE TABLE items (name UNIQUE)")
+        self.models = MagicMock()
+        self.models.db = self.db
+        self.patcher = patch.object(writer, "models", self.models)
+        self.patcher.start()
+        self.writer = writer.Writer(max_batch=writer.MAX_BATCH)
+
+    def tearDown(self) -> None:
+        """Stops the patch, and removes the temporary database."""
+        self.patcher.stop()
+        self.db.close()
+        self.directory.cleanup()
+
+    def names(self) -> list:
+        """Get the names stored in the database."""
+        with self.db.connection as connection:
+            return [row[0] for row in connection.execute("SELECT name FROM items ORDER BY rowid;").fetchall()]
+
+    def insert(self, *names: str) -> tuple:
+        """Get the statements to insert the names.
+
+        Args:
+            *names: Names to be inserted.
+
+        Returns:
+            tuple:
+            Returns a tuple of statements.
+        """
+        return tuple(writer.Statement("INSERT INTO items (name) VALUES (?);", (name,)) for name in names)
+
+    def test_savepoint_per_request(self) -> None:
+        """Test that a failing request in a batch is rolled back, without affecting the rest of the batch."""
+        requests = [
+            writer.Request(self.insert("first")),
+            writer.Request(self.insert("second", "first")),
+            writer.Request(self.insert("third")),
+        ]
+        # Queued before the writer thread starts, so that all the requests are committed in a single batch
+        for request in requests:
+            self.writer.queue.put(request)
+        threading.Thread(target=self.writer.writer, daemon=True).start()
+        for request in requests:
+            self.assertTrue(request.done.wait(timeout=5))
+        self.assertIsNone(requests[0].error)
+        self.assertIsInstance(requests[1].error, sqlite3.IntegrityError)
+        self.assertIsNone(requests[1].result)
+        self.assertEqual(requests[2].result.rowcount, 1)
+        self.assertEqual(self.names(), ["first", "third"])
+
+    def test_write_through_the_writer_thread(self) -> None:
+        """Test that the writes from the main process are committed by the writer thread, and errors are raised."""
+        self.writer.pid = os.getpid()
+        threading.Thread(target=self.writer.writer, daemon=True).start()
+        result = self.writer.write(*self.insert("first", "second"))
+        self.assertEqual(result.rowcount, 2)
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.writer.write(*self.insert("third", "first"))
+        self.assertEqual(self.names(), ["first", "second"])
+
+    @patch.dict(os.environ, clear=True)
+    def test_fallback_without_writer(self) -> None:
+        """Test that the writes go directly to the base DB, when the writer is not served."""
+        result = self.writer.write(*self.insert("first"), ("INSERT INTO items (name) VALUES (?);", ("second",)))
+        self.assertEqual(result.rowcount, 2)
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.writer.write(*self.insert("third", "first"))
+        self.assertEqual(self.names(), ["first", "second"])
+
+    def test_fallback_when_writer_is_unreachable(self) -> None:
+        """Test that the writes go directly to the base DB, when the writer's port is not reachable."""
+        # Bound without listening, so that the port is reserved but refuses connections
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as reserved:
+            reserved.bind((writer.HOST, 0))
+            env = {writer.ENV_PORT: str(reserved.getsockname()[1]), writer.ENV_AUTHKEY: os.urandom(16).hex()}
+            with patch.dict(os.environ, env):
+                self.writer.write(*self.insert("first"))
+        self.assertIsNone(self.writer.client)
+        self.assertEqual(self.names(), ["first"])
+
+
+if __name__ == "__main__":
+    unittest.main()